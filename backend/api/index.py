@@ -1,18 +1,92 @@
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Header, HTTPException, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse, PlainTextResponse, FileResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.staticfiles import StaticFiles
+from fastapi.concurrency import run_in_threadpool
 import os
+import json
+import time
 from datetime import datetime
-from typing import List, Dict
-
-from scraper import get_latest_links
-from db import init_db, reset_database, save_new_links, get_all_links, get_latest_links as get_stored_links, get_article_summaries, get_article_summary, save_article_summary, get_paginated_links, get_total_article_count, migrate_published_dates
-from summarizer import summarize_top_articles
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+from contextlib import asynccontextmanager
+
+# scraper(BeautifulSoup/requests), summarizer(OpenAI)는 첫 사용 시점에 import - 콜드 스타트 단축
+from db import init_db, get_article_summary, get_article_summary_json, save_article_summary, migrate_published_dates
+from db import get_jobs, get_job, get_job_counts, retry_job, get_article, get_articles
+import jobqueue
+import leader
+import metrics
+import snapshots
+
+_initialized = False
+_maintenance_pending = False
+
+def _start_background_work():
+    """Run on the leader process only: env maintenance, queue workers, scheduled crawls."""
+    global _maintenance_pending
+    # RESET_DATABASE / RUN_BULK_IMPORT 환경변수는 기존 배포 호환용 - 평소에는 manage.py 사용
+    # 시작 직후 리더가 된 프로세스만 실행 (나중에 lease를 이어받은 프로세스는 다시 실행하지 않음)
+    if _maintenance_pending:
+        _maintenance_pending = False
+        from manage import run_env_maintenance
+        run_env_maintenance()
+
+    # 요약 작업 큐 워커 시작 (SUMMARY_WORKERS=0 이면 비활성화)
+    jobqueue.start_workers()
+
+    # 정적 스냅샷 재생성 루프 (배포 직후에도 최신이도록 시작할 때 한 번 생성)
+    snapshots.start()
+
+    # 소스별 주기 크롤링 (CRAWL_SCHEDULER=true 일 때만)
+    import crawler
+    crawler.start_scheduler()
+
+    # 저장된 기사 변경 감지 재크롤링 (RECRAWL_ENABLED=true 일 때만)
+    import recrawl
+    recrawl.start()
+
+    # 관련 기사 임베딩 주기 동기화 (/related 요청 경로에서는 계산하지 않음)
+    import embeddings
+    embeddings.start_sync()
+
+def _stop_background_work():
+    import crawler
+    import embeddings
+    import recrawl
+    embeddings.stop_sync()
+    snapshots.stop()
+    recrawl.stop()
+    crawler.stop_scheduler()
+    jobqueue.stop_workers()
+
+def startup():
+    """Idempotent process initialization: create tables, then join the leader election for background work."""
+    global _initialized, _maintenance_pending
+    if _initialized:
+        return
+    _initialized = True
+
+    init_db()
+
+    # 모든 워커가 읽기 요청을 처리하고, 백그라운드 작업은 리더 하나만 실행
+    _maintenance_pending = os.getenv("RESET_DATABASE") == "true" or os.getenv("RUN_BULK_IMPORT") == "true"
+    leader.start(_start_background_work, _stop_background_work)
+    _maintenance_pending = False
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    startup()
+    yield
+    leader.stop()
 
 app = FastAPI(
     title="다니엘기도회 뉴스 API",
     description="Christian Today 다니엘기도회 뉴스 자동 감지 및 저장 API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS 설정 - 프론트엔드에서 API 호출 가능하도록
@@ -24,74 +98,93 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize database on startup
-init_db()
+# 요청 단위 프로파일링 - ENABLE_PROFILING=true 일 때만 등록 (꺼져 있으면 비용 없음)
+import profiling
+if profiling.ENABLED:
+    app.add_middleware(profiling.ProfilingMiddleware)
+
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    """라우트별 응답 시간 기록 (경로 파라미터 대신 라우트 템플릿을 라벨로 사용)"""
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        metrics.HTTP_REQUEST_DURATION.observe(
+            time.perf_counter() - start,
+            method=request.method,
+            route=route.path if route is not None else "unmatched",
+            status=status
+        )
 
-# 환경변수로 제어되는 데이터베이스 리셋 (우선순위 1)
-if os.getenv("RESET_DATABASE") == "true":
-    print("🔄 환경변수 RESET_DATABASE=true 감지!")
-    print("데이터베이스 완전 리셋 시작...")
+@app.get("/check")
+async def check_new_articles(source: str = None):
+    """새로운 기사를 수동으로 확인하고 저장 (source 미지정 시 활성 소스 전체를 동시에)"""
     try:
-        reset_database()
-        print("✅ 데이터베이스 리셋 완료!")
+        import crawler
+        from sources import get_source, get_sources
 
-        # 리셋 후 bulk import 확인 (우선순위 2)
-        if os.getenv("RUN_BULK_IMPORT") == "true":
-            print("🏗️ 환경변수 RUN_BULK_IMPORT=true 감지!")
-            print("리셋 후 1회성 bulk import 시작...")
+        if source:
             try:
-                from bulk_import import import_page2_articles
-                count = import_page2_articles()
-                print(f"✅ {count}개 과거 기사 추가 완료!")
-            except Exception as e:
-                print(f"❌ Bulk import 실패: {e}")
+                targets = [get_source(source)]
+            except KeyError:
+                raise HTTPException(status_code=404, detail=f"알 수 없는 소스입니다: {source}")
         else:
-            print("ℹ️ RUN_BULK_IMPORT 환경변수가 설정되지 않아 bulk import 생략")
+            targets = get_sources()
 
-    except Exception as e:
-        print(f"❌ 데이터베이스 리셋 실패: {e}")
-
-# 리셋 없이 bulk import만 실행하는 경우 (기존 데이터 유지)
-elif os.getenv("RUN_BULK_IMPORT") == "true":
-    print("🏗️ 환경변수 RUN_BULK_IMPORT=true 감지!")
-    print("1회성 bulk import 시작...")
-    try:
-        from bulk_import import import_page2_articles
-        count = import_page2_articles()
-        print(f"✅ {count}개 과거 기사 추가 완료!")
-    except Exception as e:
-        print(f"❌ Bulk import 실패: {e}")
-else:
-    print("ℹ️ 환경변수가 설정되지 않아 초기화 작업 생략")
+        # 소스별로 피드(있으면) 또는 HTML 목록을 크롤링 - 새 기사마다 요약 작업이 큐에 등록됨
+        results = await run_in_threadpool(crawler.crawl_sources, targets)
+        new_articles = [article for result in results for article in result["new_articles"]]
 
-@app.get("/check")
-async def check_new_articles():
-    """새로운 기사를 수동으로 확인하고 저장"""
-    try:
-        # 웹사이트에서 최신 기사 가져오기
-        latest_articles = get_latest_links()
-
-        if not latest_articles:
+        if not any(result["success"] for result in results):
             return JSONResponse({
                 "success": False,
                 "message": "웹사이트에서 기사를 가져올 수 없습니다.",
-                "new_articles": []
+                "new_articles": [],
+                "sources": results
             })
 
-        # 새로운 기사만 저장
-        new_articles = save_new_links(latest_articles)
-
         return JSONResponse({
             "success": True,
             "message": f"{len(new_articles)}개의 새로운 기사를 발견했습니다.",
             "new_articles": new_articles,
-            "total_found": len(latest_articles),
+            "total_found": sum(result["total_found"] for result in results),
+            "sources": results,
             "checked_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         })
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"기사 확인 중 오류 발생: {str(e)}")
 
+@app.get("/sources")
+async def list_sources():
+    """크롤링 소스 레지스트리와 소스별 기사 수, 마지막 크롤링 시각"""
+    try:
+        import crawler
+        from sources import get_sources
+        from db import get_source_counts
+
+        counts = get_source_counts()
+        last_crawled = crawler.last_crawled()
+        return JSONResponse({
+            "sources": [
+                dict(source.to_dict(),
+                     article_count=counts.get(source.name, 0),
+                     last_crawled_at=datetime.fromtimestamp(last_crawled[source.name]).strftime("%Y-%m-%d %H:%M:%S")
+                     if source.name in last_crawled else None)
+                for source in get_sources(enabled_only=False)
+            ],
+            "scheduler_enabled": crawler.SCHEDULER_ENABLED
+        })
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"소스 조회 오류: {str(e)}")
+
 @app.get("/latest")
 async def get_latest_articles(page: int = 1, per_page: int = 20):
     """최근 저장된 기사 목록을 페이지별로 JSON으로 반환"""
@@ -102,22 +195,7 @@ async def get_latest_articles(page: int = 1, per_page: int = 20):
         if per_page < 1 or per_page > 100:
             per_page = 20
 
-        # 페이징된 기사 가져오기
-        articles = get_paginated_links(page=page, per_page=per_page)
-
-        # 전체 기사 수 가져오기
-        total_articles = get_total_article_count()
-        total_pages = (total_articles + per_page - 1) // per_page  # 올림 나눗셈
-
-        return JSONResponse({
-            "articles": articles,
-            "pagination": {
-                "current_page": page,
-                "per_page": per_page,
-                "total_articles": total_articles,
-                "total_pages": total_pages
-            }
-        })
+        return JSONResponse(snapshots.build_latest(page, per_page))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"데이터 조회 오류: {str(e)}")
 
@@ -125,12 +203,7 @@ async def get_latest_articles(page: int = 1, per_page: int = 20):
 async def get_stats():
     """저장된 기사 통계 정보"""
     try:
-        all_links = get_all_links(limit=1000)  # 충분히 큰 숫자로 전체 조회
-        return JSONResponse({
-            "total_articles": len(all_links),
-            "last_updated": all_links[0]["created_at"] if all_links else None,
-            "source_url": "https://www.christiantoday.co.kr/sections/pd_19"
-        })
+        return JSONResponse(snapshots.build_stats())
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"통계 조회 오류: {str(e)}")
 
@@ -138,19 +211,62 @@ async def get_stats():
 async def get_summaries(limit: int = 10):
     """요약된 기사 목록을 반환"""
     try:
-        summaries = get_article_summaries(limit=limit)
-        return JSONResponse({
-            "summaries": summaries,
-            "count": len(summaries)
-        })
+        return Response(snapshots.build_summaries_json(limit), media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"요약 데이터 조회 오류: {str(e)}")
 
+@app.get("/export")
+async def export_articles(format: str = "ndjson", since: str = None, until: str = None,
+                          summarized_only: bool = False, source: str = None):
+    """기사 + 요약 전체를 NDJSON/CSV로 스트리밍 (since/until: 작성일 YYYY-MM-DD, 포함)"""
+    import export
+    try:
+        chunks = export.stream_export(format, since, until, summarized_only, source)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    extension = "csv" if format == "csv" else "ndjson"
+    return StreamingResponse(
+        (chunk.encode("utf-8") for chunk in chunks),
+        media_type=export.FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="articles.{extension}"'}
+    )
+
+MAX_BATCH_URLS = 500
+
+class SummaryBatchRequest(BaseModel):
+    urls: List[str]
+    fields: Optional[List[str]] = None  # 생략하면 전체 필드, []이면 존재 여부만
+
+@app.post("/summaries/batch")
+async def get_summaries_batch(request: SummaryBatchRequest):
+    """여러 기사의 요약을 한 번에 조회 (예: 현재 페이지 기사들) - 필드 선택 가능"""
+    from db import SUMMARY_FIELDS, get_summaries_for_urls
+
+    if len(request.urls) > MAX_BATCH_URLS:
+        raise HTTPException(status_code=400, detail=f"한 번에 최대 {MAX_BATCH_URLS}개 URL까지 조회할 수 있습니다.")
+    unknown = [field for field in (request.fields or []) if field not in SUMMARY_FIELDS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"알 수 없는 필드: {', '.join(unknown)} (가능: {', '.join(SUMMARY_FIELDS)})")
+
+    try:
+        summaries = get_summaries_for_urls(request.urls, request.fields)
+        response = {
+            "exists": {url: url in summaries for url in request.urls},
+            "count": len(summaries)
+        }
+        if request.fields != []:
+            response["summaries"] = summaries
+        return JSONResponse(response)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"요약 일괄 조회 오류: {str(e)}")
+
 @app.post("/summarize")
 async def generate_summaries(limit: int = 3):
     """상위 N개 기사를 요약하여 저장"""
     try:
-        summaries = summarize_top_articles(limit=limit)
+        from summarizer import summarize_top_articles
+        summaries = await run_in_threadpool(summarize_top_articles, limit=limit)
         return JSONResponse({
             "success": True,
             "message": f"{len(summaries)}개의 기사 요약을 생성했습니다.",
@@ -171,52 +287,32 @@ async def summarize_single_article(article_url: str):
         decoded_url = unquote(article_url)
         print(f"DEBUG: Decoded URL: {decoded_url}")
 
-        # 기사 정보 조회
-        from db import get_all_links
-        articles = get_all_links()
-        print(f"DEBUG: Total articles in DB: {len(articles)}")
-
-        article = next((a for a in articles if a['url'] == decoded_url), None)
+        # 기사 정보 조회 (기본키 조회 + 캐시 - 오래된 기사도 찾음)
+        article = get_article(decoded_url)
         print(f"DEBUG: Found article: {article}")
 
         if not article:
             print(f"ERROR: Article not found for URL: {decoded_url}")
             raise HTTPException(status_code=404, detail="기사를 찾을 수 없습니다.")
 
-        # 이미 요약이 있는지 확인
-        existing_summary = get_article_summary(decoded_url)
-        print(f"DEBUG: Existing summary: {existing_summary is not None}")
+        print(f"DEBUG: Starting summarization for: {article['title']}")
 
-        if existing_summary:
+        # 새 요약 생성 (동시에 들어온 같은 기사 요청은 하나의 생성 결과를 공유)
+        from summarizer import summarize_and_save
+        status, summary_data = await run_in_threadpool(summarize_and_save, decoded_url, article['title'])
+        print(f"DEBUG: Summary status: {status}")
+
+        if status == "existing":
             return JSONResponse({
                 "success": False,
                 "message": "이미 요약이 존재합니다.",
-                "summary": existing_summary
+                "summary": summary_data
             })
 
-        print(f"DEBUG: Starting summarization for: {article['title']}")
-
-        # 새 요약 생성
-        from summarizer import summarize_article
-        summary_data = summarize_article(decoded_url, article['title'])
-        print(f"DEBUG: Summary data generated: {summary_data is not None}")
-
         if summary_data:
-            print(f"DEBUG: Saving summary to DB")
-
-            # DB에 저장
-            save_article_summary(
-                decoded_url,
-                summary_data['summary'],
-                summary_data['keywords'],
-                summary_data['bible_verses']
-            )
-
-            print(f"DEBUG: Summary saved successfully")
-
             return JSONResponse({
                 "success": True,
-                "message": "기사 요약을 생성했습니다.",
+                "message": "AI 요약을 사용할 수 없어 본문에서 추출한 요약을 반환합니다." if summary_data.get('source') == 'local' else "기사 요약을 생성했습니다.",
                 "summary": {
                     "article_url": decoded_url,
                     "title": article['title'],
@@ -236,6 +332,109 @@ async def summarize_single_article(article_url: str):
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"요약 생성 중 오류 발생: {str(e)}")
 
+@app.post("/summarize-stream/{article_url:path}")
+async def summarize_single_article_stream(article_url: str):
+    """특정 기사를 요약하면서 생성되는 토큰을 SSE로 전달하고, 완료되면 저장"""
+    from urllib.parse import unquote
+    decoded_url = unquote(article_url)
+
+    article = get_article(decoded_url)
+    if not article:
+        raise HTTPException(status_code=404, detail="기사를 찾을 수 없습니다.")
+
+    def sse(event: str, data: Dict) -> str:
+        return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+    def event_stream():
+        existing_summary = get_article_summary(decoded_url)
+        if existing_summary:
+            yield sse("done", {
+                "success": False,
+                "message": "이미 요약이 존재합니다.",
+                "summary": existing_summary
+            })
+            return
+
+        import singleflight
+        from summarizer import stream_summarize_article
+
+        def done_event(summary_data):
+            return sse("done", {
+                "success": True,
+                "message": "기사 요약을 생성했습니다.",
+                "summary": {
+                    "article_url": decoded_url,
+                    "title": article['title'],
+                    **summary_data
+                },
+                "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            })
+
+        def failed_event(message="요약 생성에 실패했습니다."):
+            return sse("error", {"success": False, "message": message})
+
+        # 같은 기사를 이미 생성 중이면 그 결과를 기다려서 전달
+        future, is_leader = singleflight.join(decoded_url)
+        if not is_leader:
+            try:
+                result = future.result(timeout=singleflight.WAIT_TIMEOUT_SECONDS)
+            except Exception:
+                result = None
+            yield done_event(result) if result else failed_event()
+            return
+
+        result = None
+        try:
+            if not singleflight.claim(decoded_url):
+                result = singleflight.wait_for_remote(decoded_url)
+                if result:
+                    yield done_event(result)
+                    return
+                if not singleflight.claim(decoded_url):
+                    yield failed_event()
+                    return
+
+            try:
+                # 처음 확인한 뒤 claim을 얻기 전에 다른 호출이 저장했을 수 있다
+                existing_summary = get_article_summary(decoded_url)
+                if existing_summary:
+                    result = existing_summary
+                    yield sse("done", {
+                        "success": False,
+                        "message": "이미 요약이 존재합니다.",
+                        "summary": existing_summary
+                    })
+                    return
+
+                for event in stream_summarize_article(decoded_url, article['title']):
+                    if event["type"] == "delta":
+                        yield sse("delta", {"content": event["content"]})
+                    elif event["type"] == "done":
+                        summary_data = event["summary"]
+                        # 로컬 추출 결과는 저장하지 않음
+                        if summary_data.get('source') != 'local':
+                            save_article_summary(
+                                decoded_url,
+                                summary_data['summary'],
+                                summary_data['keywords'],
+                                summary_data['bible_verses']
+                            )
+                            snapshots.schedule()
+                        result = summary_data
+                        yield done_event(summary_data)
+                    else:
+                        yield failed_event(event["message"])
+            finally:
+                singleflight.release(decoded_url)
+        finally:
+            singleflight.finish(decoded_url, future, result)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.get("/summary/{article_url:path}")
 async def get_single_summary(article_url: str):
     """특정 기사의 요약을 반환"""
@@ -244,9 +443,9 @@ async def get_single_summary(article_url: str):
         from urllib.parse import unquote
         decoded_url = unquote(article_url)
 
-        summary = get_article_summary(decoded_url)
+        summary = get_article_summary_json(decoded_url)
         if summary:
-            return JSONResponse(summary)
+            return Response(summary, media_type="application/json")
         else:
             raise HTTPException(status_code=404, detail="요약을 찾을 수 없습니다.")
     except HTTPException:
@@ -254,19 +453,185 @@ async def get_single_summary(article_url: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"요약 조회 오류: {str(e)}")
 
+@app.get("/related/{article_url:path}")
+async def get_related_articles(article_url: str, k: int = 5):
+    """임베딩 코사인 유사도 기준으로 관련 기사 top-k 반환"""
+    try:
+        from urllib.parse import unquote
+        decoded_url = unquote(article_url)
+
+        if k < 1 or k > 50:
+            k = 5
+
+        article = get_article(decoded_url)
+        if not article:
+            raise HTTPException(status_code=404, detail="기사를 찾을 수 없습니다.")
+
+        from embeddings import find_related
+        related = await run_in_threadpool(find_related, decoded_url, k)
+        if related is None:
+            raise HTTPException(status_code=404, detail="기사 임베딩을 찾을 수 없습니다.")
+
+        related_articles = get_articles([item["url"] for item in related])
+        results = [
+            {**related_articles[item["url"]], "score": item["score"]}
+            for item in related if item["url"] in related_articles
+        ]
+
+        return JSONResponse({
+            "article_url": decoded_url,
+            "title": article["title"],
+            "related": results
+        })
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"관련 기사 조회 오류: {str(e)}")
+
+@app.get("/keywords/{article_url:path}")
+async def get_article_keywords(article_url: str, k: int = 5):
+    """LLM 없이 추출한 기사 키워드(TF-IDF)와 성경 구절 반환 - 요약이 없는 기사도 지원"""
+    try:
+        from urllib.parse import unquote
+        decoded_url = unquote(article_url)
+
+        article = get_article(decoded_url)
+        if not article:
+            raise HTTPException(status_code=404, detail="기사를 찾을 수 없습니다.")
+
+        from extractor import extract_keywords, extract_bible_references
+        summary = get_article_summary(decoded_url)
+        text = f"{article['title']}\n{summary['summary'] if summary else ''}"
+
+        return JSONResponse({
+            "article_url": decoded_url,
+            "title": article["title"],
+            "keywords": await run_in_threadpool(extract_keywords, decoded_url, None, k),
+            "bible_verses": extract_bible_references(text)
+        })
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"키워드 추출 오류: {str(e)}")
+
 @app.post("/migrate")
 async def migrate_existing_articles():
     """기존 기사들의 작성일 정보를 마이그레이션"""
     try:
-        updated_count = migrate_published_dates()
+        from crawlrun import crawl_run
+        with crawl_run("migrate") as run:
+            updated_count = migrate_published_dates()
         return JSONResponse({
             "success": True,
             "message": f"{updated_count}개 기사의 작성일을 마이그레이션했습니다.",
-            "updated_count": updated_count
+            "updated_count": updated_count,
+            "run_id": run.id
         })
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"마이그레이션 중 오류 발생: {str(e)}")
 
+@app.get("/runs")
+async def list_crawl_runs(kind: str = None, source: str = None, limit: int = 100):
+    """크롤링 실행 기록과 단계별 p50/p90/p95/p99 집계 (kind: check, backfill, migrate)"""
+    try:
+        if limit < 1 or limit > 1000:
+            limit = 100
+        from crawlrun import summarize_runs
+        return JSONResponse(summarize_runs(kind=kind, limit=limit, source=source))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"실행 기록 조회 오류: {str(e)}")
+
+@app.get("/jobs")
+async def list_jobs(state: str = None, limit: int = 50):
+    """요약 작업 큐 목록 (state: pending, running, done, failed)"""
+    try:
+        if limit < 1 or limit > 500:
+            limit = 50
+        jobs = get_jobs(state=state, limit=limit)
+        return JSONResponse({
+            "jobs": jobs,
+            "count": len(jobs),
+            "counts": get_job_counts()
+        })
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"작업 조회 오류: {str(e)}")
+
+@app.get("/jobs/stats")
+async def job_stats():
+    """상태별 작업 수"""
+    try:
+        return JSONResponse(get_job_counts())
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"작업 통계 조회 오류: {str(e)}")
+
+@app.get("/jobs/{job_id}")
+async def get_single_job(job_id: int):
+    """특정 작업 상태 조회"""
+    job = get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return JSONResponse(job)
+
+@app.post("/jobs/{job_id}/retry")
+async def retry_single_job(job_id: int):
+    """실패했거나 완료된 작업을 다시 대기열에 넣기"""
+    if not retry_job(job_id):
+        raise HTTPException(status_code=404, detail="재시도할 수 있는 작업이 없습니다.")
+    jobqueue.notify()
+    return JSONResponse({"success": True, "job": get_job(job_id)})
+
+class SnapshotFiles(StaticFiles):
+    """정적 스냅샷 - CDN/브라우저가 짧게 캐시하도록 Cache-Control 추가 (ETag/304는 StaticFiles가 처리)"""
+
+    async def get_response(self, path, scope):
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            response.headers["Cache-Control"] = "public, max-age=60, stale-while-revalidate=600"
+        return response
+
+app.mount("/snapshots", SnapshotFiles(directory=snapshots.SNAPSHOT_DIR, check_dir=False), name="snapshots")
+
+@app.get("/metrics")
+async def get_metrics():
+    """Prometheus 형식 메트릭"""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+if profiling.ENABLED:
+    def _check_profile_token(token: Optional[str]):
+        # 프로파일에는 코드 경로와 인자가 담기므로 미들웨어와 같은 토큰을 요구
+        if not profiling.token_valid(token):
+            raise HTTPException(status_code=403, detail="X-Profile-Token이 올바르지 않습니다.")
+
+    @app.get("/profiles")
+    async def get_profiles(x_profile_token: Optional[str] = Header(None)):
+        """저장된 프로파일 목록"""
+        _check_profile_token(x_profile_token)
+        return JSONResponse({"profiles": profiling.list_profiles()})
+
+    @app.get("/profiles/{name}")
+    async def get_profile(name: str, format: str = "raw", x_profile_token: Optional[str] = Header(None)):
+        """프로파일 파일 다운로드 (.pstats는 format=text로 상위 함수 요약 조회)"""
+        _check_profile_token(x_profile_token)
+        path = profiling.profile_path(name)
+        if not path:
+            raise HTTPException(status_code=404, detail="프로파일을 찾을 수 없습니다.")
+        if format == "text" and name.endswith(".pstats"):
+            return PlainTextResponse(profiling.pstats_text(path))
+        return FileResponse(path, filename=name)
+
+@app.get("/usage")
+async def get_llm_usage(hours: int = 24):
+    """LLM 토큰/요청 사용량, 예산 잔여량, 우선순위별 허용 여부, 시간대별 집계"""
+    import budget
+    if hours < 1 or hours > 24 * 31:
+        hours = 24
+    return JSONResponse(await run_in_threadpool(budget.status, hours))
+
+@app.get("/leader")
+async def get_leader():
+    """이 프로세스가 백그라운드 작업 리더인지와 현재 lease 보유자"""
+    return JSONResponse(await run_in_threadpool(leader.status))
+
 @app.get("/health")
 async def health_check():
     """서버 상태 확인"""
@@ -275,6 +640,8 @@ async def health_check():
 # Vercel serverless function entry point
 def handler(event, context):
     """Vercel serverless function handler"""
+    # 서버리스 환경에서는 lifespan이 실행되지 않을 수 있으므로 직접 초기화
+    startup()
     return app(event, context)
 
 if __name__ == "__main__":
@@ -0,0 +1,297 @@
+"""
+오프라인 end-to-end 벤치마크 / 부하 테스트
+
+로컬 가짜 사이트(fake_site.py)와 가짜 OpenAI 서버(fake_openai.py)를 띄우고, 임시 DB를 대상으로
+스크래핑 → DB 저장 → 요약 → API 라우트를 동시 부하로 측정한다. 네트워크나 API 키가 필요 없다.
+
+    cd backend
+    python benchmarks/bench_e2e.py --concurrency 8 --requests 200
+    python benchmarks/bench_e2e.py --site-latency-ms 20 --llm-latency-ms 100 --compare benchmarks/results/e2e-abc1234.json
+
+시나리오별로 처리량(ops/s), p50/p95/p99 지연(ms), 메모리(RSS 최대치, 선택적으로 tracemalloc 최대치)를
+기록하고 결과를 JSON으로 저장한다 (기본: benchmarks/results/e2e-<commit>.json).
+--compare 로 이전 결과와 p50/p95/처리량 변화를 비교할 수 있다.
+"""
+
+import argparse
+import json
+import os
+import resource
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+import fake_openai
+import fake_site
+
+def _rss_peak_mb():
+    # ru_maxrss: Linux는 KB, macOS는 byte 단위
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+def _process_rss_peak_mb(pid):
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    return None
+
+def run_load(name, fn, calls, concurrency, trace_memory=False):
+    """Run fn(*args) for each args in calls on a thread pool. fn returning False counts as an error."""
+    from crawlrun import percentile
+
+    def one(args):
+        start = time.perf_counter()
+        try:
+            ok = fn(*args) is not False
+        except Exception as e:
+            print(f"  {name}: {e}")
+            ok = False
+        return (time.perf_counter() - start) * 1000, ok
+
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(one, calls))
+    elapsed = time.perf_counter() - start
+    python_peak = None
+    if trace_memory:
+        python_peak = round(tracemalloc.get_traced_memory()[1] / (1024 * 1024), 1)
+        tracemalloc.stop()
+
+    latencies = [latency for latency, _ in results]
+    result = {
+        "ops": len(results),
+        "errors": sum(1 for _, ok in results if not ok),
+        "concurrency": concurrency,
+        "seconds": round(elapsed, 3),
+        "throughput_per_s": round(len(results) / elapsed, 2) if elapsed else None,
+        "p50_ms": round(percentile(latencies, 50), 1),
+        "p95_ms": round(percentile(latencies, 95), 1),
+        "p99_ms": round(percentile(latencies, 99), 1),
+        "max_ms": round(max(latencies), 1),
+        "rss_peak_mb": _rss_peak_mb(),
+        "python_peak_mb": python_peak
+    }
+    print(f"{name:32s} {result['throughput_per_s']:>9} ops/s  p50 {result['p50_ms']:>8} ms  "
+          f"p95 {result['p95_ms']:>8} ms  p99 {result['p99_ms']:>8} ms  errors {result['errors']}")
+    return result
+
+def bench_in_process(args, site):
+    """Scraper, DB and summarizer scenarios in this process."""
+    from scraper import get_latest_links, get_articles_from_page
+    from db import save_new_links, get_all_links
+    from summarizer import summarize_article, summarize_and_save
+
+    scenarios = {}
+    trace = args.trace_memory
+
+    scenarios["scraper.get_latest_links"] = run_load(
+        "scraper.get_latest_links", lambda: bool(get_latest_links()),
+        [()] * args.scrape_iterations, 1, trace)
+
+    pages = [(page,) for page in range(2, site.pages + 1)]
+    scraped = []
+
+    def scrape_page(page):
+        articles = get_articles_from_page(page)
+        scraped.extend(articles)
+        return bool(articles)
+
+    scenarios["scraper.get_articles_from_page"] = run_load(
+        "scraper.get_articles_from_page", scrape_page, pages, args.concurrency, trace)
+
+    # 스크랩한 기사 + 합성 기사를 배치로 저장 (SQLite 쓰기 경합 측정)
+    synthetic = [
+        (f"{os.environ['SCRAPER_BASE_URL']}/news/{100000 + i}", f"합성 기사 {i}", "2025-11-15")
+        for i in range(args.db_rows)
+    ]
+    rows = scraped + synthetic
+    batches = [(rows[i:i + args.db_batch],) for i in range(0, len(rows), args.db_batch)]
+    scenarios["db.save_new_links"] = run_load(
+        "db.save_new_links", lambda batch: save_new_links(batch) is not None, batches, args.concurrency, trace)
+
+    articles = get_all_links()[:args.summaries]
+    scenarios["summarizer.summarize_article"] = run_load(
+        "summarizer.summarize_article",
+        lambda url, title: bool(summarize_article(url, title)),
+        [(a["url"], a["title"]) for a in articles], args.concurrency, trace)
+
+    scenarios["summarizer.summarize_and_save"] = run_load(
+        "summarizer.summarize_and_save",
+        lambda url, title: summarize_and_save(url, title, force=True)[0] == "generated",
+        [(a["url"], a["title"]) for a in articles], args.concurrency, trace)
+
+    return scenarios, [a["url"] for a in articles]
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def bench_api(args, env, summarized_urls):
+    """FastAPI routes under concurrent HTTP load against a uvicorn subprocess."""
+    port = _free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "api.index:app", "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    base = f"http://127.0.0.1:{port}"
+
+    def request(path, method="GET"):
+        req = urllib.request.Request(base + path, method=method)
+        with urllib.request.urlopen(req, timeout=120) as response:
+            response.read()
+            return response.status == 200
+
+    try:
+        deadline = time.perf_counter() + 30
+        while True:
+            try:
+                request("/health")
+                break
+            except OSError:
+                if time.perf_counter() > deadline:
+                    raise RuntimeError("uvicorn did not start")
+                time.sleep(0.05)
+
+        quoted = [urllib.parse.quote(url, safe="") for url in summarized_urls] or [""]
+        routes = {
+            "api.GET /latest": [("/latest?page=1&per_page=20",)] * args.requests,
+            "api.GET /stats": [("/stats",)] * args.requests,
+            "api.GET /summaries": [("/summaries",)] * args.requests,
+            "api.GET /summary/{url}": [(f"/summary/{quoted[i % len(quoted)]}",) for i in range(args.requests)],
+            "api.GET /related/{url}": [(f"/related/{quoted[i % len(quoted)]}?k=5",) for i in range(args.requests)],
+            "api.GET /check": [("/check",)] * max(args.requests // 20, 1),
+            "api.POST /summarize/{url}": [(f"/summarize/{quoted[i % len(quoted)]}", "POST") for i in range(len(quoted))]
+        }
+
+        scenarios = {}
+        for name, calls in routes.items():
+            scenarios[name] = run_load(name, request, calls, args.concurrency)
+            scenarios[name]["rss_peak_mb"] = _process_rss_peak_mb(process.pid)
+        return scenarios
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+def _git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR,
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def compare(previous, current):
+    print(f"\n비교: {previous.get('commit')} → {current.get('commit')}")
+    for name, result in current["scenarios"].items():
+        before = previous.get("scenarios", {}).get(name)
+        if not before:
+            continue
+        deltas = []
+        for field in ("p50_ms", "p95_ms", "throughput_per_s"):
+            if before.get(field) and result.get(field) is not None:
+                deltas.append(f"{field} {(result[field] - before[field]) / before[field] * 100:+.1f}%")
+        print(f"  {name:32s} " + "  ".join(deltas))
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline end-to-end benchmark")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=200, help="API 라우트별 요청 수")
+    parser.add_argument("--scrape-iterations", type=int, default=3)
+    parser.add_argument("--pages", type=int, default=6, help="가짜 사이트 목록 페이지 수")
+    parser.add_argument("--articles-per-page", type=int, default=15)
+    parser.add_argument("--paragraphs", type=int, default=8, help="가짜 기사 본문 문단 수")
+    parser.add_argument("--db-rows", type=int, default=2000, help="save_new_links에 넣을 합성 기사 수")
+    parser.add_argument("--db-batch", type=int, default=50)
+    parser.add_argument("--summaries", type=int, default=16, help="요약할 기사 수")
+    parser.add_argument("--site-latency-ms", type=float, default=30.0)
+    parser.add_argument("--site-jitter-ms", type=float, default=10.0)
+    parser.add_argument("--llm-latency-ms", type=float, default=200.0)
+    parser.add_argument("--llm-rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--fixtures", help="녹화된 HTML 디렉터리 (fake_site.py record)")
+    parser.add_argument("--trace-memory", action="store_true", help="tracemalloc으로 Python 힙 최대치 측정 (느려짐)")
+    parser.add_argument("--skip-api", action="store_true")
+    parser.add_argument("--json", help="결과 JSON 경로 (기본: benchmarks/results/e2e-<commit>.json)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    site = fake_site.FakeSite(args.articles_per_page, args.pages, args.paragraphs,
+                              args.site_latency_ms, args.site_jitter_ms, args.fixtures)
+    _, site_url = fake_site.start(site)
+    llm = fake_openai.FakeOpenAI(args.llm_latency_ms, rate_limit_rate=args.llm_rate_limit_rate)
+    _, llm_url = fake_openai.start(llm)
+
+    tmp_dir = tempfile.mkdtemp(prefix="bench-e2e-")
+    env = dict(os.environ)
+    env.update({
+        "DB_PATH": os.path.join(tmp_dir, "articles.db"),
+        "SNAPSHOT_DIR": os.path.join(tmp_dir, "snapshots"),
+        "SCRAPER_BASE_URL": site_url,
+        "OPENAI_BASE_URL": llm_url,
+        "OPENAI_API_KEY": "bench",
+        "LLM_BACKEND": "openai",
+        "EMBEDDING_BACKEND": "openai",
+        "SUMMARY_WORKERS": "0",
+        # 가짜 사이트에는 예의상 요청 간격이 필요 없으므로 기본은 제한 없음 (코드 자체의 처리량 측정)
+        "SCRAPER_MAX_RPS_PER_HOST": os.environ.get("SCRAPER_MAX_RPS_PER_HOST", "0"),
+        "PYTHONDONTWRITEBYTECODE": "1"
+    })
+    env.pop("RESET_DATABASE", None)
+    env.pop("RUN_BULK_IMPORT", None)
+    os.environ.update(env)
+
+    try:
+        from db import init_db
+        init_db()
+
+        scenarios, summarized_urls = bench_in_process(args, site)
+        if not args.skip_api:
+            # /related가 404 대신 실제 조회를 측정하도록 요약된 기사의 임베딩을 미리 채움
+            import embeddings
+            while embeddings.sync_embeddings() == embeddings.SYNC_BATCH_SIZE:
+                pass
+            scenarios.update(bench_api(args, env, summarized_urls))
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    report = {
+        "commit": _git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "config": vars(args),
+        "fake_site": {"requests": site.requests, "bytes_sent": site.bytes_sent},
+        "fake_openai": {"requests": llm.requests, "rate_limited": llm.rate_limited,
+                        "prompt_tokens": llm.prompt_tokens, "completion_tokens": llm.completion_tokens},
+        "scenarios": scenarios
+    }
+
+    path = args.json or os.path.join(BENCH_DIR, "results", f"e2e-{report['commit']}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {path}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(json.load(f), report)
+
+if __name__ == "__main__":
+    main()
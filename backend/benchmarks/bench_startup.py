@@ -0,0 +1,108 @@
+"""
+API 프로세스 콜드 스타트 벤치마크
+
+1. import: `import api.index`에 걸리는 시간 (새 인터프리터에서 측정)
+2. first-response: uvicorn 프로세스 시작부터 첫 /health 200 응답까지
+
+    cd backend
+    python benchmarks/bench_startup.py --runs 5 [--json results.json]
+
+워커가 실제 DB의 작업을 처리하지 않도록 임시 DB와 SUMMARY_WORKERS=0으로 실행한다.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_SNIPPET = """
+import time
+start = time.perf_counter()
+import api.index
+print(time.perf_counter() - start)
+"""
+
+def _env(db_path):
+    env = dict(os.environ)
+    env.update({"DB_PATH": db_path, "SUMMARY_WORKERS": "0", "PYTHONDONTWRITEBYTECODE": "1"})
+    env.pop("RESET_DATABASE", None)
+    env.pop("RUN_BULK_IMPORT", None)
+    return env
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def measure_import(env):
+    output = subprocess.check_output([sys.executable, "-c", IMPORT_SNIPPET], cwd=BACKEND_DIR, env=env)
+    return float(output.decode().strip().splitlines()[-1])
+
+def measure_first_response(env, timeout=30.0):
+    port = _free_port()
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "api.index:app", "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start
+            except OSError:
+                time.sleep(0.01)
+        raise TimeoutError("server did not respond")
+    finally:
+        process.terminate()
+        process.wait()
+
+def summarize(samples):
+    return {
+        "min_ms": round(min(samples) * 1000, 1),
+        "median_ms": round(statistics.median(samples) * 1000, 1),
+        "max_ms": round(max(samples) * 1000, 1),
+        "runs": len(samples)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="API 콜드 스타트 측정")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    tmpdir = tempfile.mkdtemp()
+    db_path = os.path.join(tmpdir, "articles.db")
+    source_db = os.path.join(BACKEND_DIR, "articles.db")
+    if os.path.exists(source_db):
+        shutil.copy(source_db, db_path)
+    env = _env(db_path)
+
+    try:
+        import_samples = [measure_import(env) for _ in range(args.runs)]
+        response_samples = [measure_first_response(env) for _ in range(args.runs)]
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+    results = {
+        "import_api_index": summarize(import_samples),
+        "process_start_to_first_response": summarize(response_samples)
+    }
+    print(json.dumps(results, indent=2))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+요약 조회 마이크로 벤치마크 (/summaries, /summary/{url})
+
+임시 DB에 요약 --rows개를 만들고, 같은 응답 본문을 두 가지 방식으로 만드는 처리량을 비교한다.
+
+- decode: 이전 방식 - 행마다 keywords/bible_verses를 json.loads 한 dict를 JSONResponse로 다시 인코딩
+- splice: 저장할 때 만든 summary_json 조각을 그대로 이어 붙여 Response로 반환
+
+    cd backend
+    python benchmarks/bench_summaries.py --rows 2000 --limit 50 --seconds 2 [--json results.json]
+
+두 방식의 응답 바이트가 같은지 먼저 확인한다. /summary는 LRU 캐시를 끄고(ARTICLE_CACHE_SIZE=0) DB 조회부터 측정한다.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+def _seed(db, rows):
+    import sqlite3
+    conn = sqlite3.connect(db.DB_PATH)
+    conn.executemany(
+        "INSERT INTO posts (url, title, published_at) VALUES (?, ?, ?)",
+        [(f"https://example.com/news/{i}", f"[다니엘기도회] {i}일차 말씀 \"은혜\"", "2025-11-01") for i in range(rows)]
+    )
+    conn.commit()
+    conn.close()
+    summary = "다니엘기도회 강사는 말씀과 기도의 능력을 전하며 공동체의 회복을 강조했다. " * 8
+    keywords = ["다니엘기도회", "기도", "말씀", "회복", "공동체", "예배"]
+    bible_verses = ["다니엘 6:10", "요한복음 3:16", "시편 23:1"]
+    for i in range(rows):
+        db.save_article_summary(f"https://example.com/news/{i}", summary, keywords, bible_verses)
+
+def _throughput(fn, seconds):
+    fn()
+    calls = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        fn()
+        calls += 1
+    elapsed = time.perf_counter() - start
+    return {"ops_per_s": round(calls / elapsed, 1), "mean_us": round(elapsed / calls * 1e6, 1)}
+
+def main():
+    parser = argparse.ArgumentParser(description="요약 조회 decode vs splice 처리량 비교")
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--limit", type=int, default=50, help="/summaries?limit=")
+    parser.add_argument("--seconds", type=float, default=2.0, help="시나리오별 측정 시간")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    tmpdir = tempfile.mkdtemp()
+    os.environ.update({"DB_PATH": os.path.join(tmpdir, "articles.db"), "ARTICLE_CACHE_SIZE": "0"})
+    try:
+        import db
+        from fastapi.responses import JSONResponse, Response
+
+        db.init_db()
+        _seed(db, args.rows)
+        url = f"https://example.com/news/{args.rows // 2}"
+
+        def summaries_decode():
+            summaries = db.get_article_summaries(limit=args.limit)
+            return JSONResponse({"summaries": summaries, "count": len(summaries)}).body
+
+        def summaries_splice():
+            return Response(db.get_article_summaries_json(limit=args.limit), media_type="application/json").body
+
+        def summary_decode():
+            return JSONResponse(db.get_article_summary(url)).body
+
+        def summary_splice():
+            return Response(db.get_article_summary_json(url), media_type="application/json").body
+
+        assert summaries_decode() == summaries_splice(), "/summaries 응답이 다름"
+        assert summary_decode() == summary_splice(), "/summary 응답이 다름"
+
+        results = {"rows": args.rows, "limit": args.limit}
+        for name, decode, splice in (("summaries", summaries_decode, summaries_splice),
+                                     ("summary", summary_decode, summary_splice)):
+            before = _throughput(decode, args.seconds)
+            after = _throughput(splice, args.seconds)
+            results[name] = {
+                "decode": before,
+                "splice": after,
+                "speedup": round(after["ops_per_s"] / before["ops_per_s"], 2)
+            }
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+    print(json.dumps(results, indent=2))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
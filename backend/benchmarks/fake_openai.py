@@ -0,0 +1,188 @@
+"""
+OpenAI API 로컬 대역 (벤치마크용)
+
+/v1/chat/completions (일반 + stream SSE, include_usage)와 /v1/embeddings를 흉내 낸다.
+실제 openai 클라이언트가 그대로 붙도록 OPENAI_BASE_URL만 바꿔서 사용한다.
+응답 내용은 llm.FakeBackend와 같은 결정적 JSON이고, 지연과 429 비율을 조절할 수 있다.
+
+    cd backend
+    python benchmarks/fake_openai.py --port 8702 --latency-ms 300
+    OPENAI_BASE_URL=http://127.0.0.1:8702/v1 OPENAI_API_KEY=bench uvicorn api.index:app
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from llm import FakeBackend
+
+class FakeOpenAI:
+    """Chat/embedding responses with configurable latency and 429 rate, plus counters."""
+
+    def __init__(self, latency_ms=300.0, jitter_ms=0.0, rate_limit_rate=0.0, stream_chunk_chars=16, seed=1):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_limit_rate = rate_limit_rate
+        self.stream_chunk_chars = stream_chunk_chars
+        self.backend = FakeBackend(latency_ms=0)
+        self.requests = 0
+        self.rate_limited = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def roll(self):
+        """Returns (latency seconds, rate limited?) and counts the request."""
+        with self._lock:
+            self.requests += 1
+            latency = self.latency_ms + self._random.uniform(-self.jitter_ms, self.jitter_ms)
+            limited = self._random.random() < self.rate_limit_rate
+            if limited:
+                self.rate_limited += 1
+            return max(latency, 0) / 1000, limited
+
+    def complete(self, request):
+        prompt = request["messages"][-1]["content"]
+        text, usage = self.backend.chat(prompt, request.get("response_format"))
+        with self._lock:
+            self.prompt_tokens += usage["prompt_tokens"]
+            self.completion_tokens += usage["completion_tokens"]
+        return text, usage
+
+    @staticmethod
+    def embed(text, dimensions):
+        seed = int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
+        rng = random.Random(seed)
+        return [rng.uniform(-1, 1) for _ in range(dimensions)]
+
+def _completion(model, text, usage):
+    return {
+        "id": "chatcmpl-bench",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+        "usage": dict(usage, total_tokens=usage["prompt_tokens"] + usage["completion_tokens"])
+    }
+
+def _chunk(model, delta=None, finish_reason=None, usage=None):
+    chunk = {
+        "id": "chatcmpl-bench",
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [] if usage else [{"index": 0, "delta": delta or {}, "finish_reason": finish_reason}]
+    }
+    if usage:
+        chunk["usage"] = dict(usage, total_tokens=usage["prompt_tokens"] + usage["completion_tokens"])
+    return chunk
+
+def make_handler(fake):
+    class Handler(BaseHTTPRequestHandler):
+        def _send_json(self, status, payload, headers=None):
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            request = json.loads(self.rfile.read(length) or b"{}")
+            path = self.path.split("?", 1)[0]
+
+            latency, limited = fake.roll()
+            if limited:
+                time.sleep(latency / 10)
+                self._send_json(429, {"error": {"message": "Rate limit reached", "type": "requests", "code": "rate_limit_exceeded"}},
+                                {"retry-after": "0.05"})
+                return
+
+            if path.endswith("/chat/completions"):
+                model = request.get("model", "gpt-4o-mini")
+                text, usage = fake.complete(request)
+                if not request.get("stream"):
+                    time.sleep(latency)
+                    self._send_json(200, _completion(model, text, usage))
+                    return
+                self._stream(model, text, usage, latency, request)
+            elif path.endswith("/embeddings"):
+                inputs = request.get("input") or []
+                if isinstance(inputs, str):
+                    inputs = [inputs]
+                dimensions = request.get("dimensions") or 1536
+                time.sleep(latency)
+                self._send_json(200, {
+                    "object": "list",
+                    "model": request.get("model"),
+                    "data": [{"object": "embedding", "index": i, "embedding": fake.embed(text, dimensions)} for i, text in enumerate(inputs)],
+                    "usage": {"prompt_tokens": sum(len(text) for text in inputs), "total_tokens": sum(len(text) for text in inputs)}
+                })
+            else:
+                self._send_json(404, {"error": {"message": f"unknown path {path}"}})
+
+        def _stream(self, model, text, usage, latency, request):
+            size = fake.stream_chunk_chars
+            pieces = [text[i:i + size] for i in range(0, len(text), size)] or [""]
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+
+            def send(payload):
+                self.wfile.write(f"data: {payload}\n\n".encode("utf-8"))
+                self.wfile.flush()
+
+            send(json.dumps(_chunk(model, {"role": "assistant", "content": ""})))
+            for piece in pieces:
+                time.sleep(latency / len(pieces))
+                send(json.dumps(_chunk(model, {"content": piece}), ensure_ascii=False))
+            send(json.dumps(_chunk(model, finish_reason="stop")))
+            if (request.get("stream_options") or {}).get("include_usage"):
+                send(json.dumps(_chunk(model, usage=usage)))
+            send("[DONE]")
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+def start(fake, host="127.0.0.1", port=0):
+    """Serve fake in a daemon thread. Returns (server, base_url ending in /v1)."""
+    server = ThreadingHTTPServer((host, port), make_handler(fake))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}/v1"
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the OpenAI API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8702)
+    parser.add_argument("--latency-ms", type=float, default=300.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="429로 응답할 비율 (0~1)")
+    args = parser.parse_args()
+
+    fake = FakeOpenAI(args.latency_ms, args.jitter_ms, args.rate_limit_rate)
+    server, base_url = start(fake, args.host, args.port)
+    print(f"fake OpenAI serving at {base_url} (OPENAI_BASE_URL={base_url})")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+"""
+christiantoday.co.kr 로컬 대역 (벤치마크용)
+
+실제 사이트와 같은 마크업(article h2 a, ul.l-list li, <time datetime>, .article-content)으로
+목록/기사 페이지를 합성해서 돌려준다. --fixtures 디렉터리에 녹화된 HTML이 있으면 그것을 우선 사용한다.
+
+    cd backend
+    python benchmarks/fake_site.py --port 8701 --latency-ms 80
+    SCRAPER_BASE_URL=http://127.0.0.1:8701 python -c "from scraper import test_scraper; test_scraper()"
+
+녹화:
+    python benchmarks/fake_site.py record fixtures/   # 실제 사이트의 목록 1페이지와 기사들을 저장
+
+fixture 경로 규칙: /sections/pd_19 -> sections/pd_19.html, /sections/pd_19/page2.htm -> sections/pd_19/page2.htm,
+/news/123 -> news/123.html
+
+피드: /rss/pd_19.xml (목록 1페이지와 같은 기사의 RSS 2.0, ETag/If-None-Match 304 지원)
+"""
+
+import argparse
+import hashlib
+import os
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+LISTING_PATH = "/sections/pd_19"
+FEED_PATH = "/rss/pd_19.xml"
+PARAGRAPH = (
+    "다니엘기도회 {day}일차 집회가 오륜교회에서 열렸다. 강사는 요한복음 3:16과 시편 23편을 본문으로 "
+    "기도와 회복에 대해 말씀을 전했으며, 참석한 성도들은 한국교회와 다음세대를 위해 함께 기도했다. "
+    "주최 측은 이번 기도회가 예배의 감격을 회복하는 시간이 되기를 바란다고 밝혔다."
+)
+
+class FakeSite:
+    """Synthetic listing/article pages plus request counters."""
+
+    def __init__(self, articles_per_page=15, pages=10, paragraphs=8, latency_ms=50.0,
+                 jitter_ms=0.0, fixtures=None, seed=1):
+        self.articles_per_page = articles_per_page
+        self.pages = pages
+        self.paragraphs = paragraphs
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.fixtures = fixtures
+        self.requests = 0
+        self.bytes_sent = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def delay(self):
+        with self._lock:
+            latency = self.latency_ms + self._random.uniform(-self.jitter_ms, self.jitter_ms)
+        time.sleep(max(latency, 0) / 1000)
+
+    def count(self, nbytes):
+        with self._lock:
+            self.requests += 1
+            self.bytes_sent += nbytes
+
+    def _fixture(self, path):
+        if not self.fixtures:
+            return None
+        relative = path.strip("/")
+        if not os.path.splitext(relative)[1]:
+            relative += ".html"
+        root = os.path.abspath(self.fixtures)
+        file_path = os.path.abspath(os.path.join(root, relative))
+        if not file_path.startswith(root + os.sep) or not os.path.isfile(file_path):
+            return None
+        with open(file_path, encoding="utf-8") as f:
+            return f.read()
+
+    def listing(self, page):
+        first = (page - 1) * self.articles_per_page + 1
+        ids = range(first, first + self.articles_per_page)
+        items = "\n".join(
+            f'<li><a href="/news/{article_id}"><h3>다니엘기도회 소식 {article_id}</h3></a><span class="date">2025.11.{article_id % 28 + 1:02d}</span></li>'
+            for article_id in list(ids)[1:]
+        )
+        return (
+            "<html><head><title>다니엘기도회 - 크리스천투데이</title></head><body>"
+            f'<article><h2><a href="/news/{first}">다니엘기도회 소식 {first}</a></h2></article>'
+            f'<ul class="l-list w-divider gap-md no-bullet">{items}</ul>'
+            "</body></html>"
+        )
+
+    def article(self, article_id):
+        day = article_id % 21 + 1
+        body = "\n".join(f"<p>{PARAGRAPH.format(day=day)}</p>" for _ in range(self.paragraphs))
+        return (
+            f"<html><head><title>다니엘기도회 소식 {article_id}</title></head><body>"
+            f'<div class="article-meta"><time datetime="2025-11-{article_id % 28 + 1:02d}T10:30:00+09:00">입력</time></div>'
+            f'<div class="article-content">{body}<script>var x = 1;</script></div>'
+            "</body></html>"
+        )
+
+    def feed(self, base_url):
+        items = "".join(
+            f"<item><title>다니엘기도회 소식 {article_id}</title><link>{base_url}/news/{article_id}</link>"
+            f"<pubDate>Sat, {article_id % 28 + 1:02d} Nov 2025 10:30:00 +0900</pubDate></item>"
+            for article_id in range(1, self.articles_per_page + 1)
+        )
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            f"<rss version=\"2.0\"><channel><title>다니엘기도회</title><link>{base_url}{LISTING_PATH}</link>{items}</channel></rss>"
+        )
+
+    def render(self, path):
+        """Return HTML for path, or None for 404."""
+        html = self._fixture(path)
+        if html is not None:
+            return html
+        if path == LISTING_PATH:
+            return self.listing(1)
+        match = re.fullmatch(LISTING_PATH + r"/page(\d+)\.htm", path)
+        if match and 1 <= int(match.group(1)) <= self.pages:
+            return self.listing(int(match.group(1)))
+        match = re.fullmatch(r"/news/(\d+)", path)
+        if match:
+            return self.article(int(match.group(1)))
+        return None
+
+def make_handler(site):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            site.delay()
+            path = self.path.split("?", 1)[0]
+            if path == FEED_PATH:
+                self._send_feed()
+                return
+            html = site.render(path)
+            if html is None:
+                body = "not found".encode("utf-8")
+                self.send_response(404)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                site.count(len(body))
+                return
+            self._send(html.encode("utf-8"), "text/html; charset=utf-8")
+
+        def _send_feed(self):
+            body = site.feed(f"http://{self.headers.get('Host')}").encode("utf-8")
+            self._send(body, "application/rss+xml; charset=utf-8")
+
+        def _send(self, body, content_type):
+            # 피드와 기사 재크롤링의 조건부 GET을 재현하도록 모든 페이지에 ETag를 붙인다
+            etag = '"%s"' % hashlib.md5(body).hexdigest()
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                site.count(0)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", etag)
+            self.end_headers()
+            self.wfile.write(body)
+            site.count(len(body))
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+def start(site, host="127.0.0.1", port=0):
+    """Serve site in a daemon thread. Returns (server, base_url)."""
+    server = ThreadingHTTPServer((host, port), make_handler(site))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+def record(directory, limit=10):
+    """Save the live listing page and its first articles in the fixture layout."""
+    import requests
+    from bs4 import BeautifulSoup
+    from urllib.parse import urlparse
+
+    base = "https://www.christiantoday.co.kr"
+    headers = {"User-Agent": "Mozilla/5.0"}
+
+    def save(path, html):
+        relative = path.strip("/")
+        if not os.path.splitext(relative)[1]:
+            relative += ".html"
+        file_path = os.path.join(directory, relative)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(html)
+        print(f"saved {file_path}")
+
+    response = requests.get(base + LISTING_PATH, headers=headers, timeout=10)
+    response.encoding = "utf-8"
+    save(LISTING_PATH, response.text)
+
+    soup = BeautifulSoup(response.text, "html.parser")
+    paths = []
+    for link in soup.select('a[href*="/news/"]'):
+        path = urlparse(link["href"]).path
+        if path not in paths:
+            paths.append(path)
+    for path in paths[:limit]:
+        article = requests.get(base + path, headers=headers, timeout=15)
+        article.encoding = "utf-8"
+        save(path, article.text)
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for christiantoday.co.kr")
+    parser.add_argument("command", nargs="?", default="serve", choices=["serve", "record"])
+    parser.add_argument("directory", nargs="?", help="record 대상 디렉터리")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8701)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--articles-per-page", type=int, default=15)
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--paragraphs", type=int, default=8)
+    parser.add_argument("--fixtures", help="녹화된 HTML 디렉터리")
+    args = parser.parse_args()
+
+    if args.command == "record":
+        record(args.directory or "fixtures")
+        return
+
+    site = FakeSite(args.articles_per_page, args.pages, args.paragraphs, args.latency_ms, args.jitter_ms, args.fixtures)
+    server, base_url = start(site, args.host, args.port)
+    print(f"fake christiantoday serving at {base_url} (SCRAPER_BASE_URL={base_url})")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
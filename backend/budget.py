@@ -0,0 +1,145 @@
+"""
+LLM 사용량 장부와 예산 스케줄링
+
+모든 LLM 호출의 모델, 입력/출력 토큰, 지연시간, 결과를 llm_usage 테이블에 기록하고,
+최근 1시간/24시간(rolling) 사용량이 예산에 가까워지면 우선순위가 낮은 작업부터 미룬다.
+
+    우선순위       호출 경로                                   예산 중 쓸 수 있는 비율
+    interactive   /summarize/{url}, /summarize-stream/{url}    100%
+    newest        새 기사 요약 작업 큐, /summarize (최신 N개)  LLM_NEWEST_BUDGET_SHARE (기본 0.9)
+    backfill      db_populate_summaries (manage.py populate-summaries)
+                                                                LLM_BACKFILL_BUDGET_SHARE (기본 0.5)
+
+예산을 넘으면 check()가 BudgetExceededError(LLMUnavailableError)를 던진다. 사용자 요청(interactive)은
+LLM을 쓸 수 없는 경우와 같이 로컬 추출 요약을 받고(저장하지 않음), 그 밖의 우선순위는 기사 본문을
+받기 전에 거절되어 작업 큐는 시도 횟수를 쓰지 않고 예산이 풀리는 시각(retry_after)으로 작업을 미루며,
+백필은 남은 기사를 다음 실행으로 미룬다.
+예산은 기사 단위로 확인하므로 이미 시작한 기사의 청크 호출은 끝까지 진행된다.
+"""
+
+import os
+import time
+from typing import Dict, Optional
+
+from db import record_llm_usage, get_llm_usage_totals, get_llm_usage_entries, get_llm_usage_breakdown
+from llm import LLMUnavailableError
+
+PRIORITIES = ("interactive", "newest", "backfill")
+
+# 0이면 제한 없음
+LIMITS = {
+    "hour": {
+        "tokens": int(os.getenv("LLM_HOURLY_TOKEN_BUDGET", "0")),
+        "requests": int(os.getenv("LLM_HOURLY_REQUEST_BUDGET", "0")),
+    },
+    "day": {
+        "tokens": int(os.getenv("LLM_DAILY_TOKEN_BUDGET", "0")),
+        "requests": int(os.getenv("LLM_DAILY_REQUEST_BUDGET", "0")),
+    },
+}
+WINDOW_SECONDS = {"hour": 3600, "day": 86400}
+PRIORITY_SHARE = {
+    "interactive": 1.0,
+    "newest": float(os.getenv("LLM_NEWEST_BUDGET_SHARE", "0.9")),
+    "backfill": float(os.getenv("LLM_BACKFILL_BUDGET_SHARE", "0.5")),
+}
+
+class BudgetExceededError(LLMUnavailableError):
+    """The LLM budget left for this priority is used up; the work should be deferred by retry_after seconds."""
+
+    def __init__(self, message: str, retry_after: float = 0.0):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+def _usage(now: Optional[float] = None) -> Dict[str, Dict]:
+    now = now or time.time()
+    usage = {}
+    for window, seconds in WINDOW_SECONDS.items():
+        totals = get_llm_usage_totals(now - seconds)
+        usage[window] = {
+            "requests": totals["requests"],
+            "tokens": totals["prompt_tokens"] + totals["completion_tokens"],
+            "prompt_tokens": totals["prompt_tokens"],
+            "completion_tokens": totals["completion_tokens"],
+        }
+    return usage
+
+def _blocking_limit(priority: str, usage: Dict[str, Dict]) -> Optional[str]:
+    """Describe the first budget this priority has used up, or None if it may proceed."""
+    share = PRIORITY_SHARE.get(priority, 1.0)
+    for window, limits in LIMITS.items():
+        for kind, limit in limits.items():
+            if limit and usage[window][kind] >= limit * share:
+                return f"{window} {kind} {usage[window][kind]}/{limit} (priority {priority}: {share:.0%})"
+    return None
+
+def _enabled() -> bool:
+    return any(limit for limits in LIMITS.values() for limit in limits.values())
+
+def retry_after(priority: str = "interactive", now: Optional[float] = None) -> float:
+    """Seconds until enough old calls leave the rolling windows for priority to run again (0 if it may run now)."""
+    now = now or time.time()
+    usage = _usage(now)
+    share = PRIORITY_SHARE.get(priority, 1.0)
+    wait = 0.0
+    for window, limits in LIMITS.items():
+        entries = None
+        for kind, limit in limits.items():
+            if not limit or usage[window][kind] < limit * share:
+                continue
+            if entries is None:
+                entries = get_llm_usage_entries(now - WINDOW_SECONDS[window])
+            # 오래된 호출부터 창 밖으로 빠진다 - 사용량이 한도 아래로 내려가는 시점을 찾는다
+            remaining = usage[window][kind]
+            for created_at, tokens in entries:
+                remaining -= 1 if kind == "requests" else tokens
+                if remaining < limit * share:
+                    wait = max(wait, created_at + WINDOW_SECONDS[window] - now)
+                    break
+    return max(wait, 0.0)
+
+def check(priority: str = "interactive"):
+    """Raise BudgetExceededError if priority may not start another LLM-backed summary now."""
+    if not _enabled():
+        return
+    blocked = _blocking_limit(priority, _usage())
+    if blocked:
+        raise BudgetExceededError(f"LLM budget exhausted: {blocked}", retry_after(priority))
+
+def allows(priority: str = "interactive") -> bool:
+    try:
+        check(priority)
+        return True
+    except BudgetExceededError:
+        return False
+
+def record(backend_name: str, model: str, priority: str, article_url: Optional[str],
+           usage: Optional[Dict], latency_ms: float, outcome: str):
+    """Append one call to the ledger; ledger failures never fail the summary itself."""
+    try:
+        record_llm_usage(
+            backend_name, model, priority, article_url,
+            usage["prompt_tokens"] if usage else 0,
+            usage["completion_tokens"] if usage else 0,
+            round(latency_ms, 1), outcome
+        )
+    except Exception as e:
+        print(f"LLM 사용량 기록 실패: {e}")
+
+def status(hours: int = 24) -> Dict:
+    """Budget usage per window, which priorities may run, and an hourly breakdown."""
+    now = time.time()
+    usage = _usage(now)
+    windows = {}
+    for window, limits in LIMITS.items():
+        windows[window] = dict(usage[window])
+        windows[window]["limits"] = {
+            kind: {"limit": limit or None, "remaining": max(limit - usage[window][kind], 0) if limit else None}
+            for kind, limit in limits.items()
+        }
+    return {
+        "windows": windows,
+        "priority_share": PRIORITY_SHARE,
+        "allowed": {priority: _blocking_limit(priority, usage) is None for priority in PRIORITIES},
+        "hourly": get_llm_usage_breakdown(now - hours * 3600),
+    }
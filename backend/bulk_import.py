@@ -8,6 +8,7 @@ Deploy할 때마다 실행되지 않도록 주의.
 
 from scraper import get_articles_from_page
 from db import save_new_links
+from crawlrun import crawl_run
 import sys
 
 def import_page2_articles():
@@ -15,28 +16,31 @@ def import_page2_articles():
     Page 2의 기사들을 DB에 bulk import
     """
     print("Page 2 기사 크롤링 시작...")
-    articles = get_articles_from_page(2)
-
-    if not articles:
-        print("Page 2에서 기사를 찾을 수 없습니다.")
-        return 0
-
-    print(f"Page 2에서 {len(articles)}개 기사 발견")
-    print("샘플 기사들:")
-    for i, (url, title, published_at) in enumerate(articles[:3]):
-        if published_at:
-            print(f"  {i+1}. [{published_at}] {title[:40]}...")
-        else:
-            print(f"  {i+1}. {title[:50]}...")
-
-    print("\nDB에 저장 시작...")
-    new_articles = save_new_links(articles)
-
-    print(f"\n✅ 완료! {len(new_articles)}개 새로운 기사 추가됨")
-    if len(new_articles) < len(articles):
-        print(f"   (중복된 {len(articles) - len(new_articles)}개는 건너뜀)")
-
-    return len(new_articles)
+    with crawl_run("backfill") as run:
+        articles = get_articles_from_page(2)
+
+        if not articles:
+            print("Page 2에서 기사를 찾을 수 없습니다.")
+            return 0
+
+        print(f"Page 2에서 {len(articles)}개 기사 발견")
+        print("샘플 기사들:")
+        for i, (url, title, published_at) in enumerate(articles[:3]):
+            if published_at:
+                print(f"  {i+1}. [{published_at}] {title[:40]}...")
+            else:
+                print(f"  {i+1}. {title[:50]}...")
+
+        print("\nDB에 저장 시작...")
+        with run.stage("db_write"):
+            new_articles = save_new_links(articles)
+        run.add(new_articles=len(new_articles))
+
+        print(f"\n✅ 완료! {len(new_articles)}개 새로운 기사 추가됨")
+        if len(new_articles) < len(articles):
+            print(f"   (중복된 {len(articles) - len(new_articles)}개는 건너뜀)")
+
+        return len(new_articles)
 
 if __name__ == "__main__":
     print("=" * 50)
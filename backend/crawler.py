@@ -0,0 +1,138 @@
+"""
+소스별 크롤링과 스케줄러
+
+sources.py 레지스트리의 소스들을 동시에 크롤링해서 하나의 posts 테이블(source 컬럼)에 저장한다.
+모든 소스는 scraper의 공유 세션(커넥션 풀)과 호스트별 요청 간격을 함께 쓰므로,
+같은 사이트의 여러 섹션을 동시에 돌려도 사이트에 가는 요청 속도는 제한된다.
+
+- crawl_sources(): /check 에서 사용 - 지정한 소스(기본: 활성 소스 전체)를 한 번씩 크롤링
+- start_scheduler(): CRAWL_SCHEDULER=true 이면 소스마다 interval_seconds 주기로 크롤링
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from crawlrun import crawl_run
+from db import save_new_links
+from sources import Source, get_sources
+
+CRAWLER_MAX_CONCURRENCY = int(os.getenv("CRAWLER_MAX_CONCURRENCY", "4"))
+SCHEDULER_ENABLED = os.getenv("CRAWL_SCHEDULER") == "true"
+SCHEDULER_TICK_SECONDS = float(os.getenv("CRAWL_SCHEDULER_TICK_SECONDS", "15"))
+
+_last_crawled: Dict[str, float] = {}
+_running = set()
+_active_crawls = 0
+_state_lock = threading.Lock()
+_stop = threading.Event()
+_scheduler: Optional[threading.Thread] = None
+_executor: Optional[ThreadPoolExecutor] = None
+
+def crawl_source(source: Source) -> Dict:
+    """Crawl one source (feed or listing) and save new articles under its name."""
+    global _active_crawls
+    from feeds import get_latest_links
+
+    with _state_lock:
+        _active_crawls += 1
+    try:
+        with crawl_run("check", source=source.name) as run:
+            latest_articles, found_via = get_latest_links(source)
+            new_articles = []
+            if latest_articles:
+                with run.stage("db_write"):
+                    new_articles = save_new_links(latest_articles, source=source.name)
+                run.add(new_articles=len(new_articles))
+        with _state_lock:
+            _last_crawled[source.name] = time.time()
+    finally:
+        with _state_lock:
+            _active_crawls -= 1
+
+    return {
+        "source": source.name,
+        "via": found_via,
+        "success": bool(latest_articles) or found_via == "feed-not-modified",
+        "total_found": len(latest_articles),
+        "new_articles": new_articles,
+        "run_id": run.id
+    }
+
+def _crawl_safely(source: Source) -> Dict:
+    try:
+        return crawl_source(source)
+    except Exception as e:
+        print(f"{source.name} 크롤링 실패: {e}")
+        return {"source": source.name, "via": None, "success": False, "total_found": 0,
+                "new_articles": [], "error": str(e)}
+
+def _after_ingest(results: List[Dict]):
+    # 새 기사가 있으면 요약 워커를 깨우고 정적 스냅샷 갱신
+    if any(result["new_articles"] for result in results):
+        import jobqueue
+        import snapshots
+        jobqueue.notify()
+        snapshots.schedule()
+
+def crawl_sources(sources: Optional[List[Source]] = None) -> List[Dict]:
+    """Crawl the given sources (default: all enabled) concurrently; one result dict per source."""
+    sources = sources if sources is not None else get_sources()
+    if len(sources) <= 1:
+        results = [_crawl_safely(source) for source in sources]
+    else:
+        with ThreadPoolExecutor(max_workers=min(CRAWLER_MAX_CONCURRENCY, len(sources)), thread_name_prefix="crawl") as executor:
+            results = list(executor.map(_crawl_safely, sources))
+    _after_ingest(results)
+    return results
+
+def is_crawling() -> bool:
+    """True while any new-article crawl (/check or scheduled) is running in this process."""
+    with _state_lock:
+        return _active_crawls > 0
+
+def last_crawled() -> Dict[str, float]:
+    with _state_lock:
+        return dict(_last_crawled)
+
+def _run_scheduled(source: Source):
+    try:
+        _after_ingest([_crawl_safely(source)])
+    finally:
+        with _state_lock:
+            _running.discard(source.name)
+
+def _scheduler_loop():
+    while not _stop.is_set():
+        now = time.time()
+        for source in get_sources():
+            with _state_lock:
+                due = now - _last_crawled.get(source.name, 0) >= source.interval_seconds
+                if not due or source.name in _running:
+                    continue
+                _running.add(source.name)
+            _executor.submit(_run_scheduled, source)
+        _stop.wait(SCHEDULER_TICK_SECONDS)
+
+def start_scheduler():
+    """Start periodic per-source crawling (no-op unless CRAWL_SCHEDULER=true or already running)."""
+    global _scheduler, _executor
+    if not SCHEDULER_ENABLED or _scheduler is not None:
+        return
+    _stop.clear()
+    _executor = ThreadPoolExecutor(max_workers=CRAWLER_MAX_CONCURRENCY, thread_name_prefix="crawl")
+    _scheduler = threading.Thread(target=_scheduler_loop, name="crawl-scheduler", daemon=True)
+    _scheduler.start()
+    print(f"🕷️ 크롤링 스케줄러 시작 ({len(get_sources())}개 소스)")
+
+def stop_scheduler(timeout: float = 5.0):
+    global _scheduler, _executor
+    if _scheduler is None:
+        return
+    _stop.set()
+    _scheduler.join(timeout)
+    _executor.shutdown(wait=False)
+    _scheduler = None
+    _executor = None
@@ -0,0 +1,128 @@
+"""
+크롤링 실행 기록 (crawl_runs)
+
+/check, 백필(bulk import), 작성일 마이그레이션 한 번이 crawl_runs 한 행이 된다.
+실행 중인 기록은 ContextVar로 전달되므로 scraper는 함수 시그니처를 바꾸지 않고
+fetch 바이트/시간, 파싱 시간, 오류를 현재 실행에 더할 수 있다.
+
+    with crawl_run("check") as run:
+        links = get_latest_links()
+        with run.stage("db_write"):
+            new = save_new_links(links)
+        run.add(new_articles=len(new))
+"""
+
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from db import start_crawl_run, finish_crawl_run, get_crawl_runs, CRAWL_RUN_STATS
+
+_current = contextvars.ContextVar("crawl_run", default=None)
+
+# fetch한 페이지 종류별로 어느 단계 시간에 더할지
+_FETCH_STAGES = {
+    "listing": ("pages_fetched", "listing_fetch_ms"),
+    "article_date": ("articles_fetched", "article_fetch_ms"),
+    "article_content": ("articles_fetched", "article_fetch_ms"),
+    "article_recheck": ("articles_fetched", "article_fetch_ms"),
+}
+
+class CrawlRun:
+    """Counters and per-stage timings of one crawl run (thread-safe)."""
+
+    def __init__(self, kind: str, source: Optional[str] = None):
+        self.kind = kind
+        self.source = source
+        self.id = None
+        self.stats: Dict[str, float] = {name: 0 for name in CRAWL_RUN_STATS}
+        self._lock = threading.Lock()
+
+    def add(self, **values):
+        with self._lock:
+            for name, value in values.items():
+                self.stats[name] += value
+
+    @contextmanager
+    def stage(self, name: str):
+        """Add the with-block duration to <name>_ms."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(**{f"{name}_ms": (time.perf_counter() - start) * 1000})
+
+def current_run() -> Optional[CrawlRun]:
+    return _current.get()
+
+def record_fetch(page_type: str, seconds: float, nbytes: int):
+    run = _current.get()
+    if run is None:
+        return
+    count_field, time_field = _FETCH_STAGES.get(page_type, ("pages_fetched", "listing_fetch_ms"))
+    run.add(**{count_field: 1, time_field: seconds * 1000, "bytes_downloaded": nbytes})
+
+def record_parse(seconds: float):
+    run = _current.get()
+    if run is not None:
+        run.add(parse_ms=seconds * 1000)
+
+def record_error():
+    run = _current.get()
+    if run is not None:
+        run.add(errors=1)
+
+@contextmanager
+def crawl_run(kind: str, source: Optional[str] = None):
+    """Record a crawl run in crawl_runs; the yielded CrawlRun collects counters while it is current."""
+    run = CrawlRun(kind, source)
+    run.id = start_crawl_run(kind, source)
+    token = _current.set(run)
+    start = time.perf_counter()
+    status, error_message = "ok", None
+    try:
+        yield run
+    except Exception as e:
+        status, error_message = "error", str(e)[:500]
+        run.add(errors=1)
+        raise
+    finally:
+        _current.reset(token)
+        stats = {name: round(value, 1) if name.endswith("_ms") else int(value) for name, value in run.stats.items()}
+        finish_crawl_run(run.id, status, round((time.perf_counter() - start) * 1000, 1), stats, error_message)
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """Nearest-rank percentile (q in 0..100)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(int(-(-q * len(ordered) // 100)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+AGGREGATE_FIELDS = ("duration_ms", "listing_fetch_ms", "article_fetch_ms", "parse_ms", "db_write_ms",
+                    "bytes_downloaded", "pages_fetched", "articles_fetched", "new_articles", "errors")
+
+def summarize_runs(kind: Optional[str] = None, limit: int = 100, source: Optional[str] = None) -> Dict:
+    """Recent finished runs plus p50/p90/p95/p99 of every timing and counter."""
+    runs = get_crawl_runs(kind=kind, limit=limit, source=source)
+    finished = [run for run in runs if run["status"] != "running"]
+
+    aggregates = {}
+    for field in AGGREGATE_FIELDS:
+        values = [run[field] for run in finished if run[field] is not None]
+        aggregates[field] = {
+            "p50": percentile(values, 50),
+            "p90": percentile(values, 90),
+            "p95": percentile(values, 95),
+            "p99": percentile(values, 99),
+            "max": max(values) if values else None
+        }
+
+    return {
+        "runs": runs,
+        "count": len(runs),
+        "error_runs": sum(1 for run in finished if run["status"] == "error"),
+        "aggregates": aggregates
+    }
@@ -1,19 +1,142 @@
+import json
 import sqlite3
 import os
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
 
+from metrics import timed_db, NEW_ARTICLES
+
 # DB 경로를 절대 경로로 설정하여 backend 폴더에서 실행하든 root에서 실행하든 동일한 DB 사용
-DB_PATH = os.path.join(os.path.dirname(__file__), "articles.db")
+# DB_PATH 환경변수로 다른 DB 파일 지정 가능 (벤치마크, 테스트용)
+DB_PATH = os.getenv("DB_PATH") or os.path.join(os.path.dirname(__file__), "articles.db")
+
+# 소스 컬럼이 생기기 전의 기사는 모두 다니엘기도회 섹션(pd_19)에서 수집됨
+DEFAULT_SOURCE = "pd_19"
+
+SQLITE_MAX_PARAMS = 500  # 오래된 SQLite의 바인딩 변수 한도(999)보다 작게 나눠서 조회
+
+# 기사 메타데이터/디코딩된 요약의 프로세스 내 LRU 캐시 (0이면 비활성화)
+ARTICLE_CACHE_SIZE = int(os.getenv("ARTICLE_CACHE_SIZE", "2048"))
+# 다른 프로세스(리더의 작업 큐, 재크롤링, manage.py)가 쓴 값은 이 프로세스 캐시를 지우지 못하므로 TTL로 최대 지연을 제한
+ARTICLE_CACHE_TTL_SECONDS = float(os.getenv("ARTICLE_CACHE_TTL_SECONDS", "10"))
+
+class _LRUCache:
+    """
+    Thread-safe bounded LRU of url -> dict (or str) with a TTL. Only found rows are cached.
+    Writers in this process call invalidate(); entries written by other processes expire after ttl.
+    Readers take a token() before querying and pass it to put(), so a row read before a
+    concurrent invalidate() is not cached after it.
+    """
+
+    def __init__(self, maxsize, ttl=ARTICLE_CACHE_TTL_SECONDS):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._version = 0
+        # key -> version of its last invalidate(); older entries are folded into _floor
+        self._invalidated = OrderedDict()
+        self._floor = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return _copy(value)
+
+    def token(self):
+        with self._lock:
+            return self._version
+
+    def put(self, key, value, token):
+        if self.maxsize <= 0 or self.ttl <= 0:
+            return
+        with self._lock:
+            if token < self._floor or self._invalidated.get(key, 0) > token:
+                return
+            self._data[key] = (_copy(value), time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key=None):
+        with self._lock:
+            self._version += 1
+            if key is None:
+                self._data.clear()
+                self._invalidated.clear()
+                self._floor = self._version
+                return
+            self._data.pop(key, None)
+            self._invalidated[key] = self._version
+            self._invalidated.move_to_end(key)
+            while len(self._invalidated) > max(self.maxsize, 1):
+                _, version = self._invalidated.popitem(last=False)
+                self._floor = max(self._floor, version)
+
+def _copy(value):
+    # 호출한 쪽이 반환값(키워드 리스트 등)을 고쳐도 캐시가 바뀌지 않도록 복사
+    if not isinstance(value, dict):
+        return value
+    return {k: list(v) if isinstance(v, list) else v for k, v in value.items()}
+
+_article_cache = _LRUCache(ARTICLE_CACHE_SIZE)
+_summary_cache = _LRUCache(ARTICLE_CACHE_SIZE)
+_summary_json_cache = _LRUCache(ARTICLE_CACHE_SIZE)
+
+def clear_caches():
+    """Drop all cached articles and summaries (after writes from outside this module)."""
+    _article_cache.invalidate()
+    _invalidate_summary()
+
+def _invalidate_summary(article_url=None):
+    _summary_cache.invalidate(article_url)
+    _summary_json_cache.invalidate(article_url)
+
+# FastAPI JSONResponse와 같은 설정 - 미리 만든 조각을 이어 붙여도 응답 바이트가 같다
+_json_encoder = json.JSONEncoder(ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+
+def _decode_list(value):
+    try:
+        return json.loads(value) if value else []
+    except json.JSONDecodeError:
+        return []
+
+def _summary_fragment(summary, keywords, bible_verses):
+    """
+    Ready-to-serve JSON object members `"summary":..,"keywords":[..],"bible_verses":[..]` (no braces),
+    stored in article_summaries.summary_json so read paths splice it instead of decoding each row.
+    """
+    return (f'"summary":{_json_encoder.encode(summary)},'
+            f'"keywords":{_json_encoder.encode(keywords)},'
+            f'"bible_verses":{_json_encoder.encode(bible_verses)}')
 
+def _ensure_column(conn, table, column, declaration):
+    """ALTER TABLE ADD COLUMN for databases created before the column existed."""
+    columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+    if column not in columns:
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {declaration}")
+
+# 시작 시 한 번 실행되는 스키마 생성/마이그레이션이라 쿼리 지연 히스토그램(timed_db)에 넣지 않음
 def init_db():
     """Initialize the database and create tables if they don't exist."""
-    conn = sqlite3.connect(DB_PATH)
+    # 여러 워커가 동시에 시작해도 잠금 오류 대신 차례로 실행되도록 대기
+    conn = sqlite3.connect(DB_PATH, timeout=30)
     conn.execute("""
         CREATE TABLE IF NOT EXISTS posts (
             url TEXT PRIMARY KEY,
             title TEXT,
             published_at TIMESTAMP,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            source TEXT DEFAULT 'pd_19'  -- sources.py 레지스트리의 소스 이름
         )
     """)
     conn.execute("""
@@ -24,17 +147,165 @@ def init_db():
             keywords TEXT,  -- JSON array string
             bible_verses TEXT,  -- JSON array string
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            stale INTEGER DEFAULT 0,  -- 재크롤링에서 기사 변경이 감지되어 다시 생성할 요약
+            summary_json TEXT,  -- 응답에 그대로 넣는 summary/keywords/bible_verses JSON 조각
             FOREIGN KEY (article_url) REFERENCES posts (url)
         )
     """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS summary_claims (
+            article_url TEXT PRIMARY KEY,
+            owner TEXT,
+            claimed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    # 백그라운드 작업 리더 선출용 lease - 데이터가 아니므로 reset_database에서 지우지 않음
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS leases (
+            name TEXT PRIMARY KEY,
+            owner TEXT,
+            acquired_at REAL,
+            expires_at REAL  -- unix time
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kind TEXT NOT NULL,
+            article_url TEXT NOT NULL,
+            state TEXT NOT NULL DEFAULT 'pending',  -- pending, running, done, failed
+            priority INTEGER NOT NULL DEFAULT 0,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            max_attempts INTEGER NOT NULL DEFAULT 5,
+            run_after TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            locked_at TIMESTAMP,
+            last_error TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE (kind, article_url)
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_state_run_after ON jobs (state, run_after)")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS feed_state (
+            url TEXT PRIMARY KEY,
+            etag TEXT,
+            last_modified TEXT,
+            last_status INTEGER,
+            item_count INTEGER DEFAULT 0,
+            checked_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS crawl_runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kind TEXT,  -- check, backfill, migrate
+            status TEXT DEFAULT 'running',  -- running, ok, error
+            started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            finished_at TIMESTAMP,
+            duration_ms REAL,
+            pages_fetched INTEGER DEFAULT 0,
+            articles_fetched INTEGER DEFAULT 0,
+            bytes_downloaded INTEGER DEFAULT 0,
+            new_articles INTEGER DEFAULT 0,
+            errors INTEGER DEFAULT 0,
+            listing_fetch_ms REAL DEFAULT 0,
+            article_fetch_ms REAL DEFAULT 0,
+            parse_ms REAL DEFAULT 0,
+            db_write_ms REAL DEFAULT 0,
+            error_message TEXT,
+            source TEXT
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS article_embeddings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            article_url TEXT UNIQUE,
+            model TEXT,
+            dim INTEGER,
+            vector BLOB,  -- float32 little-endian
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (article_url) REFERENCES posts (url)
+        )
+    """)
+
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS article_checks (
+            url TEXT PRIMARY KEY,
+            etag TEXT,
+            last_modified TEXT,
+            content_hash TEXT,  -- sha256(제목 + 본문)
+            checked_at REAL,  -- unix time
+            next_check_at REAL,
+            changed_at REAL,
+            check_count INTEGER DEFAULT 0,
+            change_count INTEGER DEFAULT 0,
+            FOREIGN KEY (url) REFERENCES posts (url)
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_article_checks_next ON article_checks (next_check_at)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_article_checks_checked ON article_checks (checked_at)")
+    # LLM 호출 기록 - 예산 집계용이므로 reset_database에서 지우지 않음
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS llm_usage (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            created_at REAL,  -- unix time
+            backend TEXT,
+            model TEXT,
+            priority TEXT,  -- interactive | newest | backfill
+            article_url TEXT,
+            prompt_tokens INTEGER DEFAULT 0,
+            completion_tokens INTEGER DEFAULT 0,
+            latency_ms REAL,
+            outcome TEXT  -- ok | rate_limited | unavailable | error
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_usage_created_at ON llm_usage (created_at)")
+    # 정적 스냅샷 재생성 요청 표시 - 어느 프로세스든 표시하고 리더만 비우면서 다시 생성
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS snapshot_dirty (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            marked_at REAL  -- unix time, 첫 표시 시각
+        )
+    """)
+
+    # 기존 DB 마이그레이션: 나중에 추가된 컬럼
+    _ensure_column(conn, "posts", "source", f"TEXT DEFAULT '{DEFAULT_SOURCE}'")
+    _ensure_column(conn, "crawl_runs", "source", "TEXT")
+    _ensure_column(conn, "article_summaries", "stale", "INTEGER DEFAULT 0")
+    _ensure_column(conn, "article_summaries", "summary_json", "TEXT")
+    _backfill_summary_json(conn)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_posts_source ON posts (source)")
+    conn.commit()
     conn.close()
 
+def _backfill_summary_json(conn):
+    # 컬럼이 생기기 전에 저장된 요약의 JSON 조각을 한 번만 만든다 (이후 실행에서는 대상이 없음)
+    rows = conn.execute("""
+        SELECT id, summary, keywords, bible_verses FROM article_summaries WHERE summary_json IS NULL
+    """).fetchall()
+    if not rows:
+        return
+    conn.executemany(
+        "UPDATE article_summaries SET summary_json = ? WHERE id = ?",
+        [(_summary_fragment(row[1], _decode_list(row[2]), _decode_list(row[3])), row[0]) for row in rows]
+    )
+    print(f"📝 요약 JSON 조각 {len(rows)}개 생성")
+
+@timed_db
 def reset_database():
     """Reset the database by dropping all tables and recreating them."""
+    clear_caches()
     conn = sqlite3.connect(DB_PATH)
 
     # Drop existing tables
     try:
+        conn.execute("DROP TABLE IF EXISTS article_checks")
+        conn.execute("DROP TABLE IF EXISTS feed_state")
+        conn.execute("DROP TABLE IF EXISTS crawl_runs")
+        conn.execute("DROP TABLE IF EXISTS article_embeddings")
+        conn.execute("DROP TABLE IF EXISTS jobs")
+        conn.execute("DROP TABLE IF EXISTS summary_claims")
         conn.execute("DROP TABLE IF EXISTS article_summaries")
         conn.execute("DROP TABLE IF EXISTS posts")
         print("📝 기존 테이블 삭제 완료")
@@ -47,7 +318,8 @@ def reset_database():
             url TEXT PRIMARY KEY,
             title TEXT,
             published_at TIMESTAMP,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            source TEXT DEFAULT 'pd_19'  -- sources.py 레지스트리의 소스 이름
         )
     """)
     conn.execute("""
@@ -58,27 +330,111 @@ def reset_database():
             keywords TEXT,  -- JSON array string
             bible_verses TEXT,  -- JSON array string
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            stale INTEGER DEFAULT 0,  -- 재크롤링에서 기사 변경이 감지되어 다시 생성할 요약
+            summary_json TEXT,  -- 응답에 그대로 넣는 summary/keywords/bible_verses JSON 조각
             FOREIGN KEY (article_url) REFERENCES posts (url)
         )
     """)
+    conn.execute("""
+        CREATE TABLE summary_claims (
+            article_url TEXT PRIMARY KEY,
+            owner TEXT,
+            claimed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kind TEXT NOT NULL,
+            article_url TEXT NOT NULL,
+            state TEXT NOT NULL DEFAULT 'pending',  -- pending, running, done, failed
+            priority INTEGER NOT NULL DEFAULT 0,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            max_attempts INTEGER NOT NULL DEFAULT 5,
+            run_after TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            locked_at TIMESTAMP,
+            last_error TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE (kind, article_url)
+        )
+    """)
+    conn.execute("CREATE INDEX idx_jobs_state_run_after ON jobs (state, run_after)")
+    conn.execute("CREATE INDEX idx_posts_source ON posts (source)")
+    conn.execute("""
+        CREATE TABLE feed_state (
+            url TEXT PRIMARY KEY,
+            etag TEXT,
+            last_modified TEXT,
+            last_status INTEGER,
+            item_count INTEGER DEFAULT 0,
+            checked_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE crawl_runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kind TEXT,  -- check, backfill, migrate
+            status TEXT DEFAULT 'running',  -- running, ok, error
+            started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            finished_at TIMESTAMP,
+            duration_ms REAL,
+            pages_fetched INTEGER DEFAULT 0,
+            articles_fetched INTEGER DEFAULT 0,
+            bytes_downloaded INTEGER DEFAULT 0,
+            new_articles INTEGER DEFAULT 0,
+            errors INTEGER DEFAULT 0,
+            listing_fetch_ms REAL DEFAULT 0,
+            article_fetch_ms REAL DEFAULT 0,
+            parse_ms REAL DEFAULT 0,
+            db_write_ms REAL DEFAULT 0,
+            error_message TEXT,
+            source TEXT
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE article_embeddings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            article_url TEXT UNIQUE,
+            model TEXT,
+            dim INTEGER,
+            vector BLOB,  -- float32 little-endian
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (article_url) REFERENCES posts (url)
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE article_checks (
+            url TEXT PRIMARY KEY,
+            etag TEXT,
+            last_modified TEXT,
+            content_hash TEXT,  -- sha256(제목 + 본문)
+            checked_at REAL,  -- unix time
+            next_check_at REAL,
+            changed_at REAL,
+            check_count INTEGER DEFAULT 0,
+            change_count INTEGER DEFAULT 0,
+            FOREIGN KEY (url) REFERENCES posts (url)
+        )
+    """)
+    conn.execute("CREATE INDEX idx_article_checks_next ON article_checks (next_check_at)")
+    conn.execute("CREATE INDEX idx_article_checks_checked ON article_checks (checked_at)")
 
     conn.commit()
     conn.close()
     print("🔄 데이터베이스 재생성 완료")
 
-def save_new_links(links_with_titles_and_dates):
+@timed_db
+def save_new_links(links_with_titles_and_dates, source=DEFAULT_SOURCE):
     """
-    Save new article links to database.
+    Save new article links to database and enqueue a summary job for each new article.
     links_with_titles_and_dates should be list of tuples: (url, title, published_at)
+    source is the sources.py registry name the links were crawled from.
     Returns list of newly added articles.
     """
-    conn = sqlite3.connect(DB_PATH)
+    conn = sqlite3.connect(DB_PATH, timeout=30)
     cur = conn.cursor()
 
-    # Get existing URLs
-    cur.execute("SELECT url FROM posts")
-    existing = {row[0] for row in cur.fetchall()}
-
     new_articles = []
     for item in links_with_titles_and_dates:
         if len(item) == 3:
@@ -88,17 +444,22 @@ def save_new_links(links_with_titles_and_dates):
             url, title = item
             published_at = None
 
-        if url not in existing:
-            cur.execute(
-                "INSERT INTO posts (url, title, published_at) VALUES (?, ?, ?)",
-                (url, title, published_at)
-            )
-            new_articles.append({"url": url, "title": title, "published_at": published_at})
+        # 이미 있는 URL은 무시 - 여러 소스가 같은 기사를 동시에 저장해도 한 번만 들어감
+        cur.execute(
+            "INSERT OR IGNORE INTO posts (url, title, published_at, source) VALUES (?, ?, ?, ?)",
+            (url, title, published_at, source)
+        )
+        if cur.rowcount == 1:
+            new_articles.append({"url": url, "title": title, "published_at": published_at, "source": source})
+            # 새 기사마다 요약 작업 등록 (백그라운드 워커가 처리)
+            enqueue_job("summarize", url, conn=conn)
 
     conn.commit()
     conn.close()
+    NEW_ARTICLES.inc(len(new_articles))
     return new_articles
 
+@timed_db
 def get_all_links(limit=50):
     """Get all stored articles ordered by published date (newest first)."""
     conn = sqlite3.connect(DB_PATH)
@@ -117,6 +478,67 @@ def get_all_links(limit=50):
         for row in rows
     ]
 
+def _article_row_to_dict(row):
+    return {
+        "url": row[0],
+        "title": row[1] or "제목 없음",
+        "created_at": row[2]  # API 호환성을 위해 created_at 필드로 유지
+    }
+
+@timed_db
+def get_article(url):
+    """Get a single stored article by URL (primary key lookup, LRU cached)."""
+    article = _article_cache.get(url)
+    if article is not None:
+        return article
+
+    token = _article_cache.token()
+    conn = sqlite3.connect(DB_PATH)
+    row = conn.execute(
+        "SELECT url, title, COALESCE(published_at, created_at) as sort_date FROM posts WHERE url = ?",
+        (url,)
+    ).fetchone()
+    conn.close()
+
+    if row:
+        article = _article_row_to_dict(row)
+        _article_cache.put(url, article, token)
+        return article
+    return None
+
+@timed_db
+def get_articles(urls):
+    """
+    Get many stored articles by URL: cache hits first, the rest via chunked WHERE url IN (...).
+    Returns {url: article} for the URLs that exist.
+    """
+    result = {}
+    missing = []
+    for url in dict.fromkeys(urls):
+        article = _article_cache.get(url)
+        if article is not None:
+            result[url] = article
+        else:
+            missing.append(url)
+
+    if missing:
+        token = _article_cache.token()
+        conn = sqlite3.connect(DB_PATH)
+        for start in range(0, len(missing), SQLITE_MAX_PARAMS):
+            chunk = missing[start:start + SQLITE_MAX_PARAMS]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT url, title, COALESCE(published_at, created_at) as sort_date FROM posts WHERE url IN ({placeholders})",
+                chunk
+            ).fetchall()
+            for row in rows:
+                article = _article_row_to_dict(row)
+                _article_cache.put(row[0], article, token)
+                result[row[0]] = article
+        conn.close()
+    return result
+
+@timed_db
 def get_paginated_links(page=1, per_page=20):
     """Get paginated articles ordered by published date (newest first)."""
     conn = sqlite3.connect(DB_PATH)
@@ -137,6 +559,7 @@ def get_paginated_links(page=1, per_page=20):
         for row in rows
     ]
 
+@timed_db
 def get_total_article_count():
     """Get total count of articles in database."""
     conn = sqlite3.connect(DB_PATH)
@@ -144,6 +567,15 @@ def get_total_article_count():
     conn.close()
     return row[0] if row else 0
 
+@timed_db
+def get_source_counts():
+    """Number of stored articles per source."""
+    conn = sqlite3.connect(DB_PATH)
+    rows = conn.execute("SELECT COALESCE(source, ?), COUNT(*) FROM posts GROUP BY 1", (DEFAULT_SOURCE,)).fetchall()
+    conn.close()
+    return {row[0]: row[1] for row in rows}
+
+@timed_db
 def get_latest_links(since_timestamp=None):
     """Get articles created after a specific timestamp."""
     conn = sqlite3.connect(DB_PATH)
@@ -167,9 +599,10 @@ def get_latest_links(since_timestamp=None):
         for row in rows
     ]
 
+@timed_db
 def save_article_summary(article_url, summary, keywords, bible_verses):
     """Save article summary to database."""
-    import json
+    _invalidate_summary(article_url)
     conn = sqlite3.connect(DB_PATH)
     cur = conn.cursor()
 
@@ -180,16 +613,19 @@ def save_article_summary(article_url, summary, keywords, bible_verses):
     # Insert or replace summary
     cur.execute("""
         INSERT OR REPLACE INTO article_summaries
-        (article_url, summary, keywords, bible_verses)
-        VALUES (?, ?, ?, ?)
-    """, (article_url, summary, keywords_json, bible_verses_json))
+        (article_url, summary, keywords, bible_verses, summary_json)
+        VALUES (?, ?, ?, ?, ?)
+    """, (article_url, summary, keywords_json, bible_verses_json,
+          _summary_fragment(summary, keywords, bible_verses)))
 
     conn.commit()
     conn.close()
+    # 저장 중에 다른 스레드가 이전 값을 다시 캐시했을 수 있으므로 커밋 뒤에도 비운다
+    _invalidate_summary(article_url)
 
+@timed_db
 def get_article_summaries(limit=10):
     """Get article summaries with article info."""
-    import json
     conn = sqlite3.connect(DB_PATH)
     rows = conn.execute("""
         SELECT s.article_url, p.title, s.summary, s.keywords, s.bible_verses, s.created_at
@@ -220,12 +656,148 @@ def get_article_summaries(limit=10):
 
     return summaries
 
+def _stored_fragment(row_fragment, summary, keywords, bible_verses):
+    # summary_json은 init_db에서 채우지만, 이전 버전 프로세스가 방금 저장한 행이면 여기서 만든다
+    if row_fragment is not None:
+        return row_fragment
+    return _summary_fragment(summary, _decode_list(keywords), _decode_list(bible_verses))
+
+@timed_db
+def get_article_summaries_json(limit=10):
+    """
+    The /summaries response body ({"summaries": [...], "count": n}) as JSON text, byte-identical
+    to encoding get_article_summaries() but spliced from stored summary_json fragments.
+    """
+    conn = sqlite3.connect(DB_PATH)
+    rows = conn.execute("""
+        SELECT s.article_url, p.title, s.summary_json, s.created_at, s.summary, s.keywords, s.bible_verses
+        FROM article_summaries s
+        JOIN posts p ON s.article_url = p.url
+        ORDER BY s.created_at DESC
+        LIMIT ?
+    """, (limit,)).fetchall()
+    conn.close()
+
+    encode = _json_encoder.encode
+    items = [
+        # 제목은 재크롤링으로 바뀔 수 있어 조각에 넣지 않고 posts에서 가져온다
+        f'{{"article_url":{encode(row[0])},"title":{encode(row[1] or "제목 없음")},'
+        f'{_stored_fragment(row[2], row[4], row[5], row[6])},"created_at":{encode(row[3])}}}'
+        for row in rows
+    ]
+    return f'{{"summaries":[{",".join(items)}],"count":{len(items)}}}'
+
+# 일괄 조회에서 고를 수 있는 필드와 SQL 식
+SUMMARY_FIELDS = {
+    "title": "p.title",
+    "summary": "s.summary",
+    "keywords": "s.keywords",
+    "bible_verses": "s.bible_verses",
+    "created_at": "s.created_at",
+}
+SUMMARY_JSON_FIELDS = ("keywords", "bible_verses")
+
+@timed_db
+def get_summaries_for_urls(urls, fields=None):
+    """
+    Summaries of the given article URLs via indexed WHERE article_url IN (...) lookups.
+    fields picks the returned keys (default: all of SUMMARY_FIELDS, [] = presence only).
+    Returns {article_url: {field: value}} for the URLs that have a summary.
+    """
+    fields = list(SUMMARY_FIELDS) if fields is None else list(fields)
+    columns = ["s.article_url"] + [SUMMARY_FIELDS[field] for field in fields]
+    join = "JOIN posts p ON s.article_url = p.url" if "title" in fields else ""
+    urls = list(dict.fromkeys(urls))
+
+    result = {}
+    conn = sqlite3.connect(DB_PATH)
+    for start in range(0, len(urls), SQLITE_MAX_PARAMS):
+        chunk = urls[start:start + SQLITE_MAX_PARAMS]
+        placeholders = ", ".join("?" * len(chunk))
+        rows = conn.execute(
+            f"SELECT {', '.join(columns)} FROM article_summaries s {join} WHERE s.article_url IN ({placeholders})",
+            chunk
+        ).fetchall()
+        for row in rows:
+            item = dict(zip(fields, row[1:]))
+            for field in SUMMARY_JSON_FIELDS:
+                if field in item:
+                    try:
+                        item[field] = json.loads(item[field]) if item[field] else []
+                    except json.JSONDecodeError:
+                        item[field] = []
+            if "title" in item:
+                item["title"] = item["title"] or "제목 없음"
+            result[row[0]] = item
+    conn.close()
+    return result
+
+EXPORT_COLUMNS = ("url", "title", "source", "published_at", "created_at",
+                  "summary", "keywords", "bible_verses", "summary_created_at")
+
+@timed_db
+def get_export_batch(after_rowid=0, limit=500, since=None, until=None, summarized_only=False, source=None):
+    """
+    One export batch: posts LEFT JOIN article_summaries with rowid > after_rowid, in rowid order.
+    since/until (YYYY-MM-DD, inclusive) filter on COALESCE(published_at, created_at).
+    Returns (last_rowid, rows) where rows are tuples in EXPORT_COLUMNS order (keywords/bible_verses as JSON text).
+    """
+    conditions = ["p.rowid > ?"]
+    params = [after_rowid]
+    if since:
+        conditions.append("substr(COALESCE(p.published_at, p.created_at), 1, 10) >= ?")
+        params.append(since)
+    if until:
+        conditions.append("substr(COALESCE(p.published_at, p.created_at), 1, 10) <= ?")
+        params.append(until)
+    if summarized_only:
+        conditions.append("s.article_url IS NOT NULL")
+    if source:
+        conditions.append("p.source = ?")
+        params.append(source)
+
+    conn = sqlite3.connect(DB_PATH)
+    rows = conn.execute(f"""
+        SELECT p.rowid, p.url, p.title, p.source, p.published_at, p.created_at,
+               s.summary, s.keywords, s.bible_verses, s.created_at
+        FROM posts p
+        LEFT JOIN article_summaries s ON s.article_url = p.url
+        WHERE {' AND '.join(conditions)}
+        ORDER BY p.rowid
+        LIMIT ?
+    """, params + [limit]).fetchall()
+    conn.close()
+
+    if not rows:
+        return after_rowid, []
+    return rows[-1][0], [row[1:] for row in rows]
+
+def iter_export_rows(batch_size=500, **filters):
+    """
+    Yield export batches until the table is exhausted.
+    Each batch is a short query keyed on rowid, so memory stays at one batch and
+    no read lock is held between batches (writers are not blocked by a long export).
+    """
+    after_rowid = 0
+    while True:
+        after_rowid, rows = get_export_batch(after_rowid, batch_size, **filters)
+        if not rows:
+            return
+        yield rows
+        if len(rows) < batch_size:
+            return
+
+@timed_db
 def get_article_summary(article_url):
-    """Get summary for a specific article."""
-    import json
+    """Get summary for a specific article (LRU cached, invalidated by save_article_summary or after the TTL)."""
+    summary = _summary_cache.get(article_url)
+    if summary is not None:
+        return summary
+
+    token = _summary_cache.token()
     conn = sqlite3.connect(DB_PATH)
     row = conn.execute("""
-        SELECT s.summary, s.keywords, s.bible_verses, s.created_at
+        SELECT s.summary, s.keywords, s.bible_verses, s.created_at, s.stale
         FROM article_summaries s
         WHERE s.article_url = ?
     """, (article_url,)).fetchone()
@@ -239,14 +811,673 @@ def get_article_summary(article_url):
             keywords = []
             bible_verses = []
 
-        return {
+        summary = {
             "summary": row[0],
             "keywords": keywords,
             "bible_verses": bible_verses,
-            "created_at": row[3]
+            "created_at": row[3],
+            "stale": bool(row[4])
         }
+        _summary_cache.put(article_url, summary, token)
+        return summary
     return None
 
+@timed_db
+def get_article_summary_json(article_url):
+    """The /summary/{url} response body as JSON text spliced from summary_json (LRU cached), or None."""
+    body = _summary_json_cache.get(article_url)
+    if body is not None:
+        return body
+
+    token = _summary_json_cache.token()
+    conn = sqlite3.connect(DB_PATH)
+    row = conn.execute("""
+        SELECT s.summary_json, s.created_at, s.stale, s.summary, s.keywords, s.bible_verses
+        FROM article_summaries s
+        WHERE s.article_url = ?
+    """, (article_url,)).fetchone()
+    conn.close()
+
+    if row is None:
+        return None
+    body = (f'{{{_stored_fragment(row[0], row[3], row[4], row[5])},'
+            f'"created_at":{_json_encoder.encode(row[1])},"stale":{"true" if row[2] else "false"}}}')
+    _summary_json_cache.put(article_url, body, token)
+    return body
+
+@timed_db
+def claim_summary(article_url, owner, ttl_seconds=300):
+    """
+    Claim the right to generate a summary for article_url.
+    Claims older than ttl_seconds are treated as abandoned and taken over.
+    Returns True if this owner now holds the claim.
+    """
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    cur = conn.cursor()
+
+    cur.execute(
+        "DELETE FROM summary_claims WHERE article_url = ? AND claimed_at < datetime('now', ?)",
+        (article_url, f"-{int(ttl_seconds)} seconds")
+    )
+    cur.execute(
+        "INSERT OR IGNORE INTO summary_claims (article_url, owner) VALUES (?, ?)",
+        (article_url, owner)
+    )
+    claimed = cur.rowcount == 1
+
+    conn.commit()
+    conn.close()
+    return claimed
+
+@timed_db
+def release_summary_claim(article_url, owner):
+    """Release a summary claim held by owner."""
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    conn.execute(
+        "DELETE FROM summary_claims WHERE article_url = ? AND owner = ?",
+        (article_url, owner)
+    )
+    conn.commit()
+    conn.close()
+
+@timed_db
+def is_summary_claimed(article_url, ttl_seconds=300):
+    """Check whether a live (non-expired) summary claim exists for article_url."""
+    conn = sqlite3.connect(DB_PATH)
+    row = conn.execute(
+        "SELECT 1 FROM summary_claims WHERE article_url = ? AND claimed_at >= datetime('now', ?)",
+        (article_url, f"-{int(ttl_seconds)} seconds")
+    ).fetchone()
+    conn.close()
+    return row is not None
+
+@timed_db
+def get_summary_claimed_at(article_url, ttl_seconds=300):
+    """claimed_at of the live summary claim for article_url, or None if there is none."""
+    conn = sqlite3.connect(DB_PATH)
+    row = conn.execute(
+        "SELECT claimed_at FROM summary_claims WHERE article_url = ? AND claimed_at >= datetime('now', ?)",
+        (article_url, f"-{int(ttl_seconds)} seconds")
+    ).fetchone()
+    conn.close()
+    return row[0] if row else None
+
+JOB_COLUMNS = "id, kind, article_url, state, priority, attempts, max_attempts, run_after, last_error, created_at, updated_at"
+
+def _job_row_to_dict(row):
+    return {
+        "id": row[0],
+        "kind": row[1],
+        "article_url": row[2],
+        "state": row[3],
+        "priority": row[4],
+        "attempts": row[5],
+        "max_attempts": row[6],
+        "run_after": row[7],
+        "last_error": row[8],
+        "created_at": row[9],
+        "updated_at": row[10]
+    }
+
+@timed_db
+def enqueue_job(kind, article_url, priority=0, conn=None):
+    """
+    Enqueue a job for article_url. A finished or failed job of the same kind is reset to pending;
+    a pending or running one is left as it is.
+    Pass conn to enqueue inside the caller's transaction.
+    """
+    own_conn = conn is None
+    if own_conn:
+        conn = sqlite3.connect(DB_PATH, timeout=30)
+
+    conn.execute("""
+        INSERT INTO jobs (kind, article_url, priority)
+        VALUES (?, ?, ?)
+        ON CONFLICT (kind, article_url) DO UPDATE SET
+            state = 'pending',
+            priority = excluded.priority,
+            attempts = 0,
+            run_after = CURRENT_TIMESTAMP,
+            last_error = NULL,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE jobs.state IN ('done', 'failed')
+    """, (kind, article_url, priority))
+
+    if own_conn:
+        conn.commit()
+        conn.close()
+
+@timed_db
+def claim_next_job(stale_after_seconds=600):
+    """
+    Atomically take the next runnable job and mark it running.
+    Running jobs whose worker stopped heartbeating (heartbeat_job) for stale_after_seconds are
+    picked up again, or marked failed if they already used up max_attempts
+    (e.g. a job that keeps killing its worker).
+    Returns the job dict or None.
+    """
+    stale = f"-{int(stale_after_seconds)} seconds"
+    conn = sqlite3.connect(DB_PATH, timeout=30, isolation_level=None)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute("""
+            UPDATE jobs SET state = 'failed', locked_at = NULL,
+                last_error = 'worker stopped heartbeating', updated_at = CURRENT_TIMESTAMP
+            WHERE state = 'running' AND locked_at < datetime('now', ?) AND attempts >= max_attempts
+        """, (stale,))
+        row = conn.execute(f"""
+            SELECT {JOB_COLUMNS} FROM jobs
+            WHERE (state = 'pending' AND run_after <= CURRENT_TIMESTAMP)
+               OR (state = 'running' AND locked_at < datetime('now', ?) AND attempts < max_attempts)
+            ORDER BY priority DESC, id ASC
+            LIMIT 1
+        """, (stale,)).fetchone()
+
+        if not row:
+            conn.execute("COMMIT")
+            return None
+
+        conn.execute("""
+            UPDATE jobs SET state = 'running', attempts = attempts + 1,
+                locked_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+        """, (row[0],))
+        conn.execute("COMMIT")
+
+        job = _job_row_to_dict(row)
+        job["state"] = "running"
+        job["attempts"] += 1
+        return job
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
+
+@timed_db
+def heartbeat_job(job_id):
+    """Refresh locked_at of a running job so it is not treated as abandoned."""
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    conn.execute(
+        "UPDATE jobs SET locked_at = CURRENT_TIMESTAMP WHERE id = ? AND state = 'running'",
+        (job_id,)
+    )
+    conn.commit()
+    conn.close()
+
+@timed_db
+def complete_job(job_id):
+    """Mark a job as done."""
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    conn.execute(
+        "UPDATE jobs SET state = 'done', locked_at = NULL, last_error = NULL, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+        (job_id,)
+    )
+    conn.commit()
+    conn.close()
+
+@timed_db
+def fail_job(job_id, error, retry_delay_seconds):
+    """
+    Record a job failure. The job goes back to pending after retry_delay_seconds,
+    or to failed once it has used up max_attempts.
+    """
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    conn.execute("""
+        UPDATE jobs SET
+            state = CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'pending' END,
+            run_after = datetime('now', ?),
+            locked_at = NULL,
+            last_error = ?,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE id = ?
+    """, (f"+{int(retry_delay_seconds)} seconds", str(error)[:500], job_id))
+    conn.commit()
+    conn.close()
+
+@timed_db
+def defer_job(job_id, reason, delay_seconds):
+    """
+    Put a running job back to pending after delay_seconds without using up an attempt
+    (e.g. the LLM budget is exhausted - the job did not fail).
+    """
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    conn.execute("""
+        UPDATE jobs SET
+            state = 'pending',
+            attempts = MAX(attempts - 1, 0),
+            run_after = datetime('now', ?),
+            locked_at = NULL,
+            last_error = ?,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE id = ?
+    """, (f"+{int(delay_seconds)} seconds", str(reason)[:500], job_id))
+    conn.commit()
+    conn.close()
+
+@timed_db
+def retry_job(job_id):
+    """Reset a job to pending so it runs again right away. Returns False if the job does not exist."""
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    cur = conn.execute("""
+        UPDATE jobs SET state = 'pending', attempts = 0, run_after = CURRENT_TIMESTAMP,
+            locked_at = NULL, last_error = NULL, updated_at = CURRENT_TIMESTAMP
+        WHERE id = ? AND state != 'running'
+    """, (job_id,))
+    updated = cur.rowcount == 1
+    conn.commit()
+    conn.close()
+    return updated
+
+@timed_db
+def get_job(job_id):
+    """Get a single job by id."""
+    conn = sqlite3.connect(DB_PATH)
+    row = conn.execute(f"SELECT {JOB_COLUMNS} FROM jobs WHERE id = ?", (job_id,)).fetchone()
+    conn.close()
+    return _job_row_to_dict(row) if row else None
+
+@timed_db
+def get_jobs(state=None, limit=50):
+    """Get jobs, most recently updated first, optionally filtered by state."""
+    conn = sqlite3.connect(DB_PATH)
+    if state:
+        rows = conn.execute(
+            f"SELECT {JOB_COLUMNS} FROM jobs WHERE state = ? ORDER BY updated_at DESC, id DESC LIMIT ?",
+            (state, limit)
+        ).fetchall()
+    else:
+        rows = conn.execute(
+            f"SELECT {JOB_COLUMNS} FROM jobs ORDER BY updated_at DESC, id DESC LIMIT ?",
+            (limit,)
+        ).fetchall()
+    conn.close()
+    return [_job_row_to_dict(row) for row in rows]
+
+@timed_db
+def get_job_counts():
+    """Get number of jobs per state."""
+    conn = sqlite3.connect(DB_PATH)
+    rows = conn.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state").fetchall()
+    conn.close()
+
+    counts = {"pending": 0, "running": 0, "done": 0, "failed": 0}
+    counts.update({row[0]: row[1] for row in rows})
+    return counts
+
+@timed_db
+def get_articles_needing_embeddings(model, limit=100):
+    """
+    Get articles without an embedding for model, or whose summary was written after the embedding.
+    Returns list of dicts with url, title and summary (None if not summarized).
+    """
+    conn = sqlite3.connect(DB_PATH)
+    rows = conn.execute("""
+        SELECT p.url, p.title, s.summary
+        FROM posts p
+        LEFT JOIN article_summaries s ON s.article_url = p.url
+        LEFT JOIN article_embeddings e ON e.article_url = p.url AND e.model = ?
+        WHERE e.id IS NULL OR (s.created_at IS NOT NULL AND s.created_at > e.updated_at)
+        ORDER BY COALESCE(p.published_at, p.created_at) DESC
+        LIMIT ?
+    """, (model, limit)).fetchall()
+    conn.close()
+
+    return [{"url": row[0], "title": row[1] or "", "summary": row[2]} for row in rows]
+
+@timed_db
+def save_article_embeddings(model, embeddings):
+    """
+    Save embeddings for articles.
+    embeddings should be list of tuples: (article_url, dim, vector_bytes)
+    """
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    conn.executemany("""
+        INSERT OR REPLACE INTO article_embeddings (article_url, model, dim, vector, updated_at)
+        VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+    """, [(url, model, dim, vector) for url, dim, vector in embeddings])
+    conn.commit()
+    conn.close()
+
+@timed_db
+def get_article_embeddings(model, after_id=0):
+    """
+    Get embeddings for model with id greater than after_id, in id order.
+    Returns list of tuples: (id, article_url, dim, vector_bytes)
+    """
+    conn = sqlite3.connect(DB_PATH)
+    rows = conn.execute(
+        "SELECT id, article_url, dim, vector FROM article_embeddings WHERE model = ? AND id > ? ORDER BY id",
+        (model, after_id)
+    ).fetchall()
+    conn.close()
+    return rows
+
+@timed_db
+def get_keyword_corpus(after_rowid=0, after_summary_id=0):
+    """
+    Get url, title and summary of articles for keyword ranking: those added after posts rowid after_rowid
+    or whose summary was saved after article_summaries id after_summary_id (defaults: every article).
+    Each row also carries its rowid and summary_id so the caller can fetch only newer rows next time.
+    """
+    conn = sqlite3.connect(DB_PATH)
+    # 요약은 INSERT OR REPLACE로 저장되어 다시 쓸 때마다 id가 커지므로 id로 변경분을 찾을 수 있다
+    rows = conn.execute("""
+        SELECT p.rowid, p.url, p.title, s.id, s.summary
+        FROM posts p
+        LEFT JOIN article_summaries s ON s.article_url = p.url
+        WHERE p.rowid > ?
+        UNION
+        SELECT p.rowid, p.url, p.title, s.id, s.summary
+        FROM article_summaries s
+        JOIN posts p ON p.url = s.article_url
+        WHERE s.id > ?
+    """, (after_rowid, after_summary_id)).fetchall()
+    conn.close()
+
+    return [
+        {"rowid": row[0], "url": row[1], "title": row[2] or "", "summary_id": row[3], "summary": row[4]}
+        for row in rows
+    ]
+
+@timed_db
+def get_corpus_version():
+    """Cheap fingerprint that changes whenever an article or summary is added or rewritten."""
+    conn = sqlite3.connect(DB_PATH)
+    row = conn.execute("""
+        SELECT (SELECT COUNT(*) FROM posts), (SELECT MAX(created_at) FROM posts),
+               (SELECT COUNT(*) FROM article_summaries), (SELECT MAX(id) FROM article_summaries)
+    """).fetchone()
+    conn.close()
+    return tuple(row)
+
+CRAWL_RUN_STATS = (
+    "pages_fetched", "articles_fetched", "bytes_downloaded", "new_articles", "errors",
+    "listing_fetch_ms", "article_fetch_ms", "parse_ms", "db_write_ms"
+)
+CRAWL_RUN_COLUMNS = "id, kind, source, status, started_at, finished_at, duration_ms, " + ", ".join(CRAWL_RUN_STATS) + ", error_message"
+
+@timed_db
+def start_crawl_run(kind, source=None):
+    """Insert a running crawl_runs row and return its id."""
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    cur = conn.execute("INSERT INTO crawl_runs (kind, source) VALUES (?, ?)", (kind, source))
+    run_id = cur.lastrowid
+    conn.commit()
+    conn.close()
+    return run_id
+
+@timed_db
+def is_crawl_running(kinds=("check", "backfill"), max_age_seconds=3600):
+    """
+    True if any process has a crawl run of kinds in progress (status 'running').
+    Rows older than max_age_seconds are ignored (left behind by a process that died mid-run).
+    """
+    placeholders = ", ".join("?" * len(kinds))
+    conn = sqlite3.connect(DB_PATH)
+    row = conn.execute(
+        f"SELECT 1 FROM crawl_runs WHERE status = 'running' AND kind IN ({placeholders}) "
+        "AND started_at >= datetime('now', ?) LIMIT 1",
+        (*kinds, f"-{int(max_age_seconds)} seconds")
+    ).fetchone()
+    conn.close()
+    return row is not None
+
+@timed_db
+def finish_crawl_run(run_id, status, duration_ms, stats, error_message=None):
+    """Store the final counters and stage timings of a crawl run."""
+    assignments = ", ".join(f"{name} = ?" for name in CRAWL_RUN_STATS)
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    conn.execute(
+        f"UPDATE crawl_runs SET status = ?, finished_at = CURRENT_TIMESTAMP, duration_ms = ?, {assignments}, error_message = ? WHERE id = ?",
+        (status, duration_ms, *[stats.get(name, 0) for name in CRAWL_RUN_STATS], error_message, run_id)
+    )
+    conn.commit()
+    conn.close()
+
+@timed_db
+def get_crawl_runs(kind=None, limit=50, source=None):
+    """Get crawl runs, newest first, optionally filtered by kind and source."""
+    conditions, params = [], []
+    if kind:
+        conditions.append("kind = ?")
+        params.append(kind)
+    if source:
+        conditions.append("source = ?")
+        params.append(source)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    conn = sqlite3.connect(DB_PATH)
+    rows = conn.execute(
+        f"SELECT {CRAWL_RUN_COLUMNS} FROM crawl_runs {where} ORDER BY id DESC LIMIT ?",
+        (*params, limit)
+    ).fetchall()
+    conn.close()
+
+    names = [name.strip() for name in CRAWL_RUN_COLUMNS.split(",")]
+    return [dict(zip(names, row)) for row in rows]
+
+@timed_db
+def get_feed_state(url):
+    """Get the stored ETag/Last-Modified of a feed, or None if it was never fetched."""
+    conn = sqlite3.connect(DB_PATH)
+    row = conn.execute(
+        "SELECT url, etag, last_modified, last_status, item_count, checked_at FROM feed_state WHERE url = ?",
+        (url,)
+    ).fetchone()
+    conn.close()
+
+    if not row:
+        return None
+    return dict(zip(("url", "etag", "last_modified", "last_status", "item_count", "checked_at"), row))
+
+@timed_db
+def save_feed_state(url, etag, last_modified, status, item_count=0):
+    """Store the validators of the last feed response (keeps the old ones on 304)."""
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    conn.execute("""
+        INSERT INTO feed_state (url, etag, last_modified, last_status, item_count, checked_at)
+        VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+        ON CONFLICT(url) DO UPDATE SET
+            etag = COALESCE(excluded.etag, feed_state.etag),
+            last_modified = COALESCE(excluded.last_modified, feed_state.last_modified),
+            last_status = excluded.last_status,
+            item_count = excluded.item_count,
+            checked_at = CURRENT_TIMESTAMP
+    """, (url, etag, last_modified, status, item_count))
+    conn.commit()
+    conn.close()
+
+RECRAWL_CANDIDATE_COLUMNS = ("url", "title", "sort_date", "etag", "last_modified", "content_hash", "check_count")
+
+@timed_db
+def get_recrawl_candidates(now_ts, limit=10, first_check_after_seconds=21600):
+    """
+    Stored articles due for a re-crawl: next_check_at has passed, or never checked and stored
+    at least first_check_after_seconds ago. Due re-checks first (most overdue first), then
+    never-checked articles (newest first).
+    """
+    conn = sqlite3.connect(DB_PATH)
+    rows = conn.execute("""
+        SELECT p.url, p.title, COALESCE(p.published_at, p.created_at) AS sort_date,
+               c.etag, c.last_modified, c.content_hash, COALESCE(c.check_count, 0)
+        FROM posts p
+        LEFT JOIN article_checks c ON c.url = p.url
+        WHERE (c.url IS NULL AND p.created_at <= datetime(?, 'unixepoch'))
+           OR c.next_check_at <= ?
+        -- 기한이 된 재확인이 먼저 - 벌크 임포트 직후 오래된 기사의 첫 확인(기준값)이 예산을 모두 쓰지 않도록
+        ORDER BY c.url IS NULL, c.next_check_at, sort_date DESC
+        LIMIT ?
+    """, (now_ts - first_check_after_seconds, now_ts, limit)).fetchall()
+    conn.close()
+    return [dict(zip(RECRAWL_CANDIDATE_COLUMNS, row)) for row in rows]
+
+@timed_db
+def count_article_checks(since_ts):
+    """Number of re-crawl requests made at or after since_ts (one article_checks update each)."""
+    conn = sqlite3.connect(DB_PATH)
+    row = conn.execute("SELECT COUNT(*) FROM article_checks WHERE checked_at >= ?", (since_ts,)).fetchone()
+    conn.close()
+    return row[0]
+
+@timed_db
+def save_article_check(url, etag, last_modified, content_hash, checked_at, next_check_at, changed=False):
+    """Record a re-crawl of url (validators/hash kept when None, e.g. on 304)."""
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    conn.execute("""
+        INSERT INTO article_checks
+        (url, etag, last_modified, content_hash, checked_at, next_check_at, changed_at, check_count, change_count)
+        VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?)
+        ON CONFLICT(url) DO UPDATE SET
+            etag = COALESCE(excluded.etag, article_checks.etag),
+            last_modified = COALESCE(excluded.last_modified, article_checks.last_modified),
+            content_hash = COALESCE(excluded.content_hash, article_checks.content_hash),
+            checked_at = excluded.checked_at,
+            next_check_at = excluded.next_check_at,
+            changed_at = COALESCE(excluded.changed_at, article_checks.changed_at),
+            check_count = article_checks.check_count + 1,
+            change_count = article_checks.change_count + excluded.change_count
+    """, (url, etag, last_modified, content_hash, checked_at, next_check_at,
+          checked_at if changed else None, 1 if changed else 0))
+    conn.commit()
+    conn.close()
+
+@timed_db
+def apply_article_change(url, title=None):
+    """
+    Apply a detected article change: update posts.title (if given), mark its summary stale
+    and enqueue a low-priority resummarize job. Returns True if a summary was marked stale.
+    """
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    if title:
+        conn.execute("UPDATE posts SET title = ? WHERE url = ?", (title, url))
+    cur = conn.execute("UPDATE article_summaries SET stale = 1 WHERE article_url = ?", (url,))
+    stale = cur.rowcount == 1
+    if stale:
+        # 새 기사 요약(priority 0)보다 뒤에 처리
+        enqueue_job("resummarize", url, priority=-1, conn=conn)
+    conn.commit()
+    conn.close()
+    _article_cache.invalidate(url)
+    _invalidate_summary(url)
+    return stale
+
+LLM_USAGE_TOTAL_COLUMNS = ("requests", "prompt_tokens", "completion_tokens")
+
+@timed_db
+def record_llm_usage(backend, model, priority, article_url, prompt_tokens, completion_tokens, latency_ms, outcome):
+    """Append one LLM call to the usage ledger."""
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    conn.execute("""
+        INSERT INTO llm_usage
+        (created_at, backend, model, priority, article_url, prompt_tokens, completion_tokens, latency_ms, outcome)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, (time.time(), backend, model, priority, article_url, prompt_tokens, completion_tokens, latency_ms, outcome))
+    conn.commit()
+    conn.close()
+
+@timed_db
+def get_llm_usage_totals(since_ts):
+    """Requests and token sums of LLM calls made at or after since_ts (unix time)."""
+    conn = sqlite3.connect(DB_PATH)
+    row = conn.execute("""
+        SELECT COUNT(*), COALESCE(SUM(prompt_tokens), 0), COALESCE(SUM(completion_tokens), 0)
+        FROM llm_usage WHERE created_at >= ?
+    """, (since_ts,)).fetchone()
+    conn.close()
+    return dict(zip(LLM_USAGE_TOTAL_COLUMNS, row))
+
+@timed_db
+def get_llm_usage_entries(since_ts):
+    """(created_at, prompt_tokens + completion_tokens) of each LLM call at or after since_ts, oldest first."""
+    conn = sqlite3.connect(DB_PATH)
+    rows = conn.execute("""
+        SELECT created_at, prompt_tokens + completion_tokens
+        FROM llm_usage WHERE created_at >= ?
+        ORDER BY created_at
+    """, (since_ts,)).fetchall()
+    conn.close()
+    return rows
+
+@timed_db
+def get_llm_usage_breakdown(since_ts):
+    """Per-hour usage since since_ts grouped by model and priority, newest hour first."""
+    conn = sqlite3.connect(DB_PATH)
+    rows = conn.execute("""
+        SELECT strftime('%Y-%m-%d %H:00', created_at, 'unixepoch', 'localtime') AS hour, model, priority,
+               COUNT(*), COALESCE(SUM(prompt_tokens), 0), COALESCE(SUM(completion_tokens), 0),
+               ROUND(AVG(latency_ms), 1), SUM(outcome != 'ok')
+        FROM llm_usage WHERE created_at >= ?
+        GROUP BY hour, model, priority
+        ORDER BY hour DESC, model, priority
+    """, (since_ts,)).fetchall()
+    conn.close()
+    columns = ("hour", "model", "priority") + LLM_USAGE_TOTAL_COLUMNS + ("avg_latency_ms", "failures")
+    return [dict(zip(columns, row)) for row in rows]
+
+@timed_db
+def acquire_lease(name, owner, ttl_seconds):
+    """
+    Take or renew the named lease for ttl_seconds.
+    Succeeds if the lease is free, expired or already held by owner. Returns True if owner holds it.
+    """
+    now = time.time()
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    cur = conn.cursor()
+    cur.execute(
+        "INSERT OR IGNORE INTO leases (name, owner, acquired_at, expires_at) VALUES (?, ?, ?, ?)",
+        (name, owner, now, now + ttl_seconds)
+    )
+    if cur.rowcount != 1:
+        cur.execute("""
+            UPDATE leases
+            SET acquired_at = CASE WHEN owner = ? THEN acquired_at ELSE ? END,
+                owner = ?, expires_at = ?
+            WHERE name = ? AND (owner = ? OR expires_at < ?)
+        """, (owner, now, owner, now + ttl_seconds, name, owner, now))
+    acquired = cur.rowcount == 1
+    conn.commit()
+    conn.close()
+    return acquired
+
+@timed_db
+def release_lease(name, owner):
+    """Give up the named lease if owner holds it."""
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    conn.execute("DELETE FROM leases WHERE name = ? AND owner = ?", (name, owner))
+    conn.commit()
+    conn.close()
+
+@timed_db
+def get_lease(name):
+    """Current holder of the named lease, or None."""
+    conn = sqlite3.connect(DB_PATH)
+    row = conn.execute(
+        "SELECT name, owner, acquired_at, expires_at FROM leases WHERE name = ?", (name,)
+    ).fetchone()
+    conn.close()
+    return dict(zip(("name", "owner", "acquired_at", "expires_at"), row)) if row else None
+
+@timed_db
+def mark_snapshot_dirty():
+    """Ask the leader to regenerate static snapshots; repeated marks before it runs are coalesced."""
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    conn.execute("INSERT OR IGNORE INTO snapshot_dirty (id, marked_at) VALUES (1, ?)", (time.time(),))
+    conn.commit()
+    conn.close()
+
+@timed_db
+def take_snapshot_dirty():
+    """Clear the regenerate mark. Returns True if it was set (only one caller wins)."""
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    cur = conn.cursor()
+    cur.execute("DELETE FROM snapshot_dirty WHERE id = 1")
+    taken = cur.rowcount == 1
+    conn.commit()
+    conn.close()
+    return taken
+
+# 기사마다 HTTP 스크래핑을 하므로 timed_db로 감싸지 않음 (네트워크 시간이 DB 쿼리 지연으로 집계되지 않도록)
 def migrate_published_dates():
     """
     Migrate existing articles to add published_at dates.
@@ -276,4 +1507,6 @@ def migrate_published_dates():
 
     conn.commit()
     conn.close()
+    if updated_count:
+        _article_cache.invalidate()
     return updated_count
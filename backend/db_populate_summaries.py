@@ -7,8 +7,9 @@ OpenAI API를 사용하여 모든 기사에 고품질 요약과 키워드, 성
 
 import time
 import sys
-from db import get_all_links, save_article_summary, get_article_summary
-from summarizer import summarize_article
+import budget
+from db import get_all_links
+from summarizer import summarize_and_save
 
 def populate_all_summaries():
     """
@@ -27,31 +28,44 @@ def populate_all_summaries():
 
     processed_count = 0
     failed_count = 0
+    deferred_count = 0
 
     # 2. 각 기사별 실제 요약 생성 (기존 무시하고 항상 생성)
     for i, article in enumerate(articles, 1):
+        # 백필은 LLM 예산의 일부만 사용 - 넘으면 남은 기사는 다음 실행으로 미룸 (budget.py)
+        if not budget.allows("backfill"):
+            deferred_count = total_articles - i + 1
+            print(f"⏸️  LLM 예산 한도에 가까워 남은 {deferred_count}개 기사는 다음 실행으로 미룹니다.")
+            break
+
         print(f"[{i:2d}/{total_articles}] 처리 중: {article['title'][:50]}...")
 
         try:
             print(f"    🤖 실제 OpenAI 요약 생성 중...")
 
-            # 실제 OpenAI 요약 생성
-            summary_data = summarize_article(article['url'], article['title'])
-
-            if summary_data:
-                # 요약 데이터 저장 (덮어쓰기)
-                save_article_summary(
-                    article_url=article['url'],
-                    summary=summary_data['summary'],
-                    keywords=summary_data['keywords'],
-                    bible_verses=summary_data['bible_verses']
-                )
-                print(f"    ✅ 실제 요약 저장 완료")
+            # 실제 OpenAI 요약 생성 및 저장 (덮어쓰기)
+            # 같은 기사를 API에서 생성 중이면 그 결과를 기다려 공유
+            status, summary_data = summarize_and_save(article['url'], article['title'], force=True, priority="backfill")
+
+            if summary_data and summary_data.get("source") == "local":
+                # OpenAI를 쓸 수 없거나 예산 초과 - 저장되지 않은 로컬 추출 결과
+                print("    ⏸️  OpenAI 요약을 만들 수 없어 건너뜀")
+                failed_count += 1
+            elif summary_data:
+                if status == "joined":
+                    print("    ✅ 진행 중이던 요약 생성 결과 공유")
+                else:
+                    print("    ✅ 실제 요약 저장 완료")
                 processed_count += 1
             else:
                 print(f"    ❌ 요약 생성 실패")
                 failed_count += 1
 
+        except budget.BudgetExceededError:
+            # 확인 직후 다른 작업이 예산을 쓴 경우
+            deferred_count = total_articles - i + 1
+            print(f"⏸️  LLM 예산 한도에 도달해 남은 {deferred_count}개 기사는 다음 실행으로 미룹니다.")
+            break
         except Exception as e:
             print(f"    ❌ 요약 생성 중 오류: {str(e)}")
             failed_count += 1
@@ -66,6 +80,8 @@ def populate_all_summaries():
     print("📊 최종 결과:")
     print(f"  ✅ 성공적으로 요약된 기사: {processed_count}개")
     print(f"  ❌ 실패한 기사: {failed_count}개")
+    if deferred_count:
+        print(f"  ⏸️  예산 때문에 미룬 기사: {deferred_count}개")
     print(f"  📄 총 기사 수: {total_articles}개")
     print("=" * 50)
 
@@ -0,0 +1,209 @@
+"""
+기사 임베딩 및 관련 기사 검색
+
+기사마다 (제목 + 요약) 임베딩을 계산해 article_embeddings 테이블에 float32 BLOB으로 저장하고,
+메모리에는 정규화된 NumPy 행렬을 유지한다. 행렬은 첫 조회 때 로드되고 이후에는
+새로 저장된 행만 읽어 갱신하므로, 관련 기사 조회는 행렬-벡터 곱 한 번으로 끝난다.
+
+EMBEDDING_BACKEND
+- local: 문자 n-gram 해싱 기반의 결정적 임베딩 (네트워크/API 키 불필요, 오프라인 테스트용)
+- openai: OpenAI text-embedding-3-small
+기본값은 OPENAI_API_KEY가 있으면 openai, 없으면 local.
+
+임베딩 계산(sync_embeddings)은 요청 경로에서 하지 않는다 - 요약 작업 큐가 요약 저장 뒤에 실행하고,
+리더 프로세스가 EMBEDDING_SYNC_INTERVAL_SECONDS마다 남은 기사(API에서 바로 요약된 기사 등)를 채운다.
+"""
+
+import hashlib
+import os
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from db import get_articles_needing_embeddings, save_article_embeddings, get_article_embeddings
+
+EMBEDDING_DIM = int(os.getenv("EMBEDDING_DIM", "256"))
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND") or ("openai" if os.getenv("OPENAI_API_KEY") else "local")
+OPENAI_EMBEDDING_MODEL = "text-embedding-3-small"
+SYNC_BATCH_SIZE = 100
+SYNC_INTERVAL_SECONDS = float(os.getenv("EMBEDDING_SYNC_INTERVAL_SECONDS", "60"))  # 0이면 비활성화
+
+_stop_sync = threading.Event()
+_sync_thread: Optional[threading.Thread] = None
+
+def model_name() -> str:
+    """Identifier stored with each vector so vectors from different backends never mix."""
+    if EMBEDDING_BACKEND == "openai":
+        return f"{OPENAI_EMBEDDING_MODEL}:{EMBEDDING_DIM}"
+    return f"local-hash:{EMBEDDING_DIM}"
+
+def _local_embed(texts: List[str]) -> np.ndarray:
+    """
+    Deterministic embedding: hash character 2/3-grams into EMBEDDING_DIM buckets with a sign bit.
+    Uses blake2b rather than hash() so vectors are stable across processes.
+    """
+    vectors = np.zeros((len(texts), EMBEDDING_DIM), dtype=np.float32)
+    for row, text in enumerate(texts):
+        normalized = ' '.join(text.lower().split())
+        for n in (2, 3):
+            for i in range(len(normalized) - n + 1):
+                gram = normalized[i:i + n]
+                if gram.isspace():
+                    continue
+                digest = hashlib.blake2b(gram.encode('utf-8'), digest_size=8).digest()
+                value = int.from_bytes(digest, 'little')
+                vectors[row, value % EMBEDDING_DIM] += 1.0 if (value >> 63) else -1.0
+    return vectors
+
+_openai_client = None
+
+def _openai_embed(texts: List[str]) -> np.ndarray:
+    global _openai_client
+    if _openai_client is None:
+        from openai import OpenAI
+        _openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+    response = _openai_client.embeddings.create(
+        model=OPENAI_EMBEDDING_MODEL,
+        input=texts,
+        dimensions=EMBEDDING_DIM
+    )
+    return np.array([item.embedding for item in response.data], dtype=np.float32)
+
+def embed_texts(texts: List[str]) -> np.ndarray:
+    """Embed texts with the configured backend. Returns L2-normalized float32 matrix."""
+    if not texts:
+        return np.zeros((0, EMBEDDING_DIM), dtype=np.float32)
+    vectors = _openai_embed(texts) if EMBEDDING_BACKEND == "openai" else _local_embed(texts)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (vectors / norms).astype(np.float32)
+
+def article_text(title: str, summary: Optional[str]) -> str:
+    return f"{title}\n{summary}" if summary else title
+
+def sync_embeddings(limit: int = SYNC_BATCH_SIZE) -> int:
+    """
+    Embed articles that have no embedding yet or got a new summary since.
+    Returns number of embeddings written.
+    """
+    articles = get_articles_needing_embeddings(model_name(), limit=limit)
+    if not articles:
+        return 0
+
+    vectors = embed_texts([article_text(a["title"], a["summary"]) for a in articles])
+    save_article_embeddings(model_name(), [
+        (article["url"], EMBEDDING_DIM, vector.tobytes())
+        for article, vector in zip(articles, vectors)
+    ])
+    return len(articles)
+
+class EmbeddingIndex:
+    """In-memory cosine-similarity index over stored article embeddings."""
+
+    def __init__(self, model: str):
+        self.model = model
+        self._lock = threading.Lock()
+        self._matrix = np.zeros((0, EMBEDDING_DIM), dtype=np.float32)
+        self._size = 0
+        self._urls: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self._last_id = 0
+
+    def refresh(self):
+        """Load embedding rows written since the last refresh (all rows on first call)."""
+        rows = get_article_embeddings(self.model, after_id=self._last_id)
+        if not rows:
+            return
+
+        with self._lock:
+            for row_id, url, dim, blob in rows:
+                if dim != EMBEDDING_DIM:
+                    continue
+                vector = np.frombuffer(blob, dtype=np.float32)
+                position = self._positions.get(url)
+                if position is None:
+                    position = self._append(url)
+                self._matrix[position] = vector
+                self._last_id = max(self._last_id, row_id)
+
+    def _append(self, url: str) -> int:
+        # 용량을 두 배씩 늘려서 행 추가를 분할상환 O(1)로 유지
+        if self._size == self._matrix.shape[0]:
+            grown = np.zeros((max(64, self._size * 2), EMBEDDING_DIM), dtype=np.float32)
+            grown[:self._size] = self._matrix[:self._size]
+            self._matrix = grown
+        position = self._size
+        self._size += 1
+        self._urls.append(url)
+        self._positions[url] = position
+        return position
+
+    def related(self, url: str, k: int = 5) -> Optional[List[Dict]]:
+        """
+        Top-k most similar articles to url as [{"url", "score"}].
+        Returns None if url has no embedding.
+        """
+        with self._lock:
+            position = self._positions.get(url)
+            if position is None:
+                return None
+
+            matrix = self._matrix[:self._size]
+            scores = matrix @ matrix[position]
+            scores[position] = -np.inf
+
+            k = min(k, self._size - 1)
+            if k <= 0:
+                return []
+
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+            return [{"url": self._urls[i], "score": round(float(scores[i]), 4)} for i in top]
+
+_index: Optional[EmbeddingIndex] = None
+_index_lock = threading.Lock()
+
+def get_index() -> EmbeddingIndex:
+    """Lazily create the process-wide index."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = EmbeddingIndex(model_name())
+    return _index
+
+def find_related(url: str, k: int = 5) -> Optional[List[Dict]]:
+    """Pick up rows saved since the last call, then return top-k related articles (None if url has no embedding)."""
+    index = get_index()
+    index.refresh()
+    return index.related(url, k)
+
+def _sync_loop():
+    # 시작하자마자 한 번 채운 뒤 주기마다 반복 (새 프로세스가 첫 주기 동안 /related에 404를 내지 않도록)
+    while not _stop_sync.is_set():
+        try:
+            while sync_embeddings() == SYNC_BATCH_SIZE and not _stop_sync.is_set():
+                pass
+        except Exception as e:
+            print(f"임베딩 동기화 실패: {e}")
+        if _stop_sync.wait(SYNC_INTERVAL_SECONDS):
+            break
+
+def start_sync():
+    """Start the periodic background embedding sync (leader only; no-op if disabled or running)."""
+    global _sync_thread
+    if SYNC_INTERVAL_SECONDS <= 0 or _sync_thread is not None:
+        return
+    _stop_sync.clear()
+    _sync_thread = threading.Thread(target=_sync_loop, name="embedding-sync", daemon=True)
+    _sync_thread.start()
+
+def stop_sync(timeout: float = 5.0):
+    global _sync_thread
+    if _sync_thread is None:
+        return
+    _stop_sync.set()
+    _sync_thread.join(timeout)
+    _sync_thread = None
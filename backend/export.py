@@ -0,0 +1,98 @@
+"""
+기사 + 요약 전체 내보내기 (NDJSON / CSV)
+
+posts LEFT JOIN article_summaries를 rowid 순서로 EXPORT_BATCH_SIZE 행씩 읽어
+바로 직렬화하므로, 전체 기사 수와 관계없이 메모리는 한 배치만 사용한다.
+
+    GET /export?format=ndjson&since=2025-11-01&until=2025-11-30&summarized_only=true
+    python manage.py export --format csv --out articles.csv
+
+한 행의 필드는 db.EXPORT_COLUMNS 순서이며, 요약이 없는 기사는 요약 필드가 null(CSV는 빈 칸)이다.
+NDJSON의 keywords/bible_verses는 배열, CSV는 JSON 배열 문자열이다.
+"""
+
+import csv
+import io
+import json
+import os
+import re
+import sys
+from typing import Iterator, Optional
+
+from db import EXPORT_COLUMNS, iter_export_rows
+
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "500"))
+FORMATS = {
+    "ndjson": "application/x-ndjson; charset=utf-8",
+    "csv": "text/csv; charset=utf-8",
+}
+DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+def validate_filters(format: str, since: Optional[str], until: Optional[str]):
+    """Raise ValueError for an unknown format or a date that is not YYYY-MM-DD."""
+    if format not in FORMATS:
+        raise ValueError(f"지원하지 않는 형식: {format} (가능: {', '.join(FORMATS)})")
+    for name, value in (("since", since), ("until", until)):
+        if value and not DATE_PATTERN.fullmatch(value):
+            raise ValueError(f"{name}는 YYYY-MM-DD 형식이어야 합니다: {value}")
+
+def _decode_list(value: Optional[str]):
+    if value is None:
+        return None
+    try:
+        return json.loads(value) if value else []
+    except json.JSONDecodeError:
+        return []
+
+def _ndjson_batches(batches) -> Iterator[str]:
+    for rows in batches:
+        lines = []
+        for row in rows:
+            item = dict(zip(EXPORT_COLUMNS, row))
+            item["title"] = item["title"] or "제목 없음"
+            item["keywords"] = _decode_list(item["keywords"])
+            item["bible_verses"] = _decode_list(item["bible_verses"])
+            lines.append(json.dumps(item, ensure_ascii=False))
+        yield "\n".join(lines) + "\n"
+
+def _csv_batches(batches) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # Excel에서 한글이 깨지지 않도록 BOM을 붙인다
+    buffer.write("\ufeff")
+    writer.writerow(EXPORT_COLUMNS)
+    for rows in batches:
+        writer.writerows(rows)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    # 기사가 하나도 없어도 헤더는 내보낸다
+    if buffer.tell():
+        yield buffer.getvalue()
+
+def stream_export(format: str = "ndjson", since: Optional[str] = None, until: Optional[str] = None,
+                  summarized_only: bool = False, source: Optional[str] = None,
+                  batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[str]:
+    """Serialized export chunks (one per DB batch) for the given filters."""
+    validate_filters(format, since, until)
+    batches = iter_export_rows(batch_size=batch_size, since=since, until=until,
+                               summarized_only=summarized_only, source=source)
+    if format == "csv":
+        return _csv_batches(batches)
+    return _ndjson_batches(batches)
+
+def export_to_file(path: Optional[str], **options) -> int:
+    """Write the export to path ('-' or None = stdout). Returns the number of bytes written."""
+    written = 0
+    if path and path != "-":
+        # csv 모듈이 줄바꿈을 직접 쓰므로 newline=""
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            for chunk in stream_export(**options):
+                f.write(chunk)
+                written += len(chunk.encode("utf-8"))
+    else:
+        for chunk in stream_export(**options):
+            sys.stdout.write(chunk)
+            written += len(chunk.encode("utf-8"))
+        sys.stdout.flush()
+    return written
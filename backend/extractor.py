@@ -0,0 +1,225 @@
+"""
+LLM 없이 기사에서 성경 구절과 키워드를 추출하는 로컬 추출기
+
+- 성경 구절: 성경 66권의 한글 이름/약어를 하나의 컴파일된 정규식으로 찾아
+  "다니엘 6:10", "요한복음 3장 16절" 같은 표기를 "다니엘 6:10" 형식으로 정규화
+- 키워드: 저장된 기사(제목 + 요약) 전체를 말뭉치로 한 TF-IDF에서 기사별 상위 단어
+  (기사별 희소 단어 빈도 + 문서 빈도를 유지하고, 새 기사/요약이 저장되면 그 행만 읽어 갱신)
+
+요약 프롬프트에 힌트로 넘기거나, OpenAI를 쓸 수 없을 때 대신 사용한다.
+"""
+
+import heapq
+import math
+import re
+import threading
+from collections import Counter
+from typing import Dict, List, Optional
+
+# (정식 이름, 약어) - 약어는 개역개정 표기 기준
+BIBLE_BOOKS = [
+    ("창세기", "창"), ("출애굽기", "출"), ("레위기", "레"), ("민수기", "민"), ("신명기", "신"),
+    ("여호수아", "수"), ("사사기", "삿"), ("룻기", "룻"), ("사무엘상", "삼상"), ("사무엘하", "삼하"),
+    ("열왕기상", "왕상"), ("열왕기하", "왕하"), ("역대상", "대상"), ("역대하", "대하"), ("에스라", "스"),
+    ("느헤미야", "느"), ("에스더", "에"), ("욥기", "욥"), ("시편", "시"), ("잠언", "잠"),
+    ("전도서", "전"), ("아가", "아"), ("이사야", "사"), ("예레미야", "렘"), ("예레미야애가", "애"),
+    ("에스겔", "겔"), ("다니엘", "단"), ("호세아", "호"), ("요엘", "욜"), ("아모스", "암"),
+    ("오바댜", "옵"), ("요나", "욘"), ("미가", "미"), ("나훔", "나"), ("하박국", "합"),
+    ("스바냐", "습"), ("학개", "학"), ("스가랴", "슥"), ("말라기", "말"),
+    ("마태복음", "마"), ("마가복음", "막"), ("누가복음", "눅"), ("요한복음", "요"), ("사도행전", "행"),
+    ("로마서", "롬"), ("고린도전서", "고전"), ("고린도후서", "고후"), ("갈라디아서", "갈"), ("에베소서", "엡"),
+    ("빌립보서", "빌"), ("골로새서", "골"), ("데살로니가전서", "살전"), ("데살로니가후서", "살후"),
+    ("디모데전서", "딤전"), ("디모데후서", "딤후"), ("디도서", "딛"), ("빌레몬서", "몬"), ("히브리서", "히"),
+    ("야고보서", "약"), ("베드로전서", "벧전"), ("베드로후서", "벧후"), ("요한일서", "요일"),
+    ("요한이서", "요이"), ("요한삼서", "요삼"), ("유다서", "유"), ("요한계시록", "계"),
+]
+
+# 본문에서 흔히 쓰이는 다른 표기
+BOOK_ALIASES = {
+    "시": "시편", "계시록": "요한계시록", "룻": "룻기", "욥": "욥기", "애가": "예레미야애가",
+}
+
+_FULL_NAMES = {name: name for name, _ in BIBLE_BOOKS}
+_FULL_NAMES.update({name[:-1]: name for name, _ in BIBLE_BOOKS if name.endswith("서") and len(name) > 3})
+_FULL_NAMES.update({alias: name for alias, name in BOOK_ALIASES.items() if len(alias) > 1})
+_ABBREVIATIONS = {abbr: name for name, abbr in BIBLE_BOOKS}
+
+def _alternation(names) -> str:
+    # 긴 이름부터 시도해야 "요한일서"가 "요한"이나 "요"로 잘리지 않음
+    return "|".join(re.escape(name) for name in sorted(names, key=len, reverse=True))
+
+# 정식 이름: "요한복음 3:16", "요한복음 3장 16절", "요한복음 3장 16-18절", "시편 23편"
+_FULL_PATTERN = re.compile(
+    r"(?<![가-힣])(" + _alternation(_FULL_NAMES) + r")\s*(\d{1,3})\s*(?:[:장편]\s*(?:(\d{1,3})\s*절?)?)"
+    r"(?:\s*[-~]\s*(\d{1,3})\s*절?)?"
+)
+# 약어: 한 글자 약어는 일반 단어와 겹치므로 "단 6:10"처럼 장:절 형식만 인정
+_ABBR_PATTERN = re.compile(
+    r"(?<![가-힣])(" + _alternation(_ABBREVIATIONS) + r")\s*(\d{1,3}):(\d{1,3})(?:\s*[-~]\s*(\d{1,3}))?(?![\d가-힣])"
+)
+
+def _format_reference(book: str, chapter: str, verse: Optional[str], verse_end: Optional[str]) -> str:
+    if not verse:
+        return f"{book} {int(chapter)}장"
+    reference = f"{book} {int(chapter)}:{int(verse)}"
+    if verse_end and int(verse_end) > int(verse):
+        reference += f"-{int(verse_end)}"
+    return reference
+
+def extract_bible_references(text: str, limit: int = 10) -> List[str]:
+    """
+    Find Bible references in text, normalized to "책이름 장:절" with full book names.
+    Returns unique references in order of first appearance.
+    """
+    if not text:
+        return []
+
+    found = []
+    for pattern, books in ((_FULL_PATTERN, _FULL_NAMES), (_ABBR_PATTERN, _ABBREVIATIONS)):
+        for match in pattern.finditer(text):
+            book, chapter, verse, verse_end = match.groups()
+            found.append((match.start(), _format_reference(books[book], chapter, verse, verse_end)))
+
+    references = []
+    for _, reference in sorted(found):
+        if reference not in references:
+            references.append(reference)
+    return references[:limit]
+
+# 키워드 추출용 토큰화
+_TOKEN_PATTERN = re.compile(r"[가-힣A-Za-z0-9]+")
+_PARTICLES = (
+    "으로부터", "에게서", "으로서", "으로써", "이라는", "에서는", "에게는", "까지", "부터", "에서", "에게",
+    "으로", "이라", "라는", "처럼", "보다", "이다", "입니다", "했다", "한다", "하는", "하고", "하며",
+    "은", "는", "이", "가", "을", "를", "에", "의", "와", "과", "도", "로", "만", "며", "고",
+)
+STOPWORDS = {
+    "그리고", "그러나", "하지만", "그래서", "또한", "우리", "우리는", "우리가", "그것", "이것", "저것", "있는",
+    "없는", "있다", "없다", "것이", "것은", "것을", "대한", "통해", "위해", "함께", "모든", "가장", "바로",
+    "많은", "이번", "오늘", "기자", "목사", "말씀", "다니엘기도회", "다니엘", "기도회", "2025", "2024",
+}
+
+def tokenize(text: str) -> List[str]:
+    """Split Korean text into rough content words: strip trailing particles, drop stopwords and 1-char tokens."""
+    tokens = []
+    for token in _TOKEN_PATTERN.findall(text or ""):
+        for particle in _PARTICLES:
+            if token.endswith(particle) and len(token) - len(particle) >= 2:
+                token = token[:-len(particle)]
+                break
+        if len(token) >= 2 and token not in STOPWORDS and not token.isdigit():
+            tokens.append(token)
+    return tokens
+
+class KeywordRanker:
+    """
+    TF-IDF over a corpus of documents, kept as sparse per-document term counts.
+    Document frequencies are updated incrementally, so adding one article costs only its own terms.
+    """
+
+    def __init__(self, documents: Optional[Dict[str, str]] = None):
+        self._lock = threading.Lock()
+        self._counts: Dict[str, Counter] = {}
+        self._document_frequency: Counter = Counter()
+        if documents:
+            self.update(documents)
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def update(self, documents: Dict[str, str]):
+        """Add new documents or replace existing ones (e.g. after a new summary was saved)."""
+        tokenized = {key: Counter(tokenize(text)) for key, text in documents.items()}
+        with self._lock:
+            for key, counts in tokenized.items():
+                previous = self._counts.get(key)
+                if previous:
+                    for term in previous:
+                        self._document_frequency[term] -= 1
+                        if self._document_frequency[term] <= 0:
+                            del self._document_frequency[term]
+                self._counts[key] = counts
+                self._document_frequency.update(counts.keys())
+
+    def _idf(self, document_frequency: int) -> float:
+        return math.log((1 + len(self._counts)) / (1 + document_frequency)) + 1
+
+    def keywords_for(self, key: str, k: int = 5) -> List[str]:
+        """Top-k TF-IDF terms of a document in the corpus."""
+        with self._lock:
+            counts = self._counts.get(key)
+            if not counts:
+                return []
+            return self._top_terms(counts, lambda term: self._idf(self._document_frequency[term]), k)
+
+    def keywords_for_text(self, text: str, k: int = 5) -> List[str]:
+        """Top-k terms of an unseen text, weighted with the corpus IDF (unknown terms weigh like a term seen once)."""
+        counts = Counter(tokenize(text))
+        if not counts:
+            return []
+        with self._lock:
+            return self._top_terms(counts, lambda term: self._idf(self._document_frequency.get(term, 1)), k)
+
+    @staticmethod
+    def _top_terms(counts: Counter, idf, k: int) -> List[str]:
+        # 문서 길이로 정규화한 tf * idf - 동점이면 문서에 먼저 나온 단어 순
+        total = sum(counts.values())
+        top = heapq.nlargest(k, counts.items(), key=lambda item: (item[1] / total) * idf(item[0]))
+        return [term for term, _ in top]
+
+_ranker: Optional[KeywordRanker] = None
+_ranker_version = None
+_ranker_cursor = (0, 0)  # 마지막으로 읽은 (posts rowid, article_summaries id)
+_ranker_lock = threading.Lock()
+
+def get_ranker() -> KeywordRanker:
+    """
+    TF-IDF ranker over all stored articles (title + summary).
+    When an article or summary was added since the last call, only those rows are read and merged in;
+    the corpus is re-read in full only if it shrank (reset_database).
+    """
+    global _ranker, _ranker_version, _ranker_cursor
+    from db import get_keyword_corpus, get_corpus_version
+
+    version = get_corpus_version()
+    with _ranker_lock:
+        if _ranker is not None and version == _ranker_version:
+            return _ranker
+        if _ranker is None or (version[0] or 0) < len(_ranker):
+            _ranker = KeywordRanker()
+            _ranker_cursor = (0, 0)
+
+        rows = get_keyword_corpus(*_ranker_cursor)
+        _ranker.update({row["url"]: f"{row['title']}\n{row['summary'] or ''}" for row in rows})
+        _ranker_cursor = (
+            max([_ranker_cursor[0]] + [row["rowid"] for row in rows]),
+            max([_ranker_cursor[1]] + [row["summary_id"] for row in rows if row["summary_id"] is not None]),
+        )
+        _ranker_version = version
+        return _ranker
+
+def extract_keywords(article_url: Optional[str] = None, text: Optional[str] = None, k: int = 5) -> List[str]:
+    """Keywords for a stored article (by URL) or for arbitrary text such as scraped content."""
+    ranker = get_ranker()
+    if text:
+        return ranker.keywords_for_text(text, k)
+    if article_url:
+        return ranker.keywords_for(article_url, k)
+    return []
+
+def local_summary(content: str, max_chars: int = 300) -> str:
+    """Lead-sentence summary used when the LLM is unavailable."""
+    sentences = re.split(r"(?<=[.!?다])\s+", " ".join(content.split()))
+    summary = ""
+    for sentence in sentences:
+        if summary and len(summary) + len(sentence) + 1 > max_chars:
+            break
+        summary = f"{summary} {sentence}".strip()
+    return summary[:max_chars]
+
+def extract_hints(title: str, content: str) -> Dict[str, List[str]]:
+    """Locally extracted bible verses and keyword candidates for an article."""
+    return {
+        "bible_verses": extract_bible_references(f"{title}\n{content}"),
+        "keywords": extract_keywords(text=f"{title}\n{content}", k=8),
+    }
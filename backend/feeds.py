@@ -0,0 +1,200 @@
+"""
+RSS/Atom/뉴스 사이트맵 기반 새 기사 수집
+
+HTML 목록을 파싱하고 기사마다 작성일을 따로 가져오는 대신(1 + N 요청), 피드 하나에서
+URL/제목/작성일을 한 번에 읽는다.
+
+- 조건부 GET: 마지막 응답의 ETag/Last-Modified를 feed_state 테이블에 저장해 두고
+  If-None-Match/If-Modified-Since로 요청한다. 304면 파싱 없이 "변경 없음"으로 끝난다.
+- 스트리밍 파싱: 응답 본문을 ElementTree.iterparse로 읽으면서 항목 단위로 처리하고 버린다.
+- fallback: 피드에 작성일이 없는 항목만 기사 페이지에서 작성일을 가져오고, 피드 자체를
+  가져오거나 파싱할 수 없으면 기존 HTML 스크래핑(scraper.get_latest_links)을 사용한다.
+
+피드 주소는 소스별 feed_url (sources.py, 기본 소스는 FEED_URL 환경변수)이며,
+없으면 항상 HTML 스크래핑을 사용한다. 요청은 scraper의 공유 세션과 호스트별 요청 간격을 따른다.
+"""
+
+import os
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import List, Optional, Tuple
+
+import requests
+
+import crawlrun
+from db import get_feed_state, save_feed_state
+from metrics import SCRAPE_FETCH_DURATION, SCRAPE_FAILURES
+from scraper import SESSION, RATE_LIMITER, scrape_article_date, crawl_listing
+from sources import Source, get_source
+
+FEED_MAX_ITEMS = int(os.getenv("FEED_MAX_ITEMS", "50"))
+FEED_TIMEOUT_SECONDS = float(os.getenv("FEED_TIMEOUT_SECONDS", "10"))
+
+KST = timezone(timedelta(hours=9))
+
+# 항목 요소 (RSS item, Atom entry, 사이트맵 url)와 필드별 후보 태그 (네임스페이스 제외한 이름, 우선순위 순)
+ITEM_TAGS = {"item", "entry", "url"}
+TITLE_TAGS = ("title",)
+DATE_TAGS = ("publication_date", "pubDate", "published", "date", "updated", "lastmod")
+
+class FeedError(Exception):
+    """Feed could not be fetched or parsed; callers fall back to HTML scraping."""
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+def _normalize_date(value: Optional[str]) -> Optional[str]:
+    """RFC 822(RSS)와 ISO 8601(Atom/사이트맵) 날짜를 한국 시간 기준 YYYY-MM-DD로 변환"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return value[:10] if len(value) >= 10 and value[4] == "-" else None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(KST)
+    return parsed.strftime("%Y-%m-%d")
+
+def _parse_item(elem) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Return (url, title, published_at) of one item/entry/url element."""
+    fields = {}
+    link = None
+    for child in elem.iter():
+        name = _local_name(child.tag)
+        text = (child.text or "").strip()
+        if name == "link":
+            # RSS: <link>url</link>, Atom: <link rel="alternate" href="url"/>
+            href = child.get("href")
+            if href and child.get("rel", "alternate") == "alternate":
+                link = link or href
+            elif text:
+                link = link or text
+        elif name == "loc" and text:
+            link = link or text
+        elif text and name not in fields:
+            fields[name] = text
+
+    title = next((fields[tag] for tag in TITLE_TAGS if tag in fields), None)
+    published = next((fields[tag] for tag in DATE_TAGS if tag in fields), None)
+    if title:
+        title = " ".join(title.split())
+    return link, title, _normalize_date(published)
+
+class _CountingReader:
+    """File-like wrapper over the raw response that counts bytes read."""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        data = self.raw.read(size)
+        self.bytes_read += len(data)
+        return data
+
+def parse_feed(stream, news_url_marker: str, max_items: int = FEED_MAX_ITEMS) -> List[Tuple[str, Optional[str], Optional[str]]]:
+    """
+    Stream-parse RSS/Atom/sitemap XML into (url, title, published_at), keeping only URLs containing
+    news_url_marker and stopping after max_items.
+    """
+    items = []
+    parents = []
+    try:
+        for event, elem in ET.iterparse(stream, events=("start", "end")):
+            if event == "start":
+                parents.append(elem)
+                continue
+            parents.pop()
+            if _local_name(elem.tag) not in ITEM_TAGS:
+                continue
+            url, title, published_at = _parse_item(elem)
+            # 다 읽은 항목은 부모에서 떼어내 메모리에 쌓이지 않게 한다
+            elem.clear()
+            if parents:
+                parents[-1].remove(elem)
+            if url and news_url_marker in url:
+                items.append((url, title, published_at))
+                if len(items) >= max_items:
+                    break
+    except ET.ParseError as e:
+        raise FeedError(f"feed parse error: {e}") from e
+    return items
+
+def fetch_feed(source: Source) -> Optional[List[Tuple[str, Optional[str], Optional[str]]]]:
+    """
+    Conditional GET of the source's feed. Returns None when the server answers 304 Not Modified,
+    otherwise the parsed items. Raises FeedError on failure.
+    """
+    url = source.feed_url
+    state = get_feed_state(url) or {}
+    headers = {}
+    if state.get("etag"):
+        headers["If-None-Match"] = state["etag"]
+    if state.get("last_modified"):
+        headers["If-Modified-Since"] = state["last_modified"]
+
+    RATE_LIMITER.wait(url)
+    start = time.perf_counter()
+    reader = None
+    try:
+        response = SESSION.get(url, headers=headers, timeout=FEED_TIMEOUT_SECONDS, stream=True)
+        with response:
+            if response.status_code == 304:
+                save_feed_state(url, None, None, 304, 0)
+                return None
+            response.raise_for_status()
+            response.raw.decode_content = True
+            reader = _CountingReader(response.raw)
+            # 스트리밍이라 다운로드와 파싱이 겹치므로 전체를 fetch 시간으로 기록
+            items = parse_feed(reader, source.news_url_marker)
+    except requests.RequestException as e:
+        raise FeedError(f"feed fetch error: {e}") from e
+    finally:
+        elapsed = time.perf_counter() - start
+        SCRAPE_FETCH_DURATION.observe(elapsed, page_type="feed")
+        crawlrun.record_fetch("feed", elapsed, reader.bytes_read if reader else 0)
+
+    save_feed_state(url, response.headers.get("ETag"), response.headers.get("Last-Modified"),
+                    response.status_code, len(items))
+    return items
+
+def get_latest_links(source: Optional[Source] = None) -> Tuple[List[Tuple[str, str, str]], str]:
+    """
+    New-article candidates of a source as (url, title, published_at) plus how they were found:
+    "feed", "feed-not-modified" (304, nothing to do) or "html" (listing scraping).
+    """
+    source = source or get_source()
+    if not source.feed_url:
+        return crawl_listing(source), "html"
+
+    try:
+        items = fetch_feed(source)
+    except Exception as e:
+        SCRAPE_FAILURES.inc(page_type="feed")
+        crawlrun.record_error()
+        print(f"{source.name} 피드 수집 실패, HTML 스크래핑으로 대체: {e}")
+        return crawl_listing(source), "html"
+
+    if items is None:
+        return [], "feed-not-modified"
+    if not items:
+        print(f"{source.name} 피드에 기사가 없어 HTML 스크래핑으로 대체")
+        return crawl_listing(source), "html"
+
+    articles = []
+    seen = set()
+    for url, title, published_at in items:
+        if url in seen:
+            continue
+        seen.add(url)
+        # 피드에 작성일이 없는 항목만 기사 페이지에서 가져온다
+        if not published_at:
+            published_at = scrape_article_date(url)
+        articles.append((url, title or "제목 없음", published_at))
+    return articles, "feed"
@@ -0,0 +1,145 @@
+"""
+SQLite 기반 요약 작업 큐 워커
+
+save_new_links()가 새 기사마다 jobs 테이블에 요약 작업을 등록하면
+백그라운드 워커 스레드들이 큐를 비우면서 요약을 생성한다.
+실패한 작업은 지수 백오프로 재시도하고, max_attempts를 넘기면 failed로 남긴다.
+LLM 예산 초과(budget.BudgetExceededError)는 실패로 세지 않고 예산이 풀리는 시각으로 미룬다.
+실행 중인 작업은 JOB_HEARTBEAT_SECONDS마다 locked_at을 갱신하므로, 워커가 죽어서 갱신이
+JOB_STALE_SECONDS 동안 멈춘 작업만 다른 워커가 다시 가져간다.
+"""
+
+import os
+import threading
+from typing import Dict, List
+
+from budget import BudgetExceededError
+from db import claim_next_job, heartbeat_job, complete_job, fail_job, defer_job
+
+WORKER_COUNT = int(os.getenv("SUMMARY_WORKERS", "2"))
+POLL_INTERVAL_SECONDS = float(os.getenv("JOB_POLL_INTERVAL_SECONDS", "2"))
+RETRY_BASE_SECONDS = int(os.getenv("JOB_RETRY_BASE_SECONDS", "30"))
+RETRY_MAX_SECONDS = int(os.getenv("JOB_RETRY_MAX_SECONDS", "3600"))
+HEARTBEAT_SECONDS = float(os.getenv("JOB_HEARTBEAT_SECONDS", "60"))
+STALE_SECONDS = int(os.getenv("JOB_STALE_SECONDS", "600"))  # HEARTBEAT_SECONDS보다 충분히 길게
+
+_wakeup = threading.Event()
+# 풀마다 새 stop 이벤트를 쓴다 - stop_workers의 join 시간 안에 끝나지 않은 이전 풀의 워커가
+# 리더 재선출 뒤 start_workers에서 다시 살아나 새 풀과 나란히 도는 일이 없도록
+_stop = threading.Event()
+_workers: List[threading.Thread] = []
+
+def retry_delay(attempts: int) -> int:
+    """Exponential backoff: 30s, 60s, 120s, ... capped at RETRY_MAX_SECONDS."""
+    return min(RETRY_BASE_SECONDS * (2 ** max(attempts - 1, 0)), RETRY_MAX_SECONDS)
+
+def _summarize_job(job: Dict, force: bool, priority: str):
+    from db import get_article
+    from summarizer import summarize_and_save
+
+    article = get_article(job["article_url"])
+    if not article:
+        raise RuntimeError("기사를 찾을 수 없습니다.")
+
+    status, summary = summarize_and_save(article["url"], article["title"], force=force, priority=priority)
+    # 같은 기사를 생성 중이던 호출의 로컬 추출 결과는 "joined"로 전달되므로 source로 확인한다
+    if not summary or summary.get("source") == "local":
+        raise RuntimeError(f"요약 생성 실패 ({'local' if summary else status})")
+
+    # 새 요약으로 관련 기사 임베딩 갱신 (실패해도 요약 작업은 완료 처리)
+    try:
+        from embeddings import sync_embeddings
+        sync_embeddings()
+    except Exception as e:
+        print(f"임베딩 갱신 실패 {article['url']}: {e}")
+
+def _run_summarize(job: Dict):
+    # 새로 수집된 기사 - 예산이 빠듯하면 백필보다 먼저, 사용자 요청보다는 나중에
+    _summarize_job(job, force=False, priority="newest")
+
+def _run_resummarize(job: Dict):
+    # 재크롤링(recrawl.py)에서 본문 변경이 감지된 기사 - stale 요약을 덮어쓰기
+    _summarize_job(job, force=True, priority="backfill")
+
+HANDLERS = {
+    "summarize": _run_summarize,
+    "resummarize": _run_resummarize,
+}
+
+def _heartbeat(job_id: int, done: threading.Event):
+    while not done.wait(HEARTBEAT_SECONDS):
+        try:
+            heartbeat_job(job_id)
+        except Exception as e:
+            print(f"Job {job_id} heartbeat 실패: {e}")
+
+def run_job(job: Dict):
+    """Run a claimed job (heartbeating while it runs) and record its outcome."""
+    done = threading.Event()
+    threading.Thread(target=_heartbeat, args=(job["id"], done), name=f"job-heartbeat-{job['id']}", daemon=True).start()
+    try:
+        _run_job(job)
+    finally:
+        done.set()
+
+def _run_job(job: Dict):
+    handler = HANDLERS.get(job["kind"])
+    try:
+        if handler is None:
+            raise RuntimeError(f"알 수 없는 작업 종류: {job['kind']}")
+        handler(job)
+        complete_job(job["id"])
+    except BudgetExceededError as e:
+        # 시도 횟수를 쓰지 않으므로 예산이 몇 시간 막혀 있어도 작업이 failed로 버려지지 않는다
+        delay = max(int(e.retry_after) + 1, int(POLL_INTERVAL_SECONDS))
+        print(f"Job {job['id']} ({job['kind']}) LLM 예산 초과 - {delay}초 뒤로 미룸: {e}")
+        defer_job(job["id"], e, delay)
+    except Exception as e:
+        delay = retry_delay(job["attempts"])
+        print(f"Job {job['id']} ({job['kind']}) 실패 [{job['attempts']}/{job['max_attempts']}]: {e}")
+        fail_job(job["id"], e, delay)
+
+def _worker_loop(stop: threading.Event):
+    while not stop.is_set():
+        try:
+            job = claim_next_job(STALE_SECONDS)
+        except Exception as e:
+            print(f"Job claim 실패: {e}")
+            job = None
+
+        if job:
+            run_job(job)
+            continue
+
+        _wakeup.wait(POLL_INTERVAL_SECONDS)
+        _wakeup.clear()
+
+def notify():
+    """Wake idle workers right away, e.g. after new articles were enqueued."""
+    _wakeup.set()
+
+def start_workers(count: int = WORKER_COUNT):
+    """Start the background worker pool (no-op if already running or count is 0)."""
+    global _stop
+    if _workers or count <= 0:
+        return
+    _stop = threading.Event()
+    for i in range(count):
+        thread = threading.Thread(target=_worker_loop, args=(_stop,), name=f"job-worker-{i}", daemon=True)
+        thread.start()
+        _workers.append(thread)
+    print(f"🧵 요약 작업 워커 {count}개 시작")
+
+def stop_workers(timeout: float = 5.0):
+    """
+    Signal workers to stop and wait for them to finish their current job.
+    A worker still running a job after timeout exits once that job is done; it is never reused.
+    """
+    _stop.set()
+    _wakeup.set()
+    for thread in _workers:
+        thread.join(timeout)
+    still_running = sum(thread.is_alive() for thread in _workers)
+    if still_running:
+        print(f"🧵 요약 작업 워커 {still_running}개가 현재 작업을 마친 뒤 종료됨")
+    _workers.clear()
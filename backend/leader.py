@@ -0,0 +1,122 @@
+"""
+여러 워커/인스턴스 중 하나만 백그라운드 작업을 실행하도록 리더 선출
+
+`uvicorn api.index:app --workers N`이나 같은 디스크를 쓰는 여러 인스턴스에서는
+모든 프로세스가 읽기 요청을 처리하지만, 주기 크롤링, 요약 작업 큐 워커,
+RESET_DATABASE/RUN_BULK_IMPORT 유지보수는 leases 테이블의 lease를 가진 프로세스 하나만 실행한다.
+
+- lease는 LEADER_LEASE_TTL_SECONDS 동안 유효하고, 리더는 TTL의 1/3마다 갱신(heartbeat)한다
+- 리더가 죽거나 멈춰서 lease가 만료되면 다른 프로세스가 다음 heartbeat에 이어받는다
+- 갱신에 실패한 채 lease 만료가 다음 heartbeat 전으로 다가오면(TTL - TTL/3) 리더는 스스로 작업을
+  멈춘다 (lease가 만료되어 다른 프로세스가 이어받기 전에 - 두 리더가 겹치지 않도록)
+- LEADER_ELECTION=false 이면 선출 없이 모든 프로세스가 리더로 동작 (기존 동작)
+"""
+
+import os
+import socket
+import threading
+import time
+import uuid
+from typing import Callable, Dict, Optional
+
+from db import acquire_lease, release_lease, get_lease
+
+ENABLED = os.getenv("LEADER_ELECTION", "true") != "false"
+LEASE_NAME = "background"
+LEASE_TTL_SECONDS = float(os.getenv("LEADER_LEASE_TTL_SECONDS", "30"))
+HEARTBEAT_SECONDS = LEASE_TTL_SECONDS / 3
+
+# 같은 호스트의 재시작된 프로세스가 PID를 재사용해도 이전 lease를 자기 것으로 착각하지 않도록 uuid를 붙인다
+OWNER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+_lock = threading.Lock()
+_stop = threading.Event()
+_thread: Optional[threading.Thread] = None
+_is_leader = False
+_last_renewed = 0.0
+_on_elected: Optional[Callable[[], None]] = None
+_on_demoted: Optional[Callable[[], None]] = None
+
+def is_leader() -> bool:
+    return _is_leader
+
+def _set_leader(leader: bool):
+    global _is_leader
+    with _lock:
+        if leader == _is_leader:
+            return
+        _is_leader = leader
+    callback = _on_elected if leader else _on_demoted
+    print(f"👑 백그라운드 작업 리더 {'선출' if leader else '해제'}: {OWNER_ID}")
+    if callback:
+        try:
+            callback()
+        except Exception as e:
+            print(f"리더 {'시작' if leader else '정지'} 작업 실패: {e}")
+
+def _heartbeat() -> bool:
+    """Try to take or renew the lease once and update leadership. Returns is_leader()."""
+    global _last_renewed
+    # lease 만료 시각은 요청을 보내기 전 시각 기준으로 잡는다 (DB 대기 시간만큼 여유)
+    attempt_started = time.monotonic()
+    try:
+        acquired = acquire_lease(LEASE_NAME, OWNER_ID, LEASE_TTL_SECONDS)
+    except Exception as e:
+        print(f"lease 갱신 실패: {e}")
+        # DB가 잠깐 잠겨도 리더는 유지하되, 다음 heartbeat 전에 lease가 만료될 수 있으면 미리 내려온다
+        # (다른 프로세스는 만료 직후 이어받으므로 두 리더가 겹치지 않도록 한 주기만큼 일찍)
+        acquired = _is_leader and time.monotonic() - _last_renewed < LEASE_TTL_SECONDS - HEARTBEAT_SECONDS
+    else:
+        if acquired:
+            _last_renewed = attempt_started
+    _set_leader(acquired)
+    return acquired
+
+def _loop():
+    while not _stop.wait(HEARTBEAT_SECONDS):
+        _heartbeat()
+
+def start(on_elected: Callable[[], None], on_demoted: Callable[[], None]) -> bool:
+    """
+    Join the election. on_elected/on_demoted run whenever this process gains/loses the lease.
+    The first attempt is synchronous; returns whether this process is leader right now.
+    """
+    global _thread, _on_elected, _on_demoted
+    _on_elected = on_elected
+    _on_demoted = on_demoted
+    if not ENABLED:
+        _set_leader(True)
+        return True
+    if _thread is not None:
+        return _is_leader
+
+    _stop.clear()
+    # heartbeat를 먼저 시작해야 on_elected가 오래 걸려도(벌크 임포트 등) lease가 만료되지 않는다
+    _thread = threading.Thread(target=_loop, name="leader-heartbeat", daemon=True)
+    _thread.start()
+    return _heartbeat()
+
+def stop(timeout: float = 5.0):
+    """Leave the election: stop background work and release the lease so another process takes over now."""
+    global _thread
+    if _thread is not None:
+        _stop.set()
+        _thread.join(timeout)
+        _thread = None
+    was_leader = _is_leader
+    _set_leader(False)
+    if ENABLED and was_leader:
+        try:
+            release_lease(LEASE_NAME, OWNER_ID)
+        except Exception as e:
+            print(f"lease 반환 실패: {e}")
+
+def status() -> Dict:
+    """This process's role and the current lease holder."""
+    lease = get_lease(LEASE_NAME) if ENABLED else None
+    return {
+        "enabled": ENABLED,
+        "owner_id": OWNER_ID,
+        "is_leader": _is_leader,
+        "lease": lease,
+    }
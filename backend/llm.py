@@ -0,0 +1,236 @@
+"""
+요약용 LLM 백엔드
+
+LLM_BACKEND 환경변수로 선택:
+- openai: OpenAI Chat Completions (기본값, OPENAI_API_KEY 필요)
+- fake: 네트워크 없이 동작하는 결정적 가짜 백엔드. 지연시간, 오류율, 429 비율을 설정할 수 있어
+  요약 파이프라인의 동시성/재시도/처리량을 비용 없이 재현 가능하게 측정할 때 사용
+
+    LLM_FAKE_LATENCY_MS=800        응답 하나당 지연 (ms)
+    LLM_FAKE_LATENCY_JITTER_MS=200 지연 편차 (ms)
+    LLM_FAKE_ERROR_RATE=0.05       일반 오류(500) 비율
+    LLM_FAKE_RATE_LIMIT_RATE=0.1   429 비율
+    LLM_FAKE_SEED=42               난수 시드
+"""
+
+import json
+import os
+import random
+import re
+import threading
+import time
+from typing import Dict, Iterator, Optional, Tuple
+
+DEFAULT_MODEL = "gpt-4o-mini"
+
+try:
+    import tiktoken
+    _encoding = tiktoken.encoding_for_model(DEFAULT_MODEL)
+except Exception:
+    # tiktoken이 없으면 근사치 사용
+    _encoding = None
+
+def count_tokens(text: str) -> int:
+    """
+    Count tokens in text for the summarization model.
+    Falls back to an approximation (ASCII ~4 chars/token, Korean ~1 char/token)
+    when tiktoken is not installed.
+    """
+    if not text:
+        return 0
+    if _encoding is not None:
+        return len(_encoding.encode(text))
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return ascii_chars // 4 + (len(text) - ascii_chars) + 1
+
+class LLMError(Exception):
+    """A model call failed."""
+
+class LLMUnavailableError(LLMError):
+    """The model cannot be reached or is not authorized; callers may fall back to local extraction."""
+
+class LLMRateLimitError(LLMError):
+    """The model rejected the call with 429; retry after retry_after seconds if given."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class LLMBackend:
+    """Interface for chat-completion backends used by the summarizer."""
+
+    name = "base"
+
+    def chat(self, prompt: str, response_format: Optional[Dict] = None) -> Tuple[str, Dict]:
+        """Return (response text, {"prompt_tokens", "completion_tokens"})."""
+        raise NotImplementedError
+
+    def stream_chat(self, prompt: str, response_format: Optional[Dict] = None) -> Iterator[Tuple[str, Optional[Dict]]]:
+        """Yield (delta text, None) as tokens arrive, then ("", usage) once at the end."""
+        raise NotImplementedError
+
+class OpenAIBackend(LLMBackend):
+    name = "openai"
+
+    def __init__(self, api_key: str, model: str = DEFAULT_MODEL, temperature: float = 0.3):
+        from openai import OpenAI
+        self.client = OpenAI(api_key=api_key)
+        self.model = model
+        self.temperature = temperature
+
+    def _request(self, prompt: str, response_format: Optional[Dict], **kwargs):
+        import openai
+
+        if response_format:
+            kwargs["response_format"] = response_format
+        try:
+            return self.client.chat.completions.create(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=self.temperature,
+                **kwargs
+            )
+        except openai.RateLimitError as e:
+            retry_after = e.response.headers.get("retry-after") if getattr(e, "response", None) is not None else None
+            raise LLMRateLimitError(str(e), float(retry_after) if retry_after else None) from e
+        except (openai.APIConnectionError, openai.AuthenticationError) as e:
+            raise LLMUnavailableError(str(e)) from e
+        except openai.OpenAIError as e:
+            raise LLMError(str(e)) from e
+
+    def chat(self, prompt, response_format=None):
+        response = self._request(prompt, response_format)
+
+        text = ""
+        if response.choices and len(response.choices) > 0:
+            text = (response.choices[0].message.content or "").strip()
+
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            usage = {"prompt_tokens": usage.prompt_tokens, "completion_tokens": usage.completion_tokens}
+        else:
+            usage = {"prompt_tokens": count_tokens(prompt), "completion_tokens": count_tokens(text)}
+        return text, usage
+
+    def stream_chat(self, prompt, response_format=None):
+        stream = self._request(prompt, response_format, stream=True, stream_options={"include_usage": True})
+
+        parts = []
+        usage = None
+        for event in stream:
+            if event.choices:
+                delta = event.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    yield delta, None
+            if getattr(event, "usage", None) is not None:
+                usage = {"prompt_tokens": event.usage.prompt_tokens, "completion_tokens": event.usage.completion_tokens}
+
+        if usage is None:
+            usage = {"prompt_tokens": count_tokens(prompt), "completion_tokens": count_tokens(''.join(parts))}
+        yield "", usage
+
+class FakeBackend(LLMBackend):
+    """
+    Deterministic offline stand-in. Builds a summary from the prompt's 본문 section,
+    with configurable latency, error rate and 429 rate.
+    """
+
+    name = "fake"
+
+    def __init__(self, latency_ms: float = 500, latency_jitter_ms: float = 0, error_rate: float = 0.0,
+                 rate_limit_rate: float = 0.0, seed: Optional[int] = None):
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "FakeBackend":
+        seed = os.getenv("LLM_FAKE_SEED")
+        return cls(
+            latency_ms=float(os.getenv("LLM_FAKE_LATENCY_MS", "500")),
+            latency_jitter_ms=float(os.getenv("LLM_FAKE_LATENCY_JITTER_MS", "0")),
+            error_rate=float(os.getenv("LLM_FAKE_ERROR_RATE", "0")),
+            rate_limit_rate=float(os.getenv("LLM_FAKE_RATE_LIMIT_RATE", "0")),
+            seed=int(seed) if seed else None
+        )
+
+    def _roll(self) -> Tuple[float, float]:
+        with self._lock:
+            latency = self.latency_ms + self._random.uniform(-self.latency_jitter_ms, self.latency_jitter_ms)
+            return max(latency, 0) / 1000, self._random.random()
+
+    def _check_failure(self, roll: float):
+        if roll < self.rate_limit_rate:
+            raise LLMRateLimitError("fake backend: 429 Too Many Requests", retry_after=1.0)
+        if roll < self.rate_limit_rate + self.error_rate:
+            raise LLMError("fake backend: 500 Internal Server Error")
+
+    def _respond(self, prompt: str, response_format: Optional[Dict]) -> str:
+        body = prompt.split("본문:", 1)[-1]
+        body = body.split("응답은 다음 JSON", 1)[0]
+        text = ' '.join(body.split())
+
+        if not response_format:
+            return text[:300]
+
+        words = [w for w in re.findall(r"[가-힣A-Za-z]{2,}", text)]
+        keywords = list(dict.fromkeys(words))[:5]
+        return json.dumps({
+            "summary": text[:300],
+            "keywords": keywords,
+            "bible_verses": []
+        }, ensure_ascii=False)
+
+    def chat(self, prompt, response_format=None):
+        latency, roll = self._roll()
+        time.sleep(latency)
+        self._check_failure(roll)
+
+        text = self._respond(prompt, response_format)
+        return text, {"prompt_tokens": count_tokens(prompt), "completion_tokens": count_tokens(text)}
+
+    def stream_chat(self, prompt, response_format=None):
+        latency, roll = self._roll()
+        self._check_failure(roll)
+
+        text = self._respond(prompt, response_format)
+        pieces = [text[i:i + 8] for i in range(0, len(text), 8)] or [""]
+        for piece in pieces:
+            time.sleep(latency / len(pieces))
+            yield piece, None
+        yield "", {"prompt_tokens": count_tokens(prompt), "completion_tokens": count_tokens(text)}
+
+_backend: Optional[LLMBackend] = None
+_backend_loaded = False
+_backend_lock = threading.Lock()
+
+def create_backend(name: Optional[str] = None) -> Optional[LLMBackend]:
+    """Build the backend selected by name or LLM_BACKEND. Returns None if OpenAI has no API key."""
+    name = (name or os.getenv("LLM_BACKEND") or "openai").lower()
+    if name == "fake":
+        return FakeBackend.from_env()
+    if name == "openai":
+        api_key = os.getenv("OPENAI_API_KEY")
+        return OpenAIBackend(api_key) if api_key else None
+    raise ValueError(f"Unknown LLM_BACKEND: {name}")
+
+def get_backend() -> Optional[LLMBackend]:
+    """Process-wide backend, created on first use."""
+    global _backend, _backend_loaded
+    if not _backend_loaded:
+        with _backend_lock:
+            if not _backend_loaded:
+                _backend = create_backend()
+                _backend_loaded = True
+    return _backend
+
+def set_backend(backend: Optional[LLMBackend]):
+    """Replace the process-wide backend (benchmarks, scripts)."""
+    global _backend, _backend_loaded
+    with _backend_lock:
+        _backend = backend
+        _backend_loaded = True
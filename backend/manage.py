@@ -0,0 +1,135 @@
+"""
+1회성 유지보수 작업 CLI
+
+API 프로세스 import 시점에 하던 DB 리셋/bulk import 등을 별도 명령으로 실행한다.
+
+    python manage.py init-db
+    python manage.py reset-db [--bulk-import]
+    python manage.py bulk-import
+    python manage.py migrate-dates
+    python manage.py populate-summaries
+    python manage.py snapshot [--out DIR] [--pages N]
+    python manage.py recrawl [--limit N]
+    python manage.py export [--format ndjson|csv] [--out FILE] [--since YYYY-MM-DD] [--until YYYY-MM-DD] [--summarized-only]
+"""
+
+import argparse
+import os
+import sys
+
+def run_bulk_import():
+    print("🏗️ 1회성 bulk import 시작...")
+    try:
+        from bulk_import import import_page2_articles
+        count = import_page2_articles()
+        print(f"✅ {count}개 과거 기사 추가 완료!")
+    except Exception as e:
+        print(f"❌ Bulk import 실패: {e}")
+
+def run_reset(bulk_import: bool = False):
+    from db import reset_database
+
+    print("데이터베이스 완전 리셋 시작...")
+    try:
+        reset_database()
+        print("✅ 데이터베이스 리셋 완료!")
+    except Exception as e:
+        print(f"❌ 데이터베이스 리셋 실패: {e}")
+        return
+
+    if bulk_import:
+        run_bulk_import()
+
+def run_snapshot(out=None, pages=None):
+    import snapshots
+    try:
+        manifest = snapshots.generate(out, pages)
+        print(f"📸 스냅샷 {len(manifest['files'])}개 파일 생성: {out or snapshots.SNAPSHOT_DIR}")
+    except Exception as e:
+        print(f"❌ 스냅샷 생성 실패: {e}")
+
+def run_env_maintenance():
+    """
+    Run maintenance requested through RESET_DATABASE / RUN_BULK_IMPORT env vars.
+    Kept for existing deployments; prefer the CLI commands above.
+    """
+    if os.getenv("RESET_DATABASE") == "true":
+        print("🔄 환경변수 RESET_DATABASE=true 감지!")
+        run_reset(bulk_import=os.getenv("RUN_BULK_IMPORT") == "true")
+    elif os.getenv("RUN_BULK_IMPORT") == "true":
+        print("🏗️ 환경변수 RUN_BULK_IMPORT=true 감지!")
+        run_bulk_import()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="다니엘기도회 뉴스 유지보수 작업")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("init-db", help="테이블 생성 (이미 있으면 유지)")
+    reset_parser = subparsers.add_parser("reset-db", help="모든 테이블 삭제 후 재생성")
+    reset_parser.add_argument("--bulk-import", action="store_true", help="리셋 후 page 2 기사 가져오기")
+    subparsers.add_parser("bulk-import", help="page 2의 과거 기사 가져오기")
+    subparsers.add_parser("migrate-dates", help="작성일이 없는 기사의 작성일 채우기")
+    subparsers.add_parser("populate-summaries", help="저장된 기사 요약 일괄 생성 (덮어쓰기)")
+    snapshot_parser = subparsers.add_parser("snapshot", help="/latest, /stats, /summaries 정적 JSON 스냅샷 생성")
+    snapshot_parser.add_argument("--out", help="출력 디렉터리 (기본: SNAPSHOT_DIR)")
+    snapshot_parser.add_argument("--pages", type=int, help="/latest 페이지 수 (기본: SNAPSHOT_PAGES)")
+    recrawl_parser = subparsers.add_parser("recrawl", help="저장된 기사 중 확인할 때가 된 기사 재크롤링 (변경 감지)")
+    recrawl_parser.add_argument("--limit", type=int, default=10, help="최대 기사 수 (시간당 예산 안에서)")
+    export_parser = subparsers.add_parser("export", help="기사 + 요약 전체를 NDJSON/CSV로 내보내기")
+    export_parser.add_argument("--format", choices=("ndjson", "csv"), default="ndjson")
+    export_parser.add_argument("--out", help="출력 파일 (기본: 표준 출력)")
+    export_parser.add_argument("--since", help="작성일 시작 (YYYY-MM-DD, 포함)")
+    export_parser.add_argument("--until", help="작성일 끝 (YYYY-MM-DD, 포함)")
+    export_parser.add_argument("--summarized-only", action="store_true", help="요약이 있는 기사만")
+    export_parser.add_argument("--source", help="소스 이름 (sources.py)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "init-db":
+        from db import init_db
+        init_db()
+        print("✅ 데이터베이스 초기화 완료")
+    elif args.command == "reset-db":
+        run_reset(bulk_import=args.bulk_import)
+    elif args.command == "bulk-import":
+        from db import init_db
+        init_db()
+        run_bulk_import()
+        run_snapshot()
+    elif args.command == "migrate-dates":
+        from db import migrate_published_dates
+        from crawlrun import crawl_run
+        with crawl_run("migrate"):
+            updated_count = migrate_published_dates()
+        print(f"✅ {updated_count}개 기사의 작성일을 마이그레이션했습니다.")
+    elif args.command == "populate-summaries":
+        from db_populate_summaries import populate_all_summaries
+        processed, failed = populate_all_summaries()
+        run_snapshot()
+        return 1 if failed else 0
+    elif args.command == "snapshot":
+        run_snapshot(args.out, args.pages)
+    elif args.command == "recrawl":
+        from db import init_db
+        from crawlrun import crawl_run
+        import recrawl
+        init_db()
+        with crawl_run("recrawl"):
+            counts = recrawl.run_once(args.limit)
+        print(f"🔁 재크롤링 결과: {counts or '확인할 기사 없음 (또는 시간당 예산 소진)'}")
+    elif args.command == "export":
+        from db import init_db
+        from export import export_to_file
+        init_db()
+        try:
+            written = export_to_file(args.out, format=args.format, since=args.since, until=args.until,
+                                     summarized_only=args.summarized_only, source=args.source)
+        except ValueError as e:
+            print(f"❌ {e}", file=sys.stderr)
+            return 1
+        # 표준 출력으로 내보낼 때는 데이터와 섞이지 않도록 stderr에 기록
+        print(f"📦 {written:,} bytes 내보내기 완료", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
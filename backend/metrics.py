@@ -0,0 +1,169 @@
+"""
+Prometheus 텍스트 형식 메트릭
+
+외부 의존성 없이 Counter/Histogram만 구현한다. 관측 한 번은 perf_counter 호출,
+bisect, 락 한 번이면 끝나므로 크롤링/DB/LLM 핫패스에 넣어도 부담이 거의 없다.
+/metrics 엔드포인트가 render() 결과를 그대로 반환한다.
+"""
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Dict, List, Sequence, Tuple
+
+# 기본 버킷 (초): 1ms ~ 60s
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+TOKEN_BUCKETS = (100, 250, 500, 1000, 2000, 4000, 8000, 16000, 32000)
+
+_registry: List["_Metric"] = []
+_registry_lock = threading.Lock()
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(names: Sequence[str], values: Sequence, extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        with _registry_lock:
+            _registry.append(self)
+
+    def _key(self, labels: Dict) -> Tuple:
+        return tuple(labels.get(name, "") for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple, float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self):
+        lines = super().render()
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {value}")
+        return lines
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # key -> [bucket counts..., +Inf count], sum
+        self._values: Dict[Tuple, list] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][index] += 1
+            state[1] += value
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the duration of the with-block in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def render(self):
+        lines = super().render()
+        with self._lock:
+            items = [(key, list(state[0]), state[1]) for key, state in self._values.items()]
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                bucket_labels = _format_labels(self.labelnames, key, 'le="%s"' % bound)
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            cumulative += counts[-1]
+            bucket_labels = _format_labels(self.labelnames, key, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+def render() -> str:
+    """All registered metrics in Prometheus text exposition format."""
+    with _registry_lock:
+        metrics = list(_registry)
+    lines = []
+    for metric in metrics:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+# HTTP
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "API request latency by route", ("method", "route", "status"))
+
+# 스크래핑
+SCRAPE_FETCH_DURATION = Histogram(
+    "scrape_fetch_duration_seconds", "HTTP fetch time per scraped page type", ("page_type",))
+SCRAPE_PARSE_DURATION = Histogram(
+    "scrape_parse_duration_seconds", "HTML parse/extract time per scraped page type", ("page_type",))
+SCRAPE_FAILURES = Counter(
+    "scrape_failures_total", "Failed page fetches or parses", ("page_type",))
+SCRAPE_ARTICLE_DATES = Counter(
+    "scrape_article_dates_total", "Article date extractions (path: stream = stopped at <time datetime>, full = full parse)", ("path",))
+
+# DB
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds", "SQLite time per db.py function", ("function",))
+
+# LLM
+LLM_REQUEST_DURATION = Histogram(
+    "llm_request_duration_seconds", "LLM call latency", ("backend", "outcome"))
+LLM_TOKENS = Histogram(
+    "llm_tokens", "Tokens per LLM call", ("backend", "type"), buckets=TOKEN_BUCKETS)
+LLM_TOKENS_TOTAL = Counter(
+    "llm_tokens_total", "Total tokens used", ("backend", "type"))
+LLM_FAILURES = Counter(
+    "llm_failures_total", "Failed LLM calls", ("backend", "reason"))
+
+# 도메인 카운터
+NEW_ARTICLES = Counter("new_articles_total", "Newly stored articles")
+SUMMARY_REQUESTS = Counter(
+    "summary_requests_total", "summarize_and_save outcomes (existing = cache hit)", ("status",))
+SUMMARY_CACHE_HITS = Counter("summary_cache_hits_total", "Summarize requests answered by a stored summary (LLM skipped)")
+
+def timed_db(func):
+    """Decorator: record the wrapped db.py function's duration under its name."""
+    name = func.__name__
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            DB_QUERY_DURATION.observe(time.perf_counter() - start, function=name)
+
+    return wrapper
@@ -0,0 +1,158 @@
+"""
+요청 단위 프로파일링 (opt-in)
+
+ENABLE_PROFILING=true 일 때만 미들웨어가 등록되므로, 꺼져 있으면 비용이 전혀 없다.
+켜져 있을 때도 요청이 명시적으로 원할 때만 프로파일링한다:
+
+    curl -H "X-Profile: cprofile" https://.../latest      # cProfile -> .pstats
+    curl "https://.../check?profile=sample"               # 샘플링 -> .collapsed (flamegraph.pl / speedscope)
+
+PROFILE_TOKEN을 설정하면 프로파일링 요청과 /profiles 조회 모두 X-Profile-Token 헤더가 일치해야 한다.
+결과 파일은 PROFILE_DIR(기본: 임시 디렉터리/daniel-profiles)에 저장되고,
+응답의 X-Profile-File 헤더에 파일 이름이 담긴다. /profiles 에서 목록과 파일을 받을 수 있다.
+
+cProfile은 이벤트 루프 스레드만, 샘플링은 모든 스레드(스레드풀 포함)를 본다.
+두 방식 모두 같은 시간에 처리 중인 다른 요청이 섞일 수 있다.
+"""
+
+import cProfile
+import hmac
+import io
+import os
+import pstats
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from typing import Optional
+from urllib.parse import parse_qs
+
+ENABLED = os.getenv("ENABLE_PROFILING") == "true"
+PROFILE_DIR = os.getenv("PROFILE_DIR") or os.path.join(tempfile.gettempdir(), "daniel-profiles")
+PROFILE_TOKEN = os.getenv("PROFILE_TOKEN")
+SAMPLE_INTERVAL_SECONDS = float(os.getenv("PROFILE_SAMPLE_INTERVAL_MS", "5")) / 1000
+MODES = ("cprofile", "sample")
+
+class StackSampler:
+    """Sample every thread's Python stack at a fixed interval, collapsed for flamegraphs."""
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL_SECONDS):
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop.is_set():
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}:{frame.f_lineno}")
+                    frame = frame.f_back
+                self.stacks[";".join(reversed(stack))] += 1
+            time.sleep(self.interval)
+
+    def collapsed(self) -> str:
+        return "\n".join(f"{stack} {count}" for stack, count in self.stacks.most_common()) + "\n"
+
+def token_valid(token: Optional[str]) -> bool:
+    """True if PROFILE_TOKEN is unset or token matches it."""
+    if not PROFILE_TOKEN:
+        return True
+    return token is not None and hmac.compare_digest(token.encode(), PROFILE_TOKEN.encode())
+
+def _requested_mode(scope) -> Optional[str]:
+    headers = {key.decode("latin-1").lower(): value.decode("latin-1") for key, value in scope.get("headers", [])}
+    if not token_valid(headers.get("x-profile-token")):
+        return None
+
+    mode = headers.get("x-profile")
+    if not mode:
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        mode = (query.get("profile") or [None])[0]
+    if not mode:
+        return None
+    mode = mode.lower()
+    if mode in ("1", "true"):
+        return "cprofile"
+    return mode if mode in MODES else None
+
+def _profile_name(scope, mode: str) -> str:
+    path = scope.get("path", "/").strip("/").replace("/", "_")[:60] or "root"
+    extension = "pstats" if mode == "cprofile" else "collapsed"
+    return f"{time.strftime('%Y%m%d-%H%M%S')}-{int(time.time() * 1000) % 1000:03d}-{path}.{extension}"
+
+class ProfilingMiddleware:
+    """ASGI middleware that profiles single requests on demand."""
+
+    def __init__(self, app):
+        self.app = app
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+
+    async def __call__(self, scope, receive, send):
+        mode = _requested_mode(scope) if scope["type"] == "http" else None
+        if mode is None:
+            await self.app(scope, receive, send)
+            return
+
+        name = _profile_name(scope, mode)
+        start = time.perf_counter()
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"x-profile-file", name.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        if mode == "cprofile":
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                await self.app(scope, receive, send_with_headers)
+            finally:
+                profiler.disable()
+                profiler.dump_stats(os.path.join(PROFILE_DIR, name))
+        else:
+            sampler = StackSampler()
+            sampler.start()
+            try:
+                await self.app(scope, receive, send_with_headers)
+            finally:
+                sampler.stop()
+                with open(os.path.join(PROFILE_DIR, name), "w") as f:
+                    f.write(sampler.collapsed())
+
+        print(f"🔬 {scope.get('path')} 프로파일 저장: {name} ({(time.perf_counter() - start) * 1000:.1f}ms)")
+
+def list_profiles():
+    """Saved profile files, newest first."""
+    if not os.path.isdir(PROFILE_DIR):
+        return []
+    names = [n for n in os.listdir(PROFILE_DIR) if n.endswith((".pstats", ".collapsed"))]
+    return sorted(names, reverse=True)
+
+def profile_path(name: str) -> Optional[str]:
+    """Absolute path of a saved profile, or None if the name is unknown (no path traversal)."""
+    if name not in list_profiles():
+        return None
+    return os.path.join(PROFILE_DIR, name)
+
+def pstats_text(path: str, limit: int = 40) -> str:
+    """Top functions by cumulative time from a .pstats file."""
+    output = io.StringIO()
+    stats = pstats.Stats(path, stream=output)
+    stats.sort_stats("cumulative").print_stats(limit)
+    return output.getvalue()
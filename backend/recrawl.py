@@ -0,0 +1,164 @@
+"""
+저장된 기사 재크롤링 (변경 감지)
+
+posts에 저장된 기사를 나이에 따라 점점 드물게 다시 확인해서, 나중에 고쳐진 제목/본문을 반영한다.
+
+- 다음 확인 간격 = 기사 나이 × RECRAWL_AGE_FACTOR, RECRAWL_MIN_INTERVAL_HOURS ~ RECRAWL_MAX_INTERVAL_DAYS 사이
+  (예: 하루 된 기사는 6시간 뒤, 한 달 된 기사는 7.5일 뒤, 오래된 기사는 30일마다)
+- 조건부 GET(ETag/Last-Modified) - 304면 본문을 받지 않는다
+- 본문을 받으면 sha256(제목 + 본문)을 이전 값과 비교해서, 달라졌을 때만 posts.title을 고치고
+  요약을 stale로 표시한 뒤 낮은 우선순위의 resummarize 작업을 등록한다
+- 제목은 목록 파서와 같은 형태(scraper._parse_article_title)로 비교/저장한다
+- 첫 확인은 비교 대상이 없으므로 기준값만 저장한다 (해시 형식이 바뀐 이전 기준값도 다시 저장)
+- 기한이 된 재확인이 아직 확인하지 않은 기사의 첫 확인보다 먼저 예산을 쓴다
+- 요청 예산: 최근 1시간 재크롤링 요청이 RECRAWL_MAX_REQUESTS_PER_HOUR를 넘지 않고, 요청 사이 간격을
+  3600 / RECRAWL_MAX_REQUESTS_PER_HOUR 초 이상 둔다. 어느 프로세스에서든 새 기사 크롤링(crawl_runs의
+  running 행) 중에는 쉬고, 요청은 scraper의 호스트별 요청 간격도 함께 따른다
+
+RECRAWL_ENABLED=true 이면 리더 프로세스(leader.py)가 백그라운드로 실행한다.
+한 번만 실행하려면 `python manage.py recrawl --limit N`.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+import requests
+
+from db import get_recrawl_candidates, count_article_checks, save_article_check, apply_article_change
+
+ENABLED = os.getenv("RECRAWL_ENABLED") == "true"
+MAX_REQUESTS_PER_HOUR = int(os.getenv("RECRAWL_MAX_REQUESTS_PER_HOUR", "30"))
+AGE_FACTOR = float(os.getenv("RECRAWL_AGE_FACTOR", "0.25"))
+MIN_INTERVAL_SECONDS = float(os.getenv("RECRAWL_MIN_INTERVAL_HOURS", "6")) * 3600
+MAX_INTERVAL_SECONDS = float(os.getenv("RECRAWL_MAX_INTERVAL_DAYS", "30")) * 86400
+# 실패한 기사는 이만큼 뒤에 다시 시도
+RETRY_AFTER_ERROR_SECONDS = MIN_INTERVAL_SECONDS
+
+_stop = threading.Event()
+_thread: Optional[threading.Thread] = None
+
+def _article_age_seconds(sort_date: Optional[str], now: float) -> float:
+    try:
+        published = datetime.strptime((sort_date or "")[:10], "%Y-%m-%d").timestamp()
+    except ValueError:
+        return 0.0
+    return max(now - published, 0.0)
+
+def next_interval(age_seconds: float) -> float:
+    """Seconds until the next check of an article that is age_seconds old."""
+    return min(max(age_seconds * AGE_FACTOR, MIN_INTERVAL_SECONDS), MAX_INTERVAL_SECONDS)
+
+# 제목 정규화 방식이 바뀌면 올려서 이전 기준값을 변경으로 오인하지 않게 한다
+HASH_VERSION = "v2"
+
+def content_hash(title: Optional[str], content: Optional[str]) -> str:
+    digest = hashlib.sha256(f"{title or ''}\n{content or ''}".encode("utf-8")).hexdigest()
+    return f"{HASH_VERSION}:{digest}"
+
+def check_article(article: Dict, now: Optional[float] = None) -> str:
+    """
+    Re-crawl one candidate from db.get_recrawl_candidates and record the check.
+    Returns "not-modified" (304), "unchanged", "baseline" (first check), "changed" or "error".
+    """
+    from scraper import fetch_article_revision
+
+    now = now or time.time()
+    next_check_at = now + next_interval(_article_age_seconds(article["sort_date"], now))
+    url = article["url"]
+
+    try:
+        revision = fetch_article_revision(url, article["etag"], article["last_modified"])
+    except requests.RequestException as e:
+        print(f"재크롤링 실패 {url}: {e}")
+        save_article_check(url, None, None, None, now, now + RETRY_AFTER_ERROR_SECONDS)
+        return "error"
+
+    if revision is None:
+        save_article_check(url, None, None, None, now, next_check_at)
+        return "not-modified"
+
+    if not revision["content"]:
+        # 본문을 찾지 못한 페이지(구조 변경, 삭제 안내 등)로 기존 기사를 덮어쓰지 않는다
+        save_article_check(url, revision["etag"], revision["last_modified"], None, now, next_check_at)
+        return "unchanged"
+
+    digest = content_hash(revision["title"], revision["content"])
+    previous = article["content_hash"]
+    if previous and not previous.startswith(f"{HASH_VERSION}:"):
+        previous = None
+    changed = previous is not None and digest != previous
+    save_article_check(url, revision["etag"], revision["last_modified"], digest, now, next_check_at, changed)
+
+    if previous is None:
+        return "baseline"
+    if not changed:
+        return "unchanged"
+
+    title = revision["title"] if revision["title"] and revision["title"] != article["title"] else None
+    stale = apply_article_change(url, title)
+    print(f"🔁 기사 변경 감지: {url}" + (f" (제목: {title})" if title else "") + (" - 요약 재생성 예약" if stale else ""))
+    return "changed"
+
+def remaining_budget(now: Optional[float] = None) -> int:
+    """Re-crawl requests still allowed in the current rolling hour."""
+    now = now or time.time()
+    return max(MAX_REQUESTS_PER_HOUR - count_article_checks(now - 3600), 0)
+
+def _crawler_busy() -> bool:
+    # /check는 리더가 아닌 워커에서도 실행되므로 프로세스 안의 상태와 DB의 crawl_runs를 함께 본다
+    import crawler
+    from db import is_crawl_running
+    return crawler.is_crawling() or is_crawl_running()
+
+def run_once(limit: int = 10) -> Dict[str, int]:
+    """Check up to limit due articles within the hourly budget. Returns counts per result."""
+    counts: Dict[str, int] = {}
+    now = time.time()
+    limit = min(limit, remaining_budget(now))
+    if limit <= 0:
+        return counts
+
+    for article in get_recrawl_candidates(now, limit, MIN_INTERVAL_SECONDS):
+        if _crawler_busy() or _stop.is_set():
+            break
+        result = check_article(article)
+        counts[result] = counts.get(result, 0) + 1
+
+    if counts.get("changed"):
+        import jobqueue
+        import snapshots
+        jobqueue.notify()
+        snapshots.schedule()
+    return counts
+
+def _loop():
+    # 예산을 한 번에 쓰지 않고 한 시간에 고르게 나눈다
+    spacing = 3600 / MAX_REQUESTS_PER_HOUR
+    while not _stop.wait(spacing):
+        try:
+            if not _crawler_busy():
+                run_once(limit=1)
+        except Exception as e:
+            print(f"재크롤링 오류: {e}")
+
+def start():
+    """Start the background re-crawler (no-op unless RECRAWL_ENABLED=true or already running)."""
+    global _thread
+    if not ENABLED or MAX_REQUESTS_PER_HOUR <= 0 or _thread is not None:
+        return
+    _stop.clear()
+    _thread = threading.Thread(target=_loop, name="recrawl", daemon=True)
+    _thread.start()
+    print(f"🔁 재크롤링 시작 (시간당 최대 {MAX_REQUESTS_PER_HOUR}건)")
+
+def stop(timeout: float = 5.0):
+    global _thread
+    if _thread is None:
+        return
+    _stop.set()
+    _thread.join(timeout)
+    _thread = None
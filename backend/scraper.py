@@ -1,175 +1,337 @@
+import os
+import re
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import time
-from typing import List, Tuple
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
 
-URL = "https://www.christiantoday.co.kr/sections/pd_19"
+import crawlrun
+from metrics import SCRAPE_FETCH_DURATION, SCRAPE_PARSE_DURATION, SCRAPE_FAILURES, SCRAPE_ARTICLE_DATES
+from sources import Source, get_source
+
+URL = get_source().listing_url  # 기본 소스(pd_19) 목록 - 다른 섹션은 sources.py 레지스트리에 추가
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
 }
 
+# 모든 소스가 공유하는 커넥션 풀과 호스트별 요청 간격
+SCRAPER_POOL_SIZE = int(os.getenv("SCRAPER_POOL_SIZE", "10"))
+SCRAPER_MAX_RPS_PER_HOST = float(os.getenv("SCRAPER_MAX_RPS_PER_HOST", "5"))  # 0이면 제한 없음
+
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("http://", HTTPAdapter(pool_connections=SCRAPER_POOL_SIZE, pool_maxsize=SCRAPER_POOL_SIZE))
+SESSION.mount("https://", HTTPAdapter(pool_connections=SCRAPER_POOL_SIZE, pool_maxsize=SCRAPER_POOL_SIZE))
+
+class HostRateLimiter:
+    """Minimum spacing between requests to the same host, shared by all sources and threads."""
+
+    def __init__(self, max_rps: float):
+        self.interval = 1.0 / max_rps if max_rps > 0 else 0.0
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url: str):
+        if not self.interval:
+            return
+        host = url.split("://", 1)[-1].split("/", 1)[0]
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, 0.0))
+            self._next_slot[host] = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+RATE_LIMITER = HostRateLimiter(SCRAPER_MAX_RPS_PER_HOST)
+
+# 작성일 추출 시 기사 페이지를 이 크기 단위로 받으면서 <time datetime>을 찾는다
+ARTICLE_DATE_CHUNK_BYTES = int(os.getenv("ARTICLE_DATE_CHUNK_BYTES", "8192"))
+# 시작 태그 전체 (따옴표 안의 '>'나 '<time'은 속성 값으로 취급)
+TAG_PATTERN = re.compile(rb'<([a-zA-Z][^\s/>]*)((?:"[^"]*"|\'[^\']*\'|[^\'">])*)>')
+ATTR_PATTERN = re.compile(rb'([^\s=/>"\']+)(?:\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>"\']+)))?')
+# html.parser가 내용을 태그로 해석하지 않는 요소
+RAW_TEXT_END = {
+    b"script": re.compile(rb'</script\s*>', re.IGNORECASE),
+    b"style": re.compile(rb'</style\s*>', re.IGNORECASE),
+}
+
+def _fetch(url: str, page_type: str, timeout: int = 10, headers: Optional[Dict] = None) -> requests.Response:
+    """GET a page with the shared headers, recording fetch time under page_type."""
+    RATE_LIMITER.wait(url)
+    start = time.perf_counter()
+    response = None
+    try:
+        response = SESSION.get(url, timeout=timeout, headers=headers)
+    finally:
+        elapsed = time.perf_counter() - start
+        SCRAPE_FETCH_DURATION.observe(elapsed, page_type=page_type)
+        crawlrun.record_fetch(page_type, elapsed, len(response.content) if response is not None else 0)
+    response.raise_for_status()
+    response.encoding = 'utf-8'
+    return response
+
+@contextmanager
+def _parse_timer(page_type: str):
+    """Record parse time in the metrics and the current crawl run."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        SCRAPE_PARSE_DURATION.observe(elapsed, page_type=page_type)
+        crawlrun.record_parse(elapsed)
+
+def _record_failure(page_type: str):
+    SCRAPE_FAILURES.inc(page_type=page_type)
+    crawlrun.record_error()
+
+def _date_from_datetime_attr(datetime_str: str) -> str:
+    # ISO 8601 형식에서 날짜 부분만 추출 (2024-11-15T10:30:00+09:00 -> 2024-11-15)
+    if 'T' in datetime_str:
+        return datetime_str.split('T')[0]
+    return datetime_str
+
+def _parse_article_date(html: str) -> Optional[str]:
+    """기사 HTML에서 작성일(YYYY-MM-DD) 추출"""
+    soup = BeautifulSoup(html, 'html.parser')
+
+    # Christian Today의 작성일 표기 방식들:
+    # 1. <time datetime="2024-11-15T10:30:00+09:00">형식
+    # 2. 기사 메타 정보에서 날짜 찾기
+    # 3. <span class="date"> 또는 유사한 클래스
+
+    # 방법 1: <time> 태그에서 datetime 속성 찾기
+    time_element = soup.find('time', {'datetime': True})
+    if time_element and time_element.get('datetime'):
+        return _date_from_datetime_attr(time_element.get('datetime'))
+
+    # 방법 2: 날짜 관련 텍스트 찾기 (예: "2024-11-15", "2024.11.15" 등)
+    date_patterns = [
+        r'\d{4}-\d{2}-\d{2}',  # 2024-11-15
+        r'\d{4}\.\d{2}\.\d{2}',  # 2024.11.15
+    ]
+
+    text_content = soup.get_text()
+    for pattern in date_patterns:
+        matches = re.findall(pattern, text_content)
+        if matches:
+            # 첫 번째 매치를 표준 형식으로 변환
+            date_str = matches[0]
+            if '.' in date_str:
+                date_str = date_str.replace('.', '-')
+            return date_str
+
+    return None
+
+def _find_time_datetime(html: bytearray, pos: int = 0) -> Tuple[Optional[bytes], int]:
+    """
+    Scan html from pos for the first <time> start tag with a datetime attribute, skipping comments,
+    <script>/<style> contents and attribute values the way BeautifulSoup's html.parser does,
+    so the result matches soup.find('time', {'datetime': True}).
+    Returns (value, pos): value is the attribute value (b"" if empty) or None if not found yet,
+    pos is where to resume once more bytes have arrived.
+    """
+    while True:
+        start = html.find(b'<', pos)
+        if start < 0:
+            return None, len(html)
+        if html.startswith(b'<!--', start) or b'<!--'.startswith(html[start:start + 4]):
+            end = html.find(b'-->', start + 4)
+            if end < 0:
+                return None, start
+            pos = end + 3
+            continue
+        next_byte = html[start + 1:start + 2]
+        if not next_byte:
+            return None, start
+        if not next_byte.isalpha():
+            # 닫는 태그, <!DOCTYPE>, 본문의 '<' 등
+            pos = start + 1
+            continue
+        tag = TAG_PATTERN.match(html, start)
+        if tag is None:
+            # 태그가 청크 경계에서 잘림 - 다음 청크를 받은 뒤 다시 (끝까지 안 되면 전체 파싱)
+            return None, start
+        name = bytes(tag.group(1)).lower()
+        pos = tag.end()
+        if name == b'time':
+            for attr in ATTR_PATTERN.finditer(tag.group(2)):
+                if attr.group(1).lower() == b'datetime':
+                    return bytes(next((group for group in attr.groups()[1:] if group is not None), b'')), pos
+        elif name in RAW_TEXT_END:
+            end = RAW_TEXT_END[name].search(html, pos)
+            if end is None:
+                return None, start
+            pos = end.end()
+
+def _stream_article_date(article_url: str) -> Tuple[Optional[str], Optional[bytes]]:
+    """
+    Stream the article page and stop at the first <time datetime="..."> tag.
+    Returns (date, None) when found early, otherwise (None, full_body) for the full parse.
+    """
+    RATE_LIMITER.wait(article_url)
+    start = time.perf_counter()
+    received = 0
+    try:
+        with SESSION.get(article_url, timeout=10, stream=True) as response:
+            response.raise_for_status()
+            buffer = bytearray()
+            searching = True
+            scan_from = 0
+            for chunk in response.iter_content(chunk_size=ARTICLE_DATE_CHUNK_BYTES):
+                received += len(chunk)
+                buffer += chunk
+                if not searching:
+                    continue
+                # 청크 경계에 걸친 태그/주석은 scan_from부터 다시 검사
+                value, scan_from = _find_time_datetime(buffer, scan_from)
+                if value is not None:
+                    if value:
+                        # 나머지 본문은 받지 않고 연결을 닫는다
+                        return _date_from_datetime_attr(value.decode('utf-8', errors='replace')), None
+                    # 빈 datetime은 전체 파싱과 같은 규칙(본문 날짜 패턴)으로 처리
+                    searching = False
+            return None, bytes(buffer)
+    finally:
+        elapsed = time.perf_counter() - start
+        SCRAPE_FETCH_DURATION.observe(elapsed, page_type="article_date")
+        crawlrun.record_fetch("article_date", elapsed, received)
+
 def scrape_article_date(article_url: str) -> str:
     """
     개별 기사 페이지에서 작성일 추출
+    페이지를 스트리밍으로 받다가 <time datetime>을 찾으면 바로 멈추고,
+    끝까지 없을 때만 전체 HTML을 파싱한다.
     """
     try:
-        response = requests.get(article_url, headers=HEADERS, timeout=10)
-        response.raise_for_status()
-        response.encoding = 'utf-8'
-
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        # Christian Today의 작성일 표기 방식들:
-        # 1. <time datetime="2024-11-15T10:30:00+09:00">형식
-        # 2. 기사 메타 정보에서 날짜 찾기
-        # 3. <span class="date"> 또는 유사한 클래스
-
-        # 방법 1: <time> 태그에서 datetime 속성 찾기
-        time_element = soup.find('time', {'datetime': True})
-        if time_element and time_element.get('datetime'):
-            datetime_str = time_element.get('datetime')
-            # ISO 8601 형식에서 날짜 부분만 추출 (2024-11-15T10:30:00+09:00 -> 2024-11-15)
-            if 'T' in datetime_str:
-                return datetime_str.split('T')[0]
-            return datetime_str
-
-        # 방법 2: 날짜 관련 텍스트 찾기 (예: "2024-11-15", "2024.11.15" 등)
-        import re
-        date_patterns = [
-            r'\d{4}-\d{2}-\d{2}',  # 2024-11-15
-            r'\d{4}\.\d{2}\.\d{2}',  # 2024.11.15
-        ]
-
-        text_content = soup.get_text()
-        for pattern in date_patterns:
-            matches = re.findall(pattern, text_content)
-            if matches:
-                # 첫 번째 매치를 표준 형식으로 변환
-                date_str = matches[0]
-                if '.' in date_str:
-                    date_str = date_str.replace('.', '-')
-                return date_str
+        published_at, body = _stream_article_date(article_url)
+        if published_at:
+            SCRAPE_ARTICLE_DATES.inc(path="stream")
+            return published_at
 
-        return None
+        SCRAPE_ARTICLE_DATES.inc(path="full")
+        with _parse_timer("article_date"):
+            return _parse_article_date(body.decode('utf-8', errors='replace'))
 
     except Exception as e:
+        _record_failure("article_date")
         print(f"날짜 추출 실패 {article_url}: {e}")
         return None
 
-def get_latest_links() -> List[Tuple[str, str, str]]:
+def _clean_title(title: Optional[str]) -> str:
+    if not title or title == "...":
+        return "제목 없음"
+    title = title.replace('\n', ' ').replace('\r', ' ').strip()
+    # Remove extra whitespace
+    while '  ' in title:
+        title = title.replace('  ', ' ')
+    return title
+
+def _normalize_listing_date(text: str) -> Optional[str]:
+    match = re.search(r'\d{4}[-.]\d{2}[-.]\d{2}', text or "")
+    return match.group(0).replace('.', '-') if match else None
+
+def parse_listing(html: str, source: Source) -> List[Tuple[str, str, Optional[str]]]:
     """
-    Scrape the Christian Today Daniel Prayer section for article links and titles.
+    Parse a section listing page with the source's selectors.
     Handles two different HTML structures:
-    1. Latest news: article h2 a (most recent article)
-    2. Regular news: ul.l-list li a (other articles)
-    Returns list of tuples: (url, title)
+    1. Latest news: selectors["featured"] (most recent article)
+    2. Regular news: selectors["list_item"] (other articles)
+    Returns (url, title, listing_date) without duplicates, in page order.
+    listing_date is only filled for date_strategy "listing".
     """
+    soup = BeautifulSoup(html, 'html.parser')
+    selectors = source.selectors
+    link_contains = selectors["link_contains"]
+
+    def absolute(href):
+        return href if href.startswith('http') else f"{source.base_url}{href}"
+
+    articles = []
+
+    # Phase 1: Extract latest news - the most recent article featured prominently
+    for link in soup.select(selectors["featured"]):
+        href = link.get('href')
+        if href:
+            articles.append((absolute(href), _clean_title(link.get_text(strip=True)), None))
+
+    # Phase 2: Extract regular news from the list container
+    for li in soup.select(selectors["list_item"]):
+        # Find the news link within this li element
+        link = li.find('a', href=lambda x: x and link_contains in x)
+        if not link or not link.get('href'):
+            continue
+
+        # Try to extract title from the link first
+        title = link.get_text(strip=True)
+
+        # If no title in link, look for title in the li element
+        if not title or title == "...":
+            title_elem = li.find(['h3', 'h4', 'strong', 'b', '.title', '.headline'])
+            if title_elem:
+                title = title_elem.get_text(strip=True)
+            else:
+                # Look for any text content in the li that's not in other links
+                for other_link in li.find_all('a'):
+                    if other_link != link:
+                        other_link.extract()
+                li_text = li.get_text(separator=' ', strip=True)
+                if li_text and len(li_text) > 10:  # Reasonable title length
+                    title = li_text
+
+        listing_date = None
+        if source.date_strategy == "listing":
+            date_elem = li.select_one(selectors["date"])
+            listing_date = _normalize_listing_date(date_elem.get_text(strip=True)) if date_elem else None
+
+        articles.append((absolute(link['href']), _clean_title(title), listing_date))
+
+    # Only keep this site's news URLs, first occurrence wins
+    result = []
+    seen = set()
+    for url, title, listing_date in articles:
+        if source.news_url_marker in url and url not in seen:
+            seen.add(url)
+            result.append((url, title, listing_date))
+    return result
+
+def _with_dates(articles: List[Tuple[str, str, Optional[str]]], source: Source) -> List[Tuple[str, str, str]]:
+    """Apply the source's date strategy: fetch each article page unless the listing already had the date."""
+    if source.date_strategy == "none":
+        return articles
+    # article_page, feed(피드 실패 시 HTML fallback), listing(목록에 날짜가 없던 항목)
+    return [(url, title, listing_date or scrape_article_date(url)) for url, title, listing_date in articles]
+
+def crawl_listing(source: Optional[Source] = None, page_num: int = 1) -> List[Tuple[str, str, str]]:
+    """Crawl one listing page of a source into (url, title, published_at) tuples."""
+    source = source or get_source()
     try:
-        response = requests.get(URL, headers=HEADERS, timeout=10)
-        response.raise_for_status()
-        response.encoding = 'utf-8'
-
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        articles = []
-
-        # Phase 1: Extract latest news (article h2 a)
-        # This is the most recent article featured prominently
-        latest_news_links = soup.select('article h2 a[href*="/news/"]')
-        for link in latest_news_links:
-            href = link.get('href')
-            if href:
-                # Make sure it's a full URL
-                if href.startswith('http'):
-                    full_url = href
-                else:
-                    full_url = f"https://www.christiantoday.co.kr{href}"
-
-                # Extract title from the link text
-                title = link.get_text(strip=True)
-
-                # Clean up title
-                if title:
-                    title = title.replace('\n', ' ').replace('\r', ' ').strip()
-                    # Remove extra whitespace
-                    while '  ' in title:
-                        title = title.replace('  ', ' ')
-                else:
-                    title = "제목 없음"
-
-                # Only add if it's a valid Christian Today news URL
-                if 'christiantoday.co.kr/news/' in full_url:
-                    articles.append((full_url, title))
-
-        # Phase 2: Extract regular news from the specific list container
-        # Only from ul.l-list.w-divider.gap-md.no-bullet li elements
-        list_items = soup.select('ul.l-list.w-divider.gap-md.no-bullet li')
-
-        for li in list_items:
-            # Find the news link within this li element
-            link = li.find('a', href=lambda x: x and '/news/' in x)
-            if link:
-                href = link.get('href')
-                if href:
-                    # Make sure it's a full URL
-                    if href.startswith('http'):
-                        full_url = href
-                    else:
-                        full_url = f"https://www.christiantoday.co.kr{href}"
-
-                    # Try to extract title from the link first
-                    title = link.get_text(strip=True)
-
-                    # If no title in link, look for title in the li element
-                    if not title or title == "...":
-                        # Look for title in various places within the li
-                        title_elem = li.find(['h3', 'h4', 'strong', 'b', '.title', '.headline'])
-                        if title_elem:
-                            title = title_elem.get_text(strip=True)
-                        else:
-                            # Look for any text content in the li that's not in other links
-                            li_text = li.get_text(separator=' ', strip=True)
-                            # Remove other URLs from the text
-                            for other_link in li.find_all('a'):
-                                if other_link != link:
-                                    other_link.extract()
-                            li_text = li.get_text(separator=' ', strip=True)
-                            if li_text and len(li_text) > 10:  # Reasonable title length
-                                title = li_text
-
-                    # Clean up title
-                    if title and title not in ["...", ""]:
-                        title = title.replace('\n', ' ').replace('\r', ' ').strip()
-                        # Remove extra whitespace
-                        while '  ' in title:
-                            title = title.replace('  ', ' ')
-                    else:
-                        title = "제목 없음"
-
-                    # Only add if it's a valid Christian Today news URL
-                    if 'christiantoday.co.kr/news/' in full_url:
-                        articles.append((full_url, title))
+        response = _fetch(source.page(page_num), "listing")
+        with _parse_timer("listing"):
+            articles = parse_listing(response.text, source)
 
         # 기사별 작성일 추출 및 튜플 생성 (url, title, published_at)
-        articles_with_dates = []
-        seen = set()
-
-        for url, title in articles:
-            if url not in seen:
-                seen.add(url)
-                # 작성일 추출
-                published_at = scrape_article_date(url)
-                articles_with_dates.append((url, title, published_at))
-
-        return articles_with_dates
+        return _with_dates(articles, source)
 
     except requests.RequestException as e:
-        print(f"Error scraping website: {e}")
+        _record_failure("listing")
+        print(f"Error scraping {source.name} page {page_num}: {e}")
         return []
     except Exception as e:
-        print(f"Unexpected error during scraping: {e}")
+        _record_failure("listing")
+        print(f"Unexpected error during scraping {source.name} page {page_num}: {e}")
         return []
 
+def get_latest_links(source: Optional[Source] = None) -> List[Tuple[str, str, str]]:
+    """
+    Scrape the first listing page of a source (default: Christian Today Daniel Prayer section).
+    Returns list of tuples: (url, title, published_at)
+    """
+    return crawl_listing(source, 1)
+
 def test_scraper():
     """Test function to verify scraper is working."""
     print("Testing scraper...")
@@ -184,141 +346,115 @@ def test_scraper():
 
 
 
-def scrape_article_content(article_url):
-    """
-    Scrape the full content of an article from its URL.
-    Returns the article content text.
-    """
-    try:
-        response = requests.get(article_url, headers=HEADERS, timeout=15)
-        response.raise_for_status()
-        response.encoding = 'utf-8'
+def _parse_article_content(html: str) -> Optional[str]:
+    """기사 HTML에서 본문 텍스트 추출 (너무 짧으면 None)"""
+    soup = BeautifulSoup(html, 'html.parser')
 
-        soup = BeautifulSoup(response.text, 'html.parser')
+    # Find the article content div
+    content_div = soup.select_one('.article-content')
+    if not content_div:
+        return None
 
-        # Find the article content div
-        content_div = soup.select_one('.article-content')
-        if not content_div:
-            return None
+    # Extract text from the content div
+    # Remove script tags and other unwanted elements
+    for script in content_div.find_all('script'):
+        script.decompose()
+    for style in content_div.find_all('style'):
+        style.decompose()
 
-        # Extract text from the content div
-        # Remove script tags and other unwanted elements
-        for script in content_div.find_all('script'):
-            script.decompose()
-        for style in content_div.find_all('style'):
-            style.decompose()
+    # Get text content
+    content_text = content_div.get_text(separator='\n', strip=True)
 
-        # Get text content
-        content_text = content_div.get_text(separator='\n', strip=True)
+    # Clean up the text
+    lines = [line.strip() for line in content_text.split('\n') if line.strip()]
+    content_text = '\n'.join(lines)
 
-        # Clean up the text
-        lines = [line.strip() for line in content_text.split('\n') if line.strip()]
-        content_text = '\n'.join(lines)
+    return content_text if len(content_text) > 100 else None  # Minimum content length
 
-        return content_text if len(content_text) > 100 else None  # Minimum content length
+def scrape_article_content(article_url):
+    """
+    Scrape the full content of an article from its URL.
+    Returns the article content text.
+    """
+    try:
+        response = _fetch(article_url, "article_content", timeout=15)
+        with _parse_timer("article_content"):
+            return _parse_article_content(response.text)
 
     except requests.RequestException as e:
+        _record_failure("article_content")
         print(f"Error scraping article {article_url}: {e}")
         return None
     except Exception as e:
+        _record_failure("article_content")
         print(f"Unexpected error scraping article {article_url}: {e}")
         return None
 
-def get_articles_from_page(page_num=2) -> List[Tuple[str, str, str]]:
+# og:title/<title> 끝에 붙는 사이트 이름 (og:site_name이 없을 때)
+SITE_TITLE_SUFFIXES = ("크리스천투데이", "Christian Today", "christiantoday.co.kr")
+
+def _strip_site_suffix(title: str, site_names) -> str:
+    for name in site_names:
+        stripped = re.sub(rf'\s*[-|:·–—]+\s*{re.escape(name)}\s*$', '', title, flags=re.IGNORECASE)
+        if stripped and stripped != title:
+            return stripped
+    return title
+
+def _parse_article_title(html: str) -> Optional[str]:
     """
-    특정 페이지의 기사들을 크롤링
-    기존 get_latest_links() 로직 재사용
+    기사 페이지의 제목을 목록(parse_listing)과 같은 형태로 - h1 헤드라인,
+    없으면 사이트 이름을 뗀 og:title / <title>. 찾지 못하면 None
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    heading = soup.find('h1')
+    if heading and heading.get_text(strip=True):
+        return _clean_title(heading.get_text(strip=True))
+
+    site_meta = soup.find('meta', attrs={'property': 'og:site_name'})
+    site_names = ((site_meta.get('content', '').strip(),) if site_meta else ()) + SITE_TITLE_SUFFIXES
+    meta = soup.find('meta', attrs={'property': 'og:title'})
+    candidates = [meta.get('content', '') if meta else '', soup.title.get_text() if soup.title else '']
+    for candidate in candidates:
+        if candidate.strip():
+            return _clean_title(_strip_site_suffix(candidate.strip(), [name for name in site_names if name]))
+    return None
+
+def fetch_article_revision(article_url: str, etag: Optional[str] = None,
+                           last_modified: Optional[str] = None) -> Optional[Dict]:
     """
-    page_url = f"https://www.christiantoday.co.kr/sections/pd_19/page{page_num}.htm"
+    Conditional GET of a stored article for change detection.
+    Returns None on 304 Not Modified, otherwise {"title", "content", "etag", "last_modified"}
+    (title/content may be None when the page has no recognizable markup).
+    Raises requests.RequestException on fetch errors.
+    """
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
 
     try:
-        response = requests.get(page_url, headers=HEADERS, timeout=10)
-        response.raise_for_status()
-        response.encoding = 'utf-8'
-
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        articles = []
-
-        # Phase 1: Extract latest news (article h2 a)
-        latest_news_links = soup.select('article h2 a[href*="/news/"]')
-        for link in latest_news_links:
-            href = link.get('href')
-            if href:
-                if href.startswith('http'):
-                    full_url = href
-                else:
-                    full_url = f"https://www.christiantoday.co.kr{href}"
-
-                title = link.get_text(strip=True)
-                if title:
-                    title = title.replace('\n', ' ').replace('\r', ' ').strip()
-                    while '  ' in title:
-                        title = title.replace('  ', ' ')
-                else:
-                    title = "제목 없음"
-
-                if 'christiantoday.co.kr/news/' in full_url:
-                    articles.append((full_url, title))
-
-        # Phase 2: Extract regular news from the specific list container
-        # Only from ul.l-list.w-divider.gap-md.no-bullet li elements
-        list_items = soup.select('ul.l-list.w-divider.gap-md.no-bullet li')
-
-        for li in list_items:
-            link = li.find('a', href=lambda x: x and '/news/' in x)
-            if link:
-                href = link.get('href')
-                if href:
-                    if href.startswith('http'):
-                        full_url = href
-                    else:
-                        full_url = f"https://www.christiantoday.co.kr{href}"
-
-                    title = link.get_text(strip=True)
-
-                    if not title or title == "...":
-                        title_elem = li.find(['h3', 'h4', 'strong', 'b', '.title', '.headline'])
-                        if title_elem:
-                            title = title_elem.get_text(strip=True)
-                        else:
-                            li_text = li.get_text(separator=' ', strip=True)
-                            for other_link in li.find_all('a'):
-                                if other_link != link:
-                                    other_link.extract()
-                            li_text = li.get_text(separator=' ', strip=True)
-                            if li_text and len(li_text) > 10:
-                                title = li_text
-
-                    if title and title not in ["...", ""]:
-                        title = title.replace('\n', ' ').replace('\r', ' ').strip()
-                        while '  ' in title:
-                            title = title.replace('  ', ' ')
-                    else:
-                        title = "제목 없음"
-
-                    if 'christiantoday.co.kr/news/' in full_url:
-                        articles.append((full_url, title))
-
-        # 기사별 작성일 추출 및 튜플 생성 (url, title, published_at)
-        articles_with_dates = []
-        seen = set()
-
-        for url, title in articles:
-            if url not in seen:
-                seen.add(url)
-                # 작성일 추출
-                published_at = scrape_article_date(url)
-                articles_with_dates.append((url, title, published_at))
+        response = _fetch(article_url, "article_recheck", timeout=15, headers=headers)
+    except requests.RequestException:
+        _record_failure("article_recheck")
+        raise
+    if response.status_code == 304:
+        return None
 
-        return articles_with_dates
+    with _parse_timer("article_recheck"):
+        return {
+            "title": _parse_article_title(response.text),
+            "content": _parse_article_content(response.text),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
 
-    except requests.RequestException as e:
-        print(f"Error scraping page {page_num}: {e}")
-        return []
-    except Exception as e:
-        print(f"Unexpected error during scraping page {page_num}: {e}")
-        return []
+def get_articles_from_page(page_num=2, source: Optional[Source] = None) -> List[Tuple[str, str, str]]:
+    """
+    특정 페이지의 기사들을 크롤링
+    get_latest_links()와 같은 목록 파싱(parse_listing) 사용
+    """
+    return crawl_listing(source, page_num)
 
 if __name__ == "__main__":
     test_scraper()
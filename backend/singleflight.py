@@ -0,0 +1,80 @@
+"""
+기사 요약 생성 single-flight 조정
+
+같은 기사에 대한 요약 요청이 동시에 들어오면 한 번만 OpenAI를 호출하고
+나머지 요청은 그 결과를 기다린다.
+
+- 프로세스 내부: 기사 URL별 Future를 공유
+- 프로세스 간(여러 워커, 백필 스크립트): summary_claims 테이블의 claim row
+"""
+
+import os
+import socket
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, Optional, Tuple
+
+from db import claim_summary, release_summary_claim, is_summary_claimed, get_summary_claimed_at, get_article_summary
+
+OWNER_ID = f"{socket.gethostname()}:{os.getpid()}"
+CLAIM_TTL_SECONDS = int(os.getenv("SUMMARY_CLAIM_TTL_SECONDS", "300"))
+WAIT_TIMEOUT_SECONDS = int(os.getenv("SUMMARY_WAIT_TIMEOUT_SECONDS", "180"))
+POLL_INTERVAL_SECONDS = 1.0
+
+_lock = threading.Lock()
+_inflight: Dict[str, Future] = {}
+
+def join(key: str) -> Tuple[Future, bool]:
+    """
+    Join the in-flight generation for key.
+    Returns (future, is_leader). Only the leader should generate and call finish().
+    """
+    with _lock:
+        future = _inflight.get(key)
+        if future is not None:
+            return future, False
+        future = Future()
+        _inflight[key] = future
+        return future, True
+
+def finish(key: str, future: Future, result=None, error: Optional[BaseException] = None):
+    """Publish the leader's result to all waiters and clear the in-flight slot."""
+    with _lock:
+        if _inflight.get(key) is future:
+            del _inflight[key]
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+def claim(key: str) -> bool:
+    """Take the DB-level claim so other processes wait instead of generating."""
+    return claim_summary(key, OWNER_ID, CLAIM_TTL_SECONDS)
+
+def release(key: str):
+    release_summary_claim(key, OWNER_ID)
+
+def wait_for_remote(key: str, timeout: float = WAIT_TIMEOUT_SECONDS, fresh_only: bool = False) -> Optional[Dict]:
+    """
+    Wait for another process holding the claim to save the summary.
+    fresh_only (force=True callers) ignores summaries saved before that claim was taken,
+    so an old/stale summary is not mistaken for the regenerated one.
+    Returns the saved summary, or None if the claim went away without a result or timed out.
+    """
+    claimed_at = None
+    if fresh_only:
+        claimed_at = get_summary_claimed_at(key, CLAIM_TTL_SECONDS)
+        if claimed_at is None:
+            return None
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        summary = get_article_summary(key)
+        # created_at과 claimed_at은 둘 다 SQLite CURRENT_TIMESTAMP 형식이라 문자열로 비교 가능
+        if summary and (claimed_at is None or summary["created_at"] >= claimed_at):
+            return summary
+        if not is_summary_claimed(key, CLAIM_TTL_SECONDS):
+            return None
+        time.sleep(POLL_INTERVAL_SECONDS)
+    return None
@@ -0,0 +1,153 @@
+"""
+정적 JSON 스냅샷
+
+데이터는 크롤링/요약 저장 뒤에만 바뀌므로, 프론트엔드가 매번 읽는 응답
+(/latest 앞쪽 N페이지, /stats, /summaries)을 미리 JSON 파일로 만들어 둔다.
+프론트엔드는 스냅샷을 먼저 읽고, 없거나 실패하면 API로 fallback 한다.
+
+    SNAPSHOT_DIR/
+        manifest.json                      생성 시각, 페이지 수, per_page, 전체 기사 수
+        latest-{per_page}-{page}.json      GET /latest?page=&per_page= 와 같은 형식
+        stats.json                         GET /stats
+        summaries.json                     GET /summaries?limit=SNAPSHOT_SUMMARY_LIMIT
+
+새 기사/요약 저장 시 schedule()을 호출하면 공유 DB에 재생성 요청만 표시하고, 리더 프로세스의
+루프(start())가 SNAPSHOT_DEBOUNCE_SECONDS마다 표시를 비우면서 한 번만 다시 생성한다 - 워커가 여럿이어도
+같은 파일을 프로세스마다 다시 쓰지 않는다. 정적 호스팅용으로는 `python manage.py snapshot --out DIR`.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+from db import get_paginated_links, get_total_article_count, get_all_links, get_article_summaries_json
+from db import mark_snapshot_dirty, take_snapshot_dirty
+
+SNAPSHOT_DIR = os.getenv("SNAPSHOT_DIR") or os.path.join(os.path.dirname(os.path.abspath(__file__)), "snapshots")
+SNAPSHOT_PAGES = int(os.getenv("SNAPSHOT_PAGES", "5"))  # 0이면 비활성화
+SNAPSHOT_PER_PAGE = [int(n) for n in os.getenv("SNAPSHOT_PER_PAGE", "10").split(",") if n.strip()]
+SNAPSHOT_SUMMARY_LIMIT = int(os.getenv("SNAPSHOT_SUMMARY_LIMIT", "50"))
+SNAPSHOT_DEBOUNCE_SECONDS = float(os.getenv("SNAPSHOT_DEBOUNCE_SECONDS", "2"))
+SOURCE_URL = "https://www.christiantoday.co.kr/sections/pd_19"
+
+def build_latest(page: int, per_page: int) -> Dict:
+    articles = get_paginated_links(page=page, per_page=per_page)
+    total_articles = get_total_article_count()
+    total_pages = (total_articles + per_page - 1) // per_page  # 올림 나눗셈
+    return {
+        "articles": articles,
+        "pagination": {
+            "current_page": page,
+            "per_page": per_page,
+            "total_articles": total_articles,
+            "total_pages": total_pages
+        }
+    }
+
+def build_stats() -> Dict:
+    all_links = get_all_links(limit=1000)  # 충분히 큰 숫자로 전체 조회
+    return {
+        "total_articles": len(all_links),
+        "last_updated": all_links[0]["created_at"] if all_links else None,
+        "source_url": SOURCE_URL
+    }
+
+def build_summaries_json(limit: int) -> str:
+    # 저장된 요약 JSON 조각을 이어 붙인 응답 본문 (행마다 디코딩/인코딩하지 않음)
+    return get_article_summaries_json(limit=limit)
+
+def _write_text(directory: str, name: str, text: str):
+    # 임시 파일에 쓴 뒤 교체 - 읽는 쪽이 반쯤 쓰인 파일을 보지 않도록
+    path = os.path.join(directory, name)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+def _write_json(directory: str, name: str, payload: Dict):
+    _write_text(directory, name, json.dumps(payload, ensure_ascii=False, separators=(",", ":")))
+
+def generate(directory: Optional[str] = None, pages: Optional[int] = None) -> Dict:
+    """Write all snapshot files to directory and return the manifest."""
+    directory = directory or SNAPSHOT_DIR
+    pages = SNAPSHOT_PAGES if pages is None else pages
+    os.makedirs(directory, exist_ok=True)
+
+    written = []
+    total_articles = 0
+    for per_page in SNAPSHOT_PER_PAGE:
+        for page in range(1, pages + 1):
+            payload = build_latest(page, per_page)
+            total_articles = payload["pagination"]["total_articles"]
+            if page > 1 and not payload["articles"]:
+                break
+            name = f"latest-{per_page}-{page}.json"
+            _write_json(directory, name, payload)
+            written.append(name)
+
+    _write_json(directory, "stats.json", build_stats())
+    _write_text(directory, "summaries.json", build_summaries_json(SNAPSHOT_SUMMARY_LIMIT))
+    written += ["stats.json", "summaries.json"]
+
+    manifest = {
+        "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "pages": pages,
+        "per_page": SNAPSHOT_PER_PAGE,
+        "summary_limit": SNAPSHOT_SUMMARY_LIMIT,
+        "total_articles": total_articles,
+        "files": written
+    }
+    # manifest는 마지막에 써서 프론트엔드가 완성된 스냅샷만 보도록 한다
+    _write_json(directory, "manifest.json", manifest)
+    return manifest
+
+_stop = threading.Event()
+_thread: Optional[threading.Thread] = None
+
+def _regenerate_if_dirty():
+    if not take_snapshot_dirty():
+        return
+    try:
+        manifest = generate()
+        print(f"📸 스냅샷 갱신: {len(manifest['files'])}개 파일")
+    except Exception as e:
+        print(f"스냅샷 생성 실패: {e}")
+
+def _loop():
+    while not _stop.wait(SNAPSHOT_DEBOUNCE_SECONDS):
+        try:
+            _regenerate_if_dirty()
+        except Exception as e:
+            print(f"스냅샷 갱신 확인 실패: {e}")
+
+def schedule():
+    """
+    Mark snapshots dirty in the shared DB. Any process may call this; the leader's loop
+    regenerates once per SNAPSHOT_DEBOUNCE_SECONDS, so marks during the window are coalesced.
+    """
+    if SNAPSHOT_PAGES <= 0:
+        return
+    try:
+        mark_snapshot_dirty()
+    except Exception as e:
+        print(f"스냅샷 갱신 요청 실패: {e}")
+
+def start():
+    """Start regenerating on the leader (no-op if disabled or running). Also regenerates once right away."""
+    global _thread
+    if SNAPSHOT_PAGES <= 0 or _thread is not None:
+        return
+    schedule()
+    _stop.clear()
+    _thread = threading.Thread(target=_loop, name="snapshots", daemon=True)
+    _thread.start()
+
+def stop(timeout: float = 5.0):
+    global _thread
+    if _thread is None:
+        return
+    _stop.set()
+    _thread.join(timeout)
+    _thread = None
@@ -0,0 +1,120 @@
+"""
+크롤링 대상 소스 레지스트리
+
+섹션/사이트를 추가할 때 스크래퍼를 복사하지 않고 설정 항목 하나만 추가한다.
+각 소스는 목록 URL 패턴, CSS 선택자, 작성일 추출 방식, 크롤링 주기를 가진다.
+
+    {
+        "name": "pd_19",                                   # posts.source 에 저장되는 이름
+        "label": "다니엘기도회",
+        "listing_url": "{base}/sections/pd_19",            # 1페이지
+        "page_url": "{base}/sections/pd_19/page{page}.htm", # 2페이지 이후
+        "selectors": {...},                                 # DEFAULT_SELECTORS 중 바꿀 것만
+        "date_strategy": "article_page",                    # article_page | listing | feed | none
+        "feed_url": null,                                   # date_strategy=feed 일 때 RSS/Atom/사이트맵
+        "interval_seconds": 600,
+        "enabled": true
+    }
+
+{base}는 SCRAPER_BASE_URL(기본 https://www.christiantoday.co.kr)로 치환된다.
+SOURCES_FILE 환경변수로 JSON 배열 파일을 지정하면 같은 이름의 기본 소스를 덮어쓰고 나머지는 추가한다.
+"""
+
+import json
+import os
+from typing import Dict, List, Optional
+
+from db import DEFAULT_SOURCE
+
+# 벤치마크에서는 로컬 가짜 사이트(benchmarks/fake_site.py)를 가리키도록 바꿀 수 있다
+BASE_URL = (os.getenv("SCRAPER_BASE_URL") or "https://www.christiantoday.co.kr").rstrip("/")
+
+DATE_STRATEGIES = ("article_page", "listing", "feed", "none")
+
+DEFAULT_SELECTORS = {
+    # 상단 대표 기사 (가장 최근 기사)
+    "featured": 'article h2 a[href*="/news/"]',
+    # 일반 기사 목록의 항목
+    "list_item": "ul.l-list.w-divider.gap-md.no-bullet li",
+    # 기사 링크로 인정할 href 부분 문자열
+    "link_contains": "/news/",
+    # date_strategy=listing 일 때 목록 항목 안의 날짜 요소
+    "date": ".date",
+}
+
+DEFAULT_SOURCES = [
+    {
+        "name": DEFAULT_SOURCE,
+        "label": "다니엘기도회",
+        "listing_url": "{base}/sections/pd_19",
+        "page_url": "{base}/sections/pd_19/page{page}.htm",
+        "date_strategy": "article_page",
+        # 기존 FEED_URL 설정은 기본 소스의 피드로 사용
+        "feed_url": os.getenv("FEED_URL") or None,
+        "interval_seconds": 600,
+    },
+]
+
+class Source:
+    """One crawl target built from a registry entry."""
+
+    def __init__(self, name: str, listing_url: str, page_url: Optional[str] = None, label: Optional[str] = None,
+                 selectors: Optional[Dict] = None, date_strategy: str = "article_page", feed_url: Optional[str] = None,
+                 interval_seconds: float = 600, enabled: bool = True):
+        if date_strategy not in DATE_STRATEGIES:
+            raise ValueError(f"unknown date_strategy {date_strategy!r} for source {name}")
+        self.name = name
+        self.label = label or name
+        self.listing_url = listing_url.format(base=BASE_URL)
+        self.page_url = page_url.format(base=BASE_URL, page="{page}") if page_url else None
+        self.selectors = dict(DEFAULT_SELECTORS, **(selectors or {}))
+        self.date_strategy = date_strategy
+        self.feed_url = feed_url.format(base=BASE_URL) if feed_url else None
+        self.interval_seconds = float(interval_seconds)
+        self.enabled = enabled
+
+        scheme, _, rest = self.listing_url.partition("://")
+        self.base_url = f"{scheme}://{rest.split('/', 1)[0]}"
+        # 다른 사이트 링크를 걸러내기 위한 표식 (www. 유무와 무관하게 같은 사이트면 통과)
+        self.news_url_marker = rest.split("/", 1)[0].replace("www.", "", 1) + self.selectors["link_contains"]
+
+    def page(self, page_num: int) -> str:
+        """Listing URL of page_num (1 = listing_url)."""
+        if page_num <= 1 or not self.page_url:
+            return self.listing_url
+        return self.page_url.format(page=page_num)
+
+    def to_dict(self) -> Dict:
+        return {
+            "name": self.name,
+            "label": self.label,
+            "listing_url": self.listing_url,
+            "date_strategy": self.date_strategy,
+            "feed_url": self.feed_url,
+            "interval_seconds": self.interval_seconds,
+            "enabled": self.enabled,
+        }
+
+def _load_entries() -> List[Dict]:
+    entries = {entry["name"]: entry for entry in DEFAULT_SOURCES}
+    path = os.getenv("SOURCES_FILE")
+    if path:
+        with open(path, encoding="utf-8") as f:
+            for entry in json.load(f):
+                entries[entry["name"]] = dict(entries.get(entry["name"], {}), **entry)
+    return list(entries.values())
+
+_registry: Optional[Dict[str, Source]] = None
+
+def _get_registry() -> Dict[str, Source]:
+    global _registry
+    if _registry is None:
+        _registry = {entry["name"]: Source(**entry) for entry in _load_entries()}
+    return _registry
+
+def get_sources(enabled_only: bool = True) -> List[Source]:
+    return [source for source in _get_registry().values() if source.enabled or not enabled_only]
+
+def get_source(name: Optional[str] = None) -> Source:
+    """Source by name (default source if name is None). Raises KeyError for unknown names."""
+    return _get_registry()[name or DEFAULT_SOURCE]
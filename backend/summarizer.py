@@ -1,38 +1,106 @@
 import os
+import random
+import time
 from dotenv import load_dotenv
-from openai import OpenAI
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 import json
+from concurrent.futures import ThreadPoolExecutor
 from scraper import scrape_article_content
+from extractor import extract_hints, local_summary
 
 # Load environment variables
 load_dotenv()
 
-# Initialize OpenAI client
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# LLM 백엔드는 LLM_BACKEND 설정으로 선택 (openai / fake), 없으면 로컬 추출 결과로 대체
+from llm import get_backend, count_tokens, LLMError, LLMRateLimitError, LLMUnavailableError
+from metrics import LLM_REQUEST_DURATION, LLM_TOKENS, LLM_TOKENS_TOTAL, LLM_FAILURES, SUMMARY_REQUESTS, SUMMARY_CACHE_HITS
+import budget
 
-def summarize_article(article_url: str, title: str) -> Optional[Dict]:
+# Model and prompt budget settings
+MAX_RETRIES = int(os.getenv("SUMMARY_MAX_RETRIES", "3"))  # 429 응답 재시도 횟수
+RETRY_BASE_SECONDS = float(os.getenv("SUMMARY_RETRY_BASE_SECONDS", "1"))
+PROMPT_TOKEN_BUDGET = int(os.getenv("SUMMARY_PROMPT_TOKEN_BUDGET", "6000"))  # 이보다 긴 본문은 청크로 나눠 요약
+CHUNK_TOKENS = int(os.getenv("SUMMARY_CHUNK_TOKENS", "3000"))
+MAX_CHUNK_WORKERS = int(os.getenv("SUMMARY_CHUNK_WORKERS", "4"))
+MAX_CONDENSE_ROUNDS = int(os.getenv("SUMMARY_MAX_CONDENSE_ROUNDS", "2"))  # 청크 요약을 다시 청크 요약하는 최대 횟수
+
+# Structured output: 모델이 항상 이 스키마에 맞는 JSON을 반환하도록 강제
+SUMMARY_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "article_summary",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "summary": {"type": "string"},
+                "keywords": {"type": "array", "items": {"type": "string"}},
+                "bible_verses": {"type": "array", "items": {"type": "string"}}
+            },
+            "required": ["summary", "keywords", "bible_verses"],
+            "additionalProperties": False
+        }
+    }
+}
+
+def split_into_chunks(content: str, max_tokens: int = CHUNK_TOKENS) -> List[str]:
     """
-    Summarize an article using OpenAI GPT.
-    Returns dict with summary, keywords, and bible verses.
+    Split article content into chunks of at most max_tokens, keeping paragraph boundaries
+    where possible. Paragraphs longer than max_tokens are split by characters.
     """
-    try:
-        # First, scrape the article content
-        content = scrape_article_content(article_url)
-        if not content:
-            print(f"Could not scrape content for article: {article_url}")
-            return None
+    chunks = []
+    current = []
+    current_tokens = 0
+
+    for line in content.split('\n'):
+        line_tokens = count_tokens(line)
+
+        # 한 문단이 너무 길면 글자 단위로 분할
+        if line_tokens > max_tokens:
+            if current:
+                chunks.append('\n'.join(current))
+                current, current_tokens = [], 0
+            step = max(1, len(line) * max_tokens // line_tokens)
+            for i in range(0, len(line), step):
+                chunks.append(line[i:i + step])
+            continue
+
+        if current and current_tokens + line_tokens > max_tokens:
+            chunks.append('\n'.join(current))
+            current, current_tokens = [], 0
+
+        current.append(line)
+        current_tokens += line_tokens
+
+    if current:
+        chunks.append('\n'.join(current))
 
-        # Create the prompt for summarization
-        prompt = f"""
+    return chunks
+
+def _build_prompt(title: str, content: str, hints: Optional[Dict] = None) -> str:
+    hints = hints or {}
+    verses = hints.get("bible_verses") or []
+    keyword_candidates = hints.get("keywords") or []
+
+    # 로컬 추출 결과가 있으면 모델이 본문을 다시 훑어 찾을 필요가 없도록 힌트로 제공
+    if keyword_candidates:
+        keyword_task = f"기사의 주요 키워드 3-5개를 추출해주세요. 후보: {', '.join(keyword_candidates)}"
+    else:
+        keyword_task = "기사의 주요 키워드 3-5개를 추출해주세요."
+    if verses:
+        verse_task = f"본문에 언급된 구절({', '.join(verses)}) 중 핵심 구절 1-2개를 그대로 적어주세요."
+    else:
+        verse_task = "이 기사에서 언급된 성경 구절 1-2개를 추천해주세요. 없다면 작성하지 마세요."
+
+    return f"""
 다음은 다니엘기도회 관련 기사입니다:
 이 기사를 다음 형식으로 요약해주세요:
 
 1. 요약: 기사를 약 300단어로 요약해주세요. 기사의 핵심 내용과 메시지를 포함하세요.
 
-2. 키워드: 기사의 주요 키워드 3-5개를 추출해주세요.
+2. 키워드: {keyword_task}
 
-3. 성경 구절: 이 기사에서 언급된 성경 구절 1-2개를 추천해주세요. 없다면 작성하지 마세요.
+3. 성경 구절: {verse_task}
 
 제목: {title}
 
@@ -46,41 +114,399 @@ def summarize_article(article_url: str, title: str) -> Optional[Dict]:
 }}
 """
 
-        # Call OpenAI API
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.3
-        )
+def _build_chunk_prompt(title: str, chunk: str, index: int, total: int, collect_verses: bool = True) -> str:
+    verse_task = ", 언급된 성경 구절이 있다면 그대로 적어주세요" if collect_verses else ""
+    return f"""
+다음은 다니엘기도회 관련 기사 "{title}"의 일부({index}/{total})입니다.
+이 부분의 핵심 내용을 150단어 이내로 정리하고{verse_task}.
 
-        # Parse the response
-        if response.choices and len(response.choices) > 0:
-            result_text = response.choices[0].message.content.strip()
+본문:
+{chunk}
+"""
 
-            # Parse the JSON response directly
-            try:
-                result = json.loads(result_text)
-
-                # Validate the result structure
-                if all(key in result for key in ['summary', 'keywords', 'bible_verses']):
-                    return {
-                        'summary': result['summary'],
-                        'keywords': result['keywords'] if isinstance(result['keywords'], list) else [],
-                        'bible_verses': result['bible_verses'] if isinstance(result['bible_verses'], list) else []
-                    }
-                else:
-                    print(f"Missing required keys in response: {result.keys()}")
-            except json.JSONDecodeError as e:
-                print(f"JSON parsing error: {e}")
-                print(f"Response text: {result_text}")
-
-            print(f"Invalid response format from OpenAI for article: {article_url}")
+def _record_llm_call(backend, start: float, error: Optional[LLMError] = None, usage: Optional[Dict] = None,
+                     call: Optional[Dict] = None):
+    """Record latency, outcome and token counts of one LLM call in the metrics and the usage ledger."""
+    backend_name = backend.name
+    if error is None:
+        outcome = "ok"
+    elif isinstance(error, LLMRateLimitError):
+        outcome = "rate_limited"
+    elif isinstance(error, LLMUnavailableError):
+        outcome = "unavailable"
+    else:
+        outcome = "error"
+
+    elapsed = time.perf_counter() - start
+    LLM_REQUEST_DURATION.observe(elapsed, backend=backend_name, outcome=outcome)
+    if error is not None:
+        LLM_FAILURES.inc(backend=backend_name, reason=outcome)
+    if usage:
+        for token_type in ("prompt_tokens", "completion_tokens"):
+            LLM_TOKENS.observe(usage[token_type], backend=backend_name, type=token_type)
+            LLM_TOKENS_TOTAL.inc(usage[token_type], backend=backend_name, type=token_type)
+
+    call = call or {}
+    budget.record(backend_name, getattr(backend, "model", backend_name), call.get("priority", "interactive"),
+                  call.get("article_url"), usage, elapsed * 1000, outcome)
+
+def _retry_delay(attempt: int, error: LLMRateLimitError) -> float:
+    """Backoff for 429s: honor Retry-After, otherwise exponential with jitter."""
+    if error.retry_after:
+        return error.retry_after
+    return RETRY_BASE_SECONDS * (2 ** attempt) * (0.5 + random.random())
+
+def _chat(prompt: str, response_format: Optional[Dict] = None, call: Optional[Dict] = None) -> Tuple[str, Dict]:
+    """
+    Send a single prompt to the configured LLM backend, retrying on rate limits.
+    call ({"article_url", "priority"}) is stored with each attempt in the usage ledger.
+    Returns (response text, usage dict with prompt_tokens and completion_tokens).
+    """
+    backend = get_backend()
+    if backend is None:
+        raise LLMUnavailableError("LLM backend not configured")
+
+    for attempt in range(MAX_RETRIES + 1):
+        start = time.perf_counter()
+        try:
+            text, usage = backend.chat(prompt, response_format)
+            _record_llm_call(backend, start, None, usage, call)
+            return text, usage
+        except LLMRateLimitError as e:
+            _record_llm_call(backend, start, e, call=call)
+            if attempt == MAX_RETRIES:
+                raise
+            delay = _retry_delay(attempt, e)
+            print(f"Rate limited, retrying in {delay:.1f}s ({attempt + 1}/{MAX_RETRIES})")
+            time.sleep(delay)
+        except LLMError as e:
+            _record_llm_call(backend, start, e, call=call)
+            raise
+
+def _parse_summary(result_text: str) -> Optional[Dict]:
+    """Parse and validate the JSON summary returned by the model."""
+    try:
+        result = json.loads(result_text)
+
+        # Validate the result structure
+        if all(key in result for key in ['summary', 'keywords', 'bible_verses']):
+            return {
+                'summary': result['summary'],
+                'keywords': result['keywords'] if isinstance(result['keywords'], list) else [],
+                'bible_verses': result['bible_verses'] if isinstance(result['bible_verses'], list) else []
+            }
+        else:
+            print(f"Missing required keys in response: {result.keys()}")
+    except json.JSONDecodeError as e:
+        print(f"JSON parsing error: {e}")
+        print(f"Response text: {result_text}")
+
+    return None
+
+def _condense_content(title: str, content: str, usage: Dict, collect_verses: bool = True,
+                      call: Optional[Dict] = None) -> str:
+    """
+    Map step for long articles: summarize each chunk in parallel and join the partial
+    summaries in original order. Token usage of every chunk call is added to usage.
+    """
+    chunks = split_into_chunks(content)
+    usage["chunks"] = len(chunks)
+
+    prompts = [
+        _build_chunk_prompt(title, chunk, i, len(chunks), collect_verses)
+        for i, chunk in enumerate(chunks, 1)
+    ]
+    with ThreadPoolExecutor(max_workers=min(MAX_CHUNK_WORKERS, len(prompts))) as executor:
+        results = list(executor.map(lambda prompt: _chat(prompt, None, call), prompts))
+
+    partials = []
+    for text, chunk_usage in results:
+        usage["prompt_tokens"] += chunk_usage["prompt_tokens"]
+        usage["completion_tokens"] += chunk_usage["completion_tokens"]
+        partials.append(text)
+
+    return '\n\n'.join(f"[부분 {i}] {text}" for i, text in enumerate(partials, 1))
+
+def _extract_hints(title: str, content: str) -> Dict:
+    try:
+        return extract_hints(title, content)
+    except Exception as e:
+        print(f"Local extraction failed: {e}")
+        return {"bible_verses": [], "keywords": []}
+
+def _local_result(content: str, hints: Dict) -> Dict:
+    """Summary built only from local extraction, used when OpenAI is unavailable."""
+    return {
+        'summary': local_summary(content),
+        'keywords': hints["keywords"][:5],
+        'bible_verses': hints["bible_verses"][:2],
+        'usage': {"prompt_tokens": 0, "completion_tokens": 0, "chunks": 0},
+        'source': 'local'
+    }
+
+def _merge_hints(result: Dict, hints: Dict) -> Dict:
+    """Fill empty model fields with locally extracted values."""
+    if not result['bible_verses'] and hints["bible_verses"]:
+        result['bible_verses'] = hints["bible_verses"][:2]
+    if not result['keywords'] and hints["keywords"]:
+        result['keywords'] = hints["keywords"][:5]
+    return result
+
+def _fits_budget(title: str, content: str, hints: Dict) -> bool:
+    return count_tokens(_build_prompt(title, content, hints)) <= PROMPT_TOKEN_BUDGET
+
+def _truncate_to_budget(title: str, content: str, hints: Dict) -> str:
+    """Cut content (from the end) until the final prompt fits PROMPT_TOKEN_BUDGET."""
+    available = PROMPT_TOKEN_BUDGET - count_tokens(_build_prompt(title, "", hints))
+    while content and count_tokens(content) > available:
+        content = content[:max(len(content) * max(available, 0) // count_tokens(content) - 1, 0)]
+    return content
+
+def _prepare_content(title: str, content: str, hints: Dict, usage: Dict, call: Optional[Dict] = None) -> str:
+    """
+    Condense content with the chunked map step while the prompt exceeds the token budget
+    (up to MAX_CONDENSE_ROUNDS rounds over the partial summaries), then truncate as a last resort.
+    """
+    if _fits_budget(title, content, hints):
+        return content
+
+    collect_verses = not hints["bible_verses"]
+    content = _condense_content(title, content, usage, collect_verses=collect_verses, call=call)
+    article_chunks = usage["chunks"]
+    for _ in range(MAX_CONDENSE_ROUNDS - 1):
+        if _fits_budget(title, content, hints):
+            break
+        content = _condense_content(title, content, usage, collect_verses=collect_verses, call=call)
+    # usage["chunks"]는 원문 청크 수로 유지
+    usage["chunks"] = article_chunks
+
+    if not _fits_budget(title, content, hints):
+        print(f"Condensed content still exceeds {PROMPT_TOKEN_BUDGET} tokens, truncating: {title}")
+        content = _truncate_to_budget(title, content, hints)
+    return content
+
+def summarize_article(article_url: str, title: str, priority: str = "interactive") -> Optional[Dict]:
+    """
+    Summarize an article with the configured LLM backend (OpenAI GPT by default).
+    Bible references and keyword candidates are extracted locally first and passed as hints.
+    Articles within PROMPT_TOKEN_BUDGET are sent in one prompt; longer ones are split into
+    chunks, summarized in parallel and combined in a final call.
+    If the LLM is unavailable, or the budget is used up for an interactive request,
+    a local extraction result marked source="local" is returned.
+    Returns dict with summary, keywords, bible verses and token usage.
+    Raises budget.BudgetExceededError for other priorities so the caller can defer the work.
+    """
+    # 백그라운드 작업은 예산이 없으면 본문을 받기 전에 거절 (호출한 쪽에서 미룸)
+    if priority != "interactive":
+        budget.check(priority)
+
+    try:
+        # First, scrape the article content
+        content = scrape_article_content(article_url)
+        if not content:
+            print(f"Could not scrape content for article: {article_url}")
             return None
 
+        hints = _extract_hints(title, content)
+        if get_backend() is None:
+            print(f"LLM backend not configured, using local extraction for: {article_url}")
+            return _local_result(content, hints)
+
+        usage = {"prompt_tokens": 0, "completion_tokens": 0, "chunks": 1}
+        call = {"article_url": article_url, "priority": priority}
+
+        try:
+            budget.check(priority)
+            prompt_content = _prepare_content(title, content, hints, usage, call)
+
+            # Call LLM
+            result_text, final_usage = _chat(_build_prompt(title, prompt_content, hints), SUMMARY_RESPONSE_FORMAT, call)
+        except budget.BudgetExceededError:
+            if priority != "interactive":
+                raise
+            print(f"LLM budget exhausted, using local extraction for: {article_url}")
+            return _local_result(content, hints)
+        except LLMUnavailableError as e:
+            print(f"LLM unavailable ({e}), using local extraction for: {article_url}")
+            return _local_result(content, hints)
+
+        usage["prompt_tokens"] += final_usage["prompt_tokens"]
+        usage["completion_tokens"] += final_usage["completion_tokens"]
+
+        print(f"Tokens for {article_url}: in={usage['prompt_tokens']} out={usage['completion_tokens']} chunks={usage['chunks']}")
+
+        # Parse the response
+        if result_text:
+            result = _parse_summary(result_text)
+            if result:
+                result['usage'] = usage
+                return _merge_hints(result, hints)
+
+        print(f"Invalid response format from OpenAI for article: {article_url}")
+        return None
+
+    except budget.BudgetExceededError:
+        raise
     except Exception as e:
         print(f"Error summarizing article {article_url}: {e}")
         return None
 
+def stream_summarize_article(article_url: str, title: str, priority: str = "interactive") -> Iterator[Dict]:
+    """
+    Summarize an article while streaming model output.
+    Yields {"type": "delta", "content": ...} events as tokens arrive, then a single
+    {"type": "done", "summary": {...}} event with the validated result,
+    or {"type": "error", "message": ...} on failure.
+    """
+    try:
+        content = scrape_article_content(article_url)
+        if not content:
+            yield {"type": "error", "message": "기사 본문을 가져올 수 없습니다."}
+            return
+
+        hints = _extract_hints(title, content)
+        backend = get_backend()
+        if backend is None:
+            yield {"type": "done", "summary": _local_result(content, hints)}
+            return
+
+        usage = {"prompt_tokens": 0, "completion_tokens": 0, "chunks": 1}
+        call = {"article_url": article_url, "priority": priority}
+        budget.check(priority)
+
+        # 긴 기사는 청크 요약(map)까지 마친 뒤 최종 요약만 스트리밍
+        prompt = _build_prompt(title, _prepare_content(title, content, hints, usage, call), hints)
+
+        parts = []
+        final_usage = None
+        for attempt in range(MAX_RETRIES + 1):
+            start = time.perf_counter()
+            try:
+                for delta, delta_usage in backend.stream_chat(prompt, SUMMARY_RESPONSE_FORMAT):
+                    if delta:
+                        parts.append(delta)
+                        yield {"type": "delta", "content": delta}
+                    if delta_usage is not None:
+                        final_usage = delta_usage
+                _record_llm_call(backend, start, None, final_usage, call)
+                break
+            except LLMRateLimitError as e:
+                _record_llm_call(backend, start, e, call=call)
+                # 이미 내보낸 토큰이 있으면 재시도할 수 없음
+                if parts or attempt == MAX_RETRIES:
+                    raise
+                time.sleep(_retry_delay(attempt, e))
+            except LLMError as e:
+                _record_llm_call(backend, start, e, call=call)
+                raise
+
+        result_text = ''.join(parts).strip()
+        usage["prompt_tokens"] += final_usage["prompt_tokens"]
+        usage["completion_tokens"] += final_usage["completion_tokens"]
+
+        print(f"Tokens for {article_url}: in={usage['prompt_tokens']} out={usage['completion_tokens']} chunks={usage['chunks']}")
+
+        result = _parse_summary(result_text)
+        if not result:
+            yield {"type": "error", "message": "요약 응답 형식이 올바르지 않습니다."}
+            return
+
+        result['usage'] = usage
+        yield {"type": "done", "summary": _merge_hints(result, hints)}
+
+    except LLMUnavailableError as e:
+        print(f"LLM unavailable ({e}), using local extraction for: {article_url}")
+        yield {"type": "done", "summary": _local_result(content, hints)}
+    except Exception as e:
+        print(f"Error streaming summary for {article_url}: {e}")
+        yield {"type": "error", "message": str(e)}
+
+def summarize_and_save(article_url: str, title: str, force: bool = False,
+                       priority: str = "interactive") -> Tuple[str, Optional[Dict]]:
+    """
+    Generate and save a summary, coalescing concurrent calls for the same article.
+    Callers that arrive while a generation is in flight (in this process or another one
+    holding the DB claim) wait for its result instead of calling OpenAI again.
+    priority ("interactive", "newest", "backfill") decides how much of the LLM budget it may use.
+    Returns (status, summary) where status is "existing", "generated", "joined", "local"
+    (OpenAI unavailable or over budget, unsaved local extraction result) or "failed".
+    Raises budget.BudgetExceededError for non-interactive priorities when their budget is used up.
+    """
+    try:
+        status, summary = _summarize_and_save(article_url, title, force, priority)
+    except budget.BudgetExceededError:
+        SUMMARY_REQUESTS.inc(status="deferred")
+        raise
+    SUMMARY_REQUESTS.inc(status=status)
+    if status == "existing":
+        SUMMARY_CACHE_HITS.inc()
+    return status, summary
+
+def _summarize_and_save(article_url: str, title: str, force: bool, priority: str) -> Tuple[str, Optional[Dict]]:
+    import singleflight
+    from db import get_article_summary, save_article_summary
+    import snapshots
+
+    if not force:
+        existing_summary = get_article_summary(article_url)
+        if existing_summary:
+            return "existing", existing_summary
+
+    future, is_leader = singleflight.join(article_url)
+    if not is_leader:
+        try:
+            result = future.result(timeout=singleflight.WAIT_TIMEOUT_SECONDS)
+        except budget.BudgetExceededError:
+            raise
+        except Exception as e:
+            print(f"Waiting for in-flight summary failed {article_url}: {e}")
+            return "failed", None
+        return ("joined", result) if result else ("failed", None)
+
+    result = None
+    error = None
+    try:
+        if not singleflight.claim(article_url):
+            # 다른 프로세스가 생성 중 - 저장될 때까지 대기
+            result = singleflight.wait_for_remote(article_url, fresh_only=force)
+            if result:
+                return "joined", result
+            if not singleflight.claim(article_url):
+                return "failed", None
+
+        try:
+            if not force:
+                # 처음 확인한 뒤 claim을 얻기 전에 다른 호출이 저장했을 수 있다
+                existing_summary = get_article_summary(article_url)
+                if existing_summary:
+                    result = existing_summary
+                    return "existing", result
+
+            summary_data = summarize_article(article_url, title, priority)
+            if summary_data and summary_data.get('source') == 'local':
+                # 로컬 추출 결과는 저장하지 않음 - OpenAI를 다시 쓸 수 있을 때 생성되도록
+                result = summary_data
+                return "local", result
+            if summary_data:
+                save_article_summary(
+                    article_url,
+                    summary_data['summary'],
+                    summary_data['keywords'],
+                    summary_data['bible_verses']
+                )
+                snapshots.schedule()
+                result = summary_data
+        finally:
+            singleflight.release(article_url)
+
+        return ("generated", result) if result else ("failed", None)
+    except budget.BudgetExceededError as e:
+        # 같은 기사를 기다리던 호출도 실패가 아니라 미뤄야 하는 것으로 알린다
+        error = e
+        raise
+    finally:
+        singleflight.finish(article_url, future, result, error)
+
 def summarize_top_articles(limit: int = 3) -> List[Dict]:
     """
     Summarize the top N most recent articles.
@@ -93,37 +519,20 @@ def summarize_top_articles(limit: int = 3) -> List[Dict]:
         summaries = []
 
         for article in articles:
-            # Check if summary already exists
-            from db import get_article_summary
-            existing_summary = get_article_summary(article['url'])
+            try:
+                status, summary_data = summarize_and_save(article['url'], article['title'], priority="newest")
+            except budget.BudgetExceededError as e:
+                print(f"LLM budget exhausted, skipping remaining articles: {e}")
+                break
 
-            if existing_summary:
-                # Use existing summary
+            if summary_data:
+                if status != "existing":
+                    print(f"Generated summary for: {article['title']}")
                 summaries.append({
                     'article_url': article['url'],
                     'title': article['title'],
-                    **existing_summary
+                    **summary_data
                 })
-            else:
-                # Generate new summary
-                print(f"Generating summary for: {article['title']}")
-                summary_data = summarize_article(article['url'], article['title'])
-
-                if summary_data:
-                    # Save to database
-                    from db import save_article_summary
-                    save_article_summary(
-                        article['url'],
-                        summary_data['summary'],
-                        summary_data['keywords'],
-                        summary_data['bible_verses']
-                    )
-
-                    summaries.append({
-                        'article_url': article['url'],
-                        'title': article['title'],
-                        **summary_data
-                    })
 
         return summaries
 
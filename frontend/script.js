@@ -2,6 +2,16 @@
 // const API_BASE_URL = 'http://localhost:8000'; // 로컬 개발용
 const API_BASE_URL = 'https://daniel-crawl-web.onrender.com'; // Render backend
 
+// 정적 JSON 스냅샷 위치
+// - index.html에 <meta name="snapshot-base-url" content="..."> 로 지정 (content="" 이면 항상 API 사용)
+// - 지정하지 않으면 프론트엔드 정적 호스트의 /snapshots (vercel.json)를 먼저 쓰고,
+//   거기에 스냅샷이 없을 때만 API 서버의 /snapshots 로 fallback
+const snapshotMeta = document.querySelector('meta[name="snapshot-base-url"]');
+const SNAPSHOT_BASE_URLS = snapshotMeta
+    ? [snapshotMeta.content].filter(Boolean)
+    : ['/snapshots', `${API_BASE_URL}/snapshots`];
+let snapshotBasePromise = null;
+
 // DOM 요소들
 const articleList = document.getElementById('article-list');
 const loading = document.getElementById('loading');
@@ -16,14 +26,15 @@ let totalPages = 1;
 let perPage = 10;
 
 // 페이지 데이터 동시 로딩
-async function loadPageData(page = 1) {
+// fresh=true 이면 스냅샷을 건너뛰고 API에서 직접 읽음 (새 기사 확인 직후 등)
+async function loadPageData(page = 1, fresh = false) {
     showLoading(true);
     currentPage = page;
 
     let articles = [];
 
     try {
-        const articlesData = await apiCall(`/latest?page=${page}&per_page=${perPage}`);
+        const articlesData = await snapshotOrApi(`latest-${perPage}-${page}.json`, `/latest?page=${page}&per_page=${perPage}`, fresh);
 
         if (articlesData.articles && articlesData.articles.length > 0) {
             articles = articlesData.articles;
@@ -46,15 +57,7 @@ async function loadPageData(page = 1) {
     }
 
     try {
-        const summariesData = await apiCall('/summaries?limit=50');
-        const summaryMap = new Map();
-
-        if (summariesData.summaries && summariesData.summaries.length > 0) {
-            summariesData.summaries.forEach(summary => {
-                summaryMap.set(summary.article_url, summary);
-            });
-        }
-
+        const summaryMap = await loadPageSummaries(articles.map(article => article.url), fresh);
         updateSummaryButtons(summaryMap);
     } catch (error) {
         console.error('Failed to load summaries:', error);
@@ -65,6 +68,34 @@ async function loadPageData(page = 1) {
     }
 }
 
+// 현재 페이지 기사들의 요약 조회 - 스냅샷(summaries.json)에 없는 기사만 일괄 조회 API로 한 번에 요청
+async function loadPageSummaries(urls, fresh = false) {
+    const summaryMap = new Map();
+
+    const snapshot = fresh ? null : await fetchSnapshot('summaries.json');
+    if (snapshot && snapshot.summaries) {
+        const wanted = new Set(urls);
+        snapshot.summaries.forEach(summary => {
+            if (wanted.has(summary.article_url)) {
+                summaryMap.set(summary.article_url, summary);
+            }
+        });
+    }
+
+    const missing = urls.filter(url => !summaryMap.has(url));
+    if (missing.length > 0) {
+        const data = await apiCall('/summaries/batch', {
+            method: 'POST',
+            body: JSON.stringify({ urls: missing })
+        });
+        Object.entries(data.summaries || {}).forEach(([url, summary]) => {
+            summaryMap.set(url, { article_url: url, ...summary });
+        });
+    }
+
+    return summaryMap;
+}
+
 // 페이지 로드 시 초기화
 document.addEventListener('DOMContentLoaded', function() {
     loadPageData();
@@ -93,6 +124,51 @@ async function apiCall(endpoint, options = {}) {
     }
 }
 
+// 정적 스냅샷 읽기 (없거나 실패하면 null)
+// manifest.json이 있는 첫 번째 스냅샷 위치 (페이지당 한 번만 확인)
+function snapshotBaseUrl() {
+    if (!snapshotBasePromise) {
+        snapshotBasePromise = (async () => {
+            for (const baseUrl of SNAPSHOT_BASE_URLS) {
+                try {
+                    const response = await fetch(`${baseUrl}/manifest.json`);
+                    // 정적 호스트의 SPA fallback(index.html)은 스냅샷이 아님
+                    const contentType = response.headers.get('content-type') || '';
+                    if (response.ok && contentType.includes('json')) {
+                        return baseUrl;
+                    }
+                } catch (error) {
+                    // 다음 위치 시도
+                }
+            }
+            return null;
+        })();
+    }
+    return snapshotBasePromise;
+}
+
+async function fetchSnapshot(snapshotName) {
+    const baseUrl = await snapshotBaseUrl();
+    if (!baseUrl) {
+        return null;
+    }
+    try {
+        const response = await fetch(`${baseUrl}/${snapshotName}`);
+        if (response.ok) {
+            return await response.json();
+        }
+    } catch (error) {
+        console.warn('Snapshot unavailable, falling back to API:', snapshotName);
+    }
+    return null;
+}
+
+// 정적 스냅샷을 먼저 읽고, 없거나 실패하면 API 호출
+async function snapshotOrApi(snapshotName, endpoint, fresh = false) {
+    const snapshot = fresh ? null : await fetchSnapshot(snapshotName);
+    return snapshot || apiCall(endpoint);
+}
+
 // 기사 목록 불러오기
 async function loadArticles() {
     try {
@@ -165,9 +241,9 @@ function displayArticles(articles) {
 }
 
 // 통계 정보 업데이트
-async function updateStats() {
+async function updateStats(fresh = false) {
     try {
-        const data = await apiCall('/stats');
+        const data = await snapshotOrApi('stats.json', '/stats', fresh);
         totalCount.textContent = data.total_articles || 0;
 
         if (data.last_updated) {
@@ -201,8 +277,8 @@ async function checkNewArticles() {
             // 새 기사가 있으면 목록 새로고침
             if (data.new_articles && data.new_articles.length > 0) {
                 setTimeout(() => {
-                    loadPageData();
-                    updateStats();
+                    loadPageData(1, true);
+                    updateStats(true);
                 }, 2000);
             } else {
                 updateStats();
@@ -319,13 +395,13 @@ async function summarizeSingleArticle(articleUrl, articleElement) {
         }
     }
 
+    const preview = showSummaryPreview(articleElement);
+
     try {
-        const response = await apiCall(`/summarize/${encodeURIComponent(articleUrl)}`, {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-            },
+        const response = await streamSummary(articleUrl, (partialSummary) => {
+            preview.textContent = partialSummary;
         });
+        preview.remove();
 
         const articleTitle = articleElement.querySelector('.article-title')?.textContent || '';
 
@@ -346,12 +422,79 @@ async function summarizeSingleArticle(articleUrl, articleElement) {
     } catch (error) {
         console.error('Failed to summarize article:', error);
         showError('요약 생성 중 오류가 발생했습니다.');
+        preview.remove();
 
         const articleTitle = articleElement.querySelector('.article-title')?.textContent || '';
         configureSummaryButtons(articleElement, { url: articleUrl, title: articleTitle }, originalSummary);
     }
 }
 
+// 요약 스트리밍 (SSE) - 토큰이 도착하는 대로 onPartial로 부분 요약 전달, 최종 응답 반환
+async function streamSummary(articleUrl, onPartial) {
+    const response = await fetch(`${API_BASE_URL}/summarize-stream/${encodeURIComponent(articleUrl)}`, {
+        method: 'POST',
+        headers: {
+            'Accept': 'text/event-stream',
+        },
+    });
+
+    if (!response.ok || !response.body) {
+        throw new Error(`HTTP error! status: ${response.status}`);
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let rawJson = '';
+    let result = null;
+
+    while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+
+        buffer += decoder.decode(value, { stream: true });
+        const events = buffer.split('\n\n');
+        buffer = events.pop();
+
+        events.forEach(block => {
+            const eventName = block.match(/^event: (.*)$/m)?.[1];
+            const dataLine = block.match(/^data: (.*)$/m)?.[1];
+            if (!eventName || !dataLine) return;
+
+            const data = JSON.parse(dataLine);
+            if (eventName === 'delta') {
+                rawJson += data.content;
+                onPartial(extractPartialSummary(rawJson));
+            } else {
+                result = data;
+            }
+        });
+    }
+
+    if (!result) {
+        throw new Error('요약 스트림이 완료되지 않았습니다.');
+    }
+    return result;
+}
+
+// 생성 중인 JSON 문자열에서 "summary" 값의 현재까지 내용을 추출
+function extractPartialSummary(rawJson) {
+    const match = rawJson.match(/"summary"\s*:\s*"((?:[^"\\]|\\.)*)/);
+    if (!match) return '';
+    return match[1].replace(/\\n/g, '\n').replace(/\\"/g, '"').replace(/\\\\/g, '\\');
+}
+
+function showSummaryPreview(articleElement) {
+    let preview = articleElement.querySelector('.summary-preview');
+    if (!preview) {
+        preview = document.createElement('div');
+        preview.className = 'summary-preview';
+        articleElement.appendChild(preview);
+    }
+    preview.textContent = '';
+    return preview;
+}
+
 function configureSummaryButtons(articleElement, articleInfo = {}, summary) {
     if (!articleElement) return;
 